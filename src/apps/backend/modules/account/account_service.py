@@ -1,4 +1,5 @@
 from modules.account.internal.account_reader import AccountReader
+from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
     Account,
@@ -13,6 +14,7 @@ from modules.account.types import (
 )
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreateOTPParams
+from modules.hashing.errors import HashingQueueFullError
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import (
     CreateOrUpdateAccountNotificationPreferencesParams,
@@ -80,7 +82,17 @@ class AccountService:
 
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
-        return AccountReader.get_account_by_username_and_password(params=params)
+        account = AccountReader.get_account_by_username_and_password(params=params)
+
+        # The plain password is only known at login, so that is when a hash is moved to the target algorithm and cost
+        if AccountUtil.password_needs_rehash(hashed_password=account.hashed_password):
+            try:
+                account = AccountWriter.rehash_password(account=account, password=params.password)
+            except HashingQueueFullError:
+                # The login already succeeded; the rehash is retried on a later login
+                pass
+
+        return account
 
     @staticmethod
     def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
@@ -1,4 +1,4 @@
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from datetime import datetime
 
 from bson.objectid import ObjectId
@@ -24,20 +24,18 @@ from modules.authentication.errors import OTPRequestFailedError
 class AccountWriter:
     @staticmethod
     def create_account_by_username_and_password(*, params: CreateAccountByUsernameAndPasswordParams) -> Account:
-        params_dict = asdict(params)
-        params_dict["hashed_password"] = AccountUtil.hash_password(password=params.password)
-        del params_dict["password"]
         AccountReader.check_username_not_exist(params=params)
+        hashed_password = AccountUtil.hash_password(password=params.password)
         account_bson = AccountModel(
             first_name=params.first_name,
-            hashed_password=params_dict["hashed_password"],
+            hashed_password=hashed_password,
             id=None,
             last_name=params.last_name,
             phone_number=None,
             username=params.username,
         ).to_bson()
         query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson["_id"] = query.inserted_id
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
@@ -55,7 +53,7 @@ class AccountWriter:
             first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
         ).to_bson()
         query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson["_id"] = query.inserted_id
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
@@ -72,6 +70,19 @@ class AccountWriter:
 
         return AccountUtil.convert_account_bson_to_account(updated_account)
 
+    @staticmethod
+    def rehash_password(*, account: Account, password: str) -> Account:
+        hashed_password = AccountUtil.hash_password(password=password)
+        # Matching on the old hash leaves a password changed in the meantime untouched
+        update_result = AccountRepository.collection().update_one(
+            {"_id": ObjectId(account.id), "hashed_password": account.hashed_password},
+            {"$set": {"hashed_password": hashed_password}},
+        )
+        if update_result.modified_count == 0:
+            return account
+
+        return replace(account, hashed_password=hashed_password)
+
     @staticmethod
     def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
         update_fields = {}
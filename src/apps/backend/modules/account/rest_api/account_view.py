@@ -16,11 +16,13 @@ from modules.account.types import (
     UpdateAccountProfileParams,
 )
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.idempotency.rest_api.idempotency_middleware import idempotency_middleware
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 
 
 class AccountView(MethodView):
+    @idempotency_middleware
     def post(self) -> ResponseReturnValue:
         request_data = request.get_json()
         account_params: CreateAccountParams
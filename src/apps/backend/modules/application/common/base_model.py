@@ -1,9 +1,11 @@
+import base64
 from dataclasses import asdict, dataclass
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
+from bson import json_util
 from pymongo.cursor import Cursor
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.types import PaginationParams, SortDirection, SortParams
 
 
 @dataclass
@@ -30,13 +32,47 @@ class BaseModel:
 
         return pagination_params, skip, total_pages
 
+    @staticmethod
+    def get_sort_spec(sort_params: SortParams) -> List[Tuple[str, int]]:
+        return [
+            (sort_params.sort_by, sort_params.sort_direction.numeric_value),
+            ("_id", sort_params.sort_direction.numeric_value),
+        ]
+
     @staticmethod
     def apply_sort_params(cursor: Cursor, sort_params: Optional[SortParams]) -> Cursor:
         if sort_params:
-            return cursor.sort(
-                [
-                    (sort_params.sort_by, sort_params.sort_direction.numeric_value),
-                    ("_id", sort_params.sort_direction.numeric_value),
-                ]
-            )
+            return cursor.sort(BaseModel.get_sort_spec(sort_params))
         return cursor
+
+    @staticmethod
+    def encode_cursor(sort_value: Any, last_id: Any) -> str:
+        serialized_values = json_util.dumps([sort_value, last_id])
+        return base64.urlsafe_b64encode(serialized_values.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+        # binascii.Error, JSONDecodeError and UnicodeError are all ValueError subclasses
+        try:
+            values = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+        if not isinstance(values, list) or len(values) != 2:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+        return values[0], values[1]
+
+    @staticmethod
+    def build_keyset_filter(sort_params: SortParams, sort_value: Any, last_id: Any) -> dict[str, Any]:
+        # The inclusive range keeps the seek on the (sort_by, _id) index bounds; the $nor only
+        # discards the already returned documents that share sort_value, so no $or plan is needed.
+        if sort_params.sort_direction == SortDirection.ASC:
+            range_operator, tie_operator = "$gte", "$lte"
+        else:
+            range_operator, tie_operator = "$lte", "$gte"
+
+        return {
+            sort_params.sort_by: {range_operator: sort_value},
+            "$nor": [{sort_params.sort_by: sort_value, "_id": {tie_operator: last_id}}],
+        }
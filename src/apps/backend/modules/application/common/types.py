@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -38,8 +38,20 @@ class SortParams:
 class PaginationResult(Generic[T]):
     items: List[T]
     pagination_params: PaginationParams
-    total_count: int
-    total_pages: int
+    total_count: Optional[int]
+    total_pages: Optional[int]
+
+
+@dataclass(frozen=True)
+class CursorPaginationParams:
+    size: int
+    cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CursorPaginationResult(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str]
 
 
 UNSET = object()
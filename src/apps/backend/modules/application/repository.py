@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
-from pymongo import MongoClient
+from pymongo import IndexModel, MongoClient
 from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
 from pymongo.server_api import ServerApi
 
 from modules.config.config_service import ConfigService
@@ -38,6 +39,9 @@ class ApplicationRepositoryClient:
 class ApplicationRepository(ABC):
     _collection: Optional[Collection] = None
 
+    # Indexes declared by subclasses are created before the init hook runs
+    indexes: List[IndexModel] = []
+
     @property
     @abstractmethod
     def collection_name(self) -> str:
@@ -51,6 +55,8 @@ class ApplicationRepository(ABC):
             database = client.get_database()
             collection = database[cls.collection_name]
 
+            cls.create_indexes(collection)
+
             # init hook
             cls.on_init_collection(collection)
 
@@ -58,6 +64,18 @@ class ApplicationRepository(ABC):
 
         return cls._collection
 
+    @classmethod
+    def create_indexes(cls, collection: Collection) -> None:
+        # One call per index, so a conflicting definition only leaves that index unbuilt instead of the whole batch
+        for index in cls.indexes:
+            try:
+                collection.create_indexes([index])
+            except OperationFailure as e:
+                Logger.error(
+                    message=f"OperationFailure occurred while creating index {index.document['name']} "
+                    f"for {cls.collection_name}: {e.details}"
+                )
+
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         return False
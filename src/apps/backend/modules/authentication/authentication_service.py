@@ -105,3 +105,7 @@ class AuthenticationService:
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
         return OTPWriter.verify_otp(params=params)
+
+    @staticmethod
+    def backfill_otp_timestamps(*, batch_size: int) -> int:
+        return OTPWriter.backfill_timestamps(batch_size=batch_size)
@@ -1,12 +1,13 @@
 from dataclasses import asdict
+from datetime import datetime, timedelta
 
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 
 from modules.account.types import PhoneNumber
 from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
 from modules.authentication.internals.otp.otp_util import OTPUtil
 from modules.authentication.internals.otp.store.otp_model import OTPModel
-from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.otp.store.otp_repository import OTP_RETENTION_SECONDS, OTPRepository
 from modules.authentication.types import OTP, CreateOTPParams, OTPStatus, VerifyOTPParams
 
 
@@ -14,22 +15,29 @@ class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
-            )
+        OTPRepository.collection().update_many(
+            {"phone_number": phone_number_dict, "active": True},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.now()}},
+        )
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
         OTPWriter.expire_previous_otps(phone_number=params.phone_number)
         phone_number = PhoneNumber(**asdict(params)["phone_number"])
         otp_code = OTPUtil.generate_otp(length=4, phone_number=phone_number.phone_number)
+        now = datetime.now()
         otp_bson = OTPModel(
-            active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
+            active=True,
+            created_at=now,
+            expires_at=now + timedelta(seconds=OTP_RETENTION_SECONDS),
+            id=None,
+            phone_number=phone_number,
+            otp_code=otp_code,
+            status=str(OTPStatus.PENDING),
+            updated_at=now,
         ).to_bson()
         query = OTPRepository.collection().insert_one(otp_bson)
-        otp_bson = OTPRepository.collection().find_one({"_id": query.inserted_id})
+        otp_bson["_id"] = query.inserted_id
         return OTPUtil.convert_otp_bson_to_otp(otp_bson)
 
     @staticmethod
@@ -46,7 +54,42 @@ class OTPWriter:
 
         updated_otp_bson = OTPRepository.collection().find_one_and_update(
             {"_id": otp_bson["_id"]},
-            {"$set": {"active": False, "status": OTPStatus.SUCCESS}},
+            {"$set": {"active": False, "status": OTPStatus.SUCCESS, "updated_at": datetime.now()}},
             return_document=ReturnDocument.AFTER,
         )
         return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
+
+    @staticmethod
+    def backfill_timestamps(*, batch_size: int) -> int:
+        """Date OTPs stored without an expiry by their _id, so the TTL index can expire them."""
+        updated_count = 0
+        # These OTPs took created_at from a default evaluated at process start, so it cannot be trusted either
+        cursor = OTPRepository.collection().find(
+            {"expires_at": {"$exists": False}}, projection={"updated_at": 1}, batch_size=batch_size
+        )
+
+        updates: list[UpdateOne] = []
+        for otp_bson in cursor:
+            # Stored dates follow datetime.now(), so the UTC ObjectId time is converted to naive local time
+            created_at = otp_bson["_id"].generation_time.astimezone().replace(tzinfo=None)
+            updated_at = max(otp_bson.get("updated_at") or created_at, created_at)
+            updates.append(
+                UpdateOne(
+                    {"_id": otp_bson["_id"]},
+                    {
+                        "$set": {
+                            "created_at": created_at,
+                            "expires_at": created_at + timedelta(seconds=OTP_RETENTION_SECONDS),
+                            "updated_at": updated_at,
+                        }
+                    },
+                )
+            )
+            if len(updates) >= batch_size:
+                updated_count += OTPRepository.collection().bulk_write(updates, ordered=False).modified_count
+                updates = []
+
+        if updates:
+            updated_count += OTPRepository.collection().bulk_write(updates, ordered=False).modified_count
+
+        return int(updated_count)
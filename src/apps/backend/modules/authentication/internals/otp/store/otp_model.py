@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -16,8 +16,9 @@ class OTPModel(BaseModel):
     phone_number: PhoneNumber
     status: str
 
-    created_at: Optional[datetime] = datetime.now()
-    updated_at: Optional[datetime] = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    expires_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "OTPModel":
@@ -32,6 +33,7 @@ class OTPModel(BaseModel):
             phone_number=phone_number,
             status=bson_data.get("status", ""),
             created_at=bson_data.get("created_at"),
+            expires_at=bson_data.get("expires_at"),
             updated_at=bson_data.get("updated_at"),
         )
 
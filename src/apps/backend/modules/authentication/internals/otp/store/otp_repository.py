@@ -1,3 +1,4 @@
+from pymongo import IndexModel
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
@@ -23,6 +24,7 @@ OTP_VALIDATION_SCHEMA = {
             },
             "status": {"bsonType": "string", "description": "must be a string and is required"},
             "created_at": {"bsonType": "date", "description": "must be a valid date"},
+            "expires_at": {"bsonType": "date", "description": "must be a valid date"},
             "updated_at": {"bsonType": "date", "description": "must be a valid date"},
             "_id": {"bsonType": "objectId", "description": "must be an ObjectId"},
         },
@@ -30,9 +32,22 @@ OTP_VALIDATION_SCHEMA = {
 }
 
 
+# OTPs are verified within minutes of being sent; a day of history is kept for support lookups
+OTP_RETENTION_SECONDS = 24 * 60 * 60
+
+
 class OTPRepository(ApplicationRepository):
     collection_name = OTPModel.get_collection_name()
 
+    indexes = [
+        # Expiry is its own field because OTPs written before it carry the process start time in created_at
+        IndexModel("expires_at", expireAfterSeconds=0, name="expires_at_ttl_index"),
+        # Serves verify_otp, which picks the newest OTP with the given code for a phone number
+        IndexModel([("phone_number", 1), ("otp_code", 1), ("_id", -1)], name="phone_number_otp_code_id_index"),
+        # Serves expire_previous_otps, which only touches the number's active OTPs however many old ones exist
+        IndexModel([("phone_number", 1), ("active", 1), ("_id", 1)], name="phone_number_active_id_index"),
+    ]
+
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
 
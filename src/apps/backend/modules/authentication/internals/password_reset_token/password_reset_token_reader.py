@@ -1,3 +1,5 @@
+from typing import Any
+
 from bson.objectid import ObjectId
 
 from modules.account.errors import AccountBadRequestError
@@ -7,48 +9,71 @@ from modules.authentication.internals.password_reset_token.store.password_reset_
     PasswordResetTokenRepository,
 )
 from modules.authentication.types import PasswordResetToken
+from modules.config.config_service import ConfigService
 
 
 class PasswordResetTokenReader:
     @staticmethod
     def get_password_reset_token_by_account_id(account_id: str) -> PasswordResetToken:
-        cursor = (
-            PasswordResetTokenRepository.collection().find({"account": ObjectId(account_id)}).sort("expires_at", -1)
-        )
-
-        try:
-            token_data = next(cursor)
-        except StopIteration:
-            raise PasswordResetTokenNotFoundError()
+        token_data = PasswordResetTokenReader._get_latest_password_reset_token_bson(account_id)
 
         return PasswordResetToken(
             id=str(token_data.get("_id")),
             is_expired=PasswordResetTokenUtil.is_token_expired(token_data.get("expires_at")),
             account=token_data.get("account"),
-            token=token_data.get("token"),
+            token=token_data.get("token_digest") or token_data.get("token"),
             expires_at=token_data.get("expires_at"),
             is_used=token_data.get("is_used"),
         )
 
     @staticmethod
     def verify_password_reset_token(account_id: str, token: str) -> PasswordResetToken:
-        password_reset_token = PasswordResetTokenReader.get_password_reset_token_by_account_id(account_id)
+        # Only the newest token of the account is accepted, so issuing a new link cancels the older ones
+        token_data = PasswordResetTokenReader._get_latest_password_reset_token_bson(account_id)
+        password_reset_token = PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
+            token_data
+        )
+        PasswordResetTokenReader._check_password_reset_token_is_usable(account_id, password_reset_token)
 
-        if password_reset_token.is_expired:
-            raise AccountBadRequestError(
-                f"Password reset link is expired for accountId {account_id}. Please retry with new link"
-            )
-        if password_reset_token.is_used:
-            raise AccountBadRequestError(
-                f"Password reset is already used for accountId {account_id}. Please retry with new link"
+        if token_data.get("token_digest"):
+            is_token_valid = PasswordResetTokenUtil.compare_password_reset_token(
+                reset_token=token, token_digest=token_data["token_digest"]
             )
+        else:
+            # Tokens issued before digests were stored as bcrypt hashes
+            is_token_valid = ConfigService[bool].get_value(
+                key="accounts.password_reset_token_legacy_bcrypt_enabled"
+            ) and PasswordResetTokenUtil.compare_password(password=token, hashed_password=token_data.get("token", ""))
 
-        is_token_valid = PasswordResetTokenUtil.compare_password(
-            password=token, hashed_password=password_reset_token.token
-        )
         if not is_token_valid:
             raise AccountBadRequestError(
                 f"Password reset link is invalid for accountId {account_id}. Please retry with new link."
             )
 
         return password_reset_token
+
+    @staticmethod
+    def _get_latest_password_reset_token_bson(account_id: str) -> Any:
+        cursor = (
+            PasswordResetTokenRepository.collection()
+            .find({"account": ObjectId(account_id)})
+            # Tokens created within the same millisecond share expires_at; _id still puts the newest first
+            .sort([("expires_at", -1), ("_id", -1)])
+            .limit(1)
+        )
+
+        try:
+            return next(cursor)
+        except StopIteration:
+            raise PasswordResetTokenNotFoundError()
+
+    @staticmethod
+    def _check_password_reset_token_is_usable(account_id: str, password_reset_token: PasswordResetToken) -> None:
+        if password_reset_token.is_expired:
+            raise AccountBadRequestError(
+                f"Password reset link is expired for accountId {account_id}. Please retry with new link"
+            )
+        if password_reset_token.is_used:
+            raise AccountBadRequestError(
+                f"Password reset is already used for accountId {account_id}. Please retry with new link"
+            )
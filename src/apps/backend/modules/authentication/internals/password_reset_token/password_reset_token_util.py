@@ -1,26 +1,26 @@
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
 from modules.authentication.types import PasswordResetToken
 from modules.config.config_service import ConfigService
+from modules.hashing.hashing_service import HashingService
 
 
 class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return HashingService.hash_password(password=password)
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return HashingService.compare_password(password=password, hashed_password=hashed_password)
 
     @staticmethod
     def generate_password_reset_token() -> str:
@@ -28,7 +28,13 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        return bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        # Tokens carry 256 random bits, so a keyed SHA-256 is as strong as bcrypt here and can be looked up directly
+        signing_key = ConfigService[str].get_value(key="accounts.password_reset_token_signing_key")
+        return hmac.new(signing_key.encode("utf-8"), reset_token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def compare_password_reset_token(*, reset_token: str, token_digest: str) -> bool:
+        return hmac.compare_digest(PasswordResetTokenUtil.hash_password_reset_token(reset_token), token_digest)
 
     @staticmethod
     def get_token_expires_at() -> datetime:
@@ -50,5 +56,5 @@ class PasswordResetTokenUtil:
             is_used=validated_password_reset_token_data.is_used,
             is_expired=PasswordResetTokenUtil.is_token_expired(validated_password_reset_token_data.expires_at),
             expires_at=str(validated_password_reset_token_data.expires_at),
-            token=validated_password_reset_token_data.token,
+            token=validated_password_reset_token_data.token_digest or validated_password_reset_token_data.token,
         )
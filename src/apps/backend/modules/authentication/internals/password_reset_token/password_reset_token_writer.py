@@ -12,23 +12,19 @@ from modules.authentication.types import PasswordResetToken
 class PasswordResetTokenWriter:
     @staticmethod
     def create_password_reset_token(account_id: str, token: str) -> PasswordResetToken:
-        token_hash = PasswordResetTokenUtil.hash_password_reset_token(token)
+        token_digest = PasswordResetTokenUtil.hash_password_reset_token(token)
         expires_at = PasswordResetTokenUtil.get_token_expires_at()
 
         new_token_data = {
             "account": ObjectId(account_id),
             "expires_at": expires_at,
-            "token": token_hash,
+            "token_digest": token_digest,
             "is_used": False,
         }
         created_token = PasswordResetTokenRepository.collection().insert_one(new_token_data)
-        password_reset_token_bson = PasswordResetTokenRepository.collection().find_one(
-            {"_id": created_token.inserted_id}
-        )
+        new_token_data["_id"] = created_token.inserted_id
 
-        return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
-            password_reset_token_bson
-        )
+        return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(new_token_data)
 
     @staticmethod
     def set_password_reset_token_as_used(password_reset_token_id: str) -> PasswordResetToken:
@@ -13,7 +13,9 @@ class PasswordResetTokenModel(BaseModel):
     account: ObjectId | str
     expires_at: datetime
     id: Optional[ObjectId | str]
-    token: str
+    # bcrypt hash, only set on tokens created before token_digest existed
+    token: str = ""
+    token_digest: Optional[str] = None
 
     is_used: bool = False
 
@@ -25,6 +27,7 @@ class PasswordResetTokenModel(BaseModel):
             id=bson_data.get("_id"),
             is_used=bson_data.get("is_used", ""),
             token=bson_data.get("token", ""),
+            token_digest=bson_data.get("token_digest"),
         )
 
     @staticmethod
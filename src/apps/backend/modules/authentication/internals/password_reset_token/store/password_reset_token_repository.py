@@ -1,3 +1,4 @@
+from pymongo import IndexModel
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
@@ -10,21 +11,34 @@ from modules.logger.logger import Logger
 PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
     "$jsonSchema": {
         "bsonType": "object",
-        "required": ["account", "expires_at", "token", "is_used"],
+        "required": ["account", "expires_at", "is_used"],
         "properties": {
             "account": {"bsonType": "objectId", "description": "must be an ObjectId and is required"},
             "expires_at": {"bsonType": "date", "description": "must be a valid date and is required"},
             "is_used": {"bsonType": "bool", "description": "must be a boolean and is required"},
-            "token": {"bsonType": "string", "description": "must be a string and is required"},
+            "token": {"bsonType": "string", "description": "must be a string"},
+            "token_digest": {"bsonType": "string", "description": "must be a string"},
             "_id": {"bsonType": "objectId", "description": "must be an ObjectId"},
         },
     }
 }
 
 
+# Expired tokens are kept for a week so an old link still reports that it expired rather than that it is unknown
+PASSWORD_RESET_TOKEN_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+
 class PasswordResetTokenRepository(ApplicationRepository):
     collection_name = PasswordResetTokenModel.get_collection_name()
 
+    indexes = [
+        # Verification reads only the newest token of the account, so this one lookup resolves a reset link
+        IndexModel([("account", 1), ("expires_at", -1), ("_id", -1)], name="account_expires_at_id_index"),
+        IndexModel(
+            "expires_at", expireAfterSeconds=PASSWORD_RESET_TOKEN_RETENTION_SECONDS, name="expires_at_ttl_index"
+        ),
+    ]
+
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         collection.create_index("token")
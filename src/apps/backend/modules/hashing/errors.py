@@ -0,0 +1,20 @@
+from modules.application.errors import AppError
+from modules.hashing.types import HashingErrorCode
+
+
+class HashingQueueFullError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=HashingErrorCode.QUEUE_FULL,
+            http_status_code=429,
+            message="Too many password checks are in progress. Please retry shortly.",
+        )
+
+
+class HashingAlgorithmUnavailableError(AppError):
+    def __init__(self, algorithm: str) -> None:
+        super().__init__(
+            code=HashingErrorCode.ALGORITHM_UNAVAILABLE,
+            http_status_code=500,
+            message=f"Password hash algorithm {algorithm} is not available. Is the argon2-cffi package installed?",
+        )
@@ -0,0 +1,34 @@
+from modules.hashing.internal.hashing_executor import (
+    HashingExecutor,
+    compare_password_in_worker,
+    hash_password_in_worker,
+)
+from modules.hashing.internal.password_hash_calibrator import PasswordHashCalibrator
+from modules.hashing.internal.password_hash_util import PasswordHashUtil
+from modules.hashing.types import CalibratePasswordHashParams, HashingStats, PasswordHashCalibrationResult
+
+
+class HashingService:
+    @staticmethod
+    def hash_password(*, password: str) -> str:
+        settings = PasswordHashUtil.get_target_settings()
+        return HashingExecutor.get_instance().run(hash_password_in_worker, password, settings)
+
+    @staticmethod
+    def compare_password(*, password: str, hashed_password: str) -> bool:
+        return HashingExecutor.get_instance().run(compare_password_in_worker, password, hashed_password)
+
+    @staticmethod
+    def password_needs_rehash(*, hashed_password: str) -> bool:
+        """True when the hash was made with a different algorithm or cost than the configured target."""
+        return PasswordHashUtil.needs_rehash(
+            hashed_password=hashed_password, settings=PasswordHashUtil.get_target_settings()
+        )
+
+    @staticmethod
+    def get_stats() -> HashingStats:
+        return HashingExecutor.get_instance().get_stats()
+
+    @staticmethod
+    def calibrate_password_hash(*, params: CalibratePasswordHashParams) -> PasswordHashCalibrationResult:
+        return PasswordHashCalibrator.calibrate(params=params)
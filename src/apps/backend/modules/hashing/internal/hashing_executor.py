@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from modules.config.config_service import ConfigService
+from modules.hashing.errors import HashingQueueFullError
+from modules.hashing.internal.password_hash_util import PasswordHashUtil
+from modules.hashing.types import HashingStats, PasswordHashSettings
+
+T = TypeVar("T")
+
+LATENCY_WINDOW_SIZE = 1000
+
+
+# Pool workers are started with spawn, so the functions they run must be importable module level functions
+def hash_password_in_worker(password: str, settings: PasswordHashSettings) -> str:
+    return PasswordHashUtil.hash_password(password=password, settings=settings)
+
+
+def compare_password_in_worker(password: str, hashed_password: str) -> bool:
+    return PasswordHashUtil.compare_password(password=password, hashed_password=hashed_password)
+
+
+class HashingExecutor:
+    """
+    Runs password hashing in a process pool so a burst of logins cannot tie up every request thread.
+
+    At most pool_size + queue_size calls are admitted at once; any call past that is rejected straight
+    away with a 429 instead of piling up behind the pool. A pool_size of 0 runs calls inline on the
+    request thread, still bounded by the same slots.
+    """
+
+    _instance: Optional["HashingExecutor"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, *, pool_size: int, queue_size: int) -> None:
+        self.pool_size = pool_size
+        self.queue_size = queue_size
+        self._slots = threading.BoundedSemaphore(max(pool_size, 1) + queue_size)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed_count = 0
+        self._rejected_count = 0
+        self._latencies_ms: deque[float] = deque(maxlen=LATENCY_WINDOW_SIZE)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+
+    @classmethod
+    def get_instance(cls) -> "HashingExecutor":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = HashingExecutor(
+                    pool_size=ConfigService[int].get_value(key="hashing.pool_size"),
+                    queue_size=ConfigService[int].get_value(key="hashing.queue_size"),
+                )
+            return cls._instance
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected_count += 1
+            raise HashingQueueFullError()
+
+        with self._lock:
+            self._in_flight += 1
+        started_at = time.monotonic()
+
+        try:
+            if self.pool_size == 0:
+                return fn(*args)
+            return self._get_pool().submit(fn, *args).result()
+        except BrokenProcessPool:
+            # A worker died; drop the pool so the next call starts a fresh one
+            with self._lock:
+                self._pool = None
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed_count += 1
+                self._latencies_ms.append((time.monotonic() - started_at) * 1000)
+            self._slots.release()
+
+    def get_stats(self) -> HashingStats:
+        with self._lock:
+            in_flight = self._in_flight
+            completed_count = self._completed_count
+            rejected_count = self._rejected_count
+            latencies_ms = sorted(self._latencies_ms)
+
+        return HashingStats(
+            in_flight=in_flight,
+            queue_depth=max(in_flight - max(self.pool_size, 1), 0),
+            completed_count=completed_count,
+            rejected_count=rejected_count,
+            latency_p50_ms=HashingExecutor._get_percentile(latencies_ms, 0.5),
+            latency_p99_ms=HashingExecutor._get_percentile(latencies_ms, 0.99),
+            latency_max_ms=latencies_ms[-1] if latencies_ms else 0.0,
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            # A pool made before gunicorn forks its workers is unusable in the children, so each process builds its own
+            if self._pool is None or self._pool_pid != os.getpid():
+                # Spawned rather than forked, since forking a gthread worker can copy locks held by other threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.pool_size, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    @staticmethod
+    def _get_percentile(sorted_values: list[float], percentile: float) -> float:
+        if not sorted_values:
+            return 0.0
+        return sorted_values[min(int(len(sorted_values) * percentile), len(sorted_values) - 1)]
@@ -0,0 +1,57 @@
+import statistics
+import time
+from dataclasses import replace
+
+from modules.hashing.internal.password_hash_util import PasswordHashUtil
+from modules.hashing.types import (
+    CalibratePasswordHashParams,
+    PasswordHashAlgorithm,
+    PasswordHashCalibrationResult,
+    PasswordHashSettings,
+)
+
+# Calibration never goes below these, however slow the host is
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 20
+ARGON2_MIN_TIME_COST = 2
+ARGON2_MAX_TIME_COST = 20
+
+CALIBRATION_PASSWORD = "calibration-password"
+
+
+class PasswordHashCalibrator:
+    @staticmethod
+    def calibrate(*, params: CalibratePasswordHashParams) -> PasswordHashCalibrationResult:
+        """Pick the highest cost whose hash time on this host stays within the target."""
+        settings = replace(PasswordHashUtil.get_target_settings(), algorithm=params.algorithm)
+
+        if params.algorithm == PasswordHashAlgorithm.ARGON2ID:
+            candidates = [
+                replace(settings, argon2_time_cost=time_cost)
+                for time_cost in range(ARGON2_MIN_TIME_COST, ARGON2_MAX_TIME_COST + 1)
+            ]
+        else:
+            candidates = [
+                replace(settings, bcrypt_rounds=rounds) for rounds in range(BCRYPT_MIN_ROUNDS, BCRYPT_MAX_ROUNDS + 1)
+            ]
+
+        chosen = PasswordHashCalibrationResult(
+            settings=candidates[0], hash_ms=PasswordHashCalibrator._time_hash(candidates[0], params.samples)
+        )
+        for candidate in candidates[1:]:
+            # Every step costs more than the last, so the first one over the target ends the search
+            hash_ms = PasswordHashCalibrator._time_hash(candidate, params.samples)
+            if hash_ms > params.target_ms:
+                break
+            chosen = PasswordHashCalibrationResult(settings=candidate, hash_ms=hash_ms)
+
+        return chosen
+
+    @staticmethod
+    def _time_hash(settings: PasswordHashSettings, samples: int) -> float:
+        durations_ms = []
+        for _ in range(samples):
+            started_at = time.perf_counter()
+            PasswordHashUtil.hash_password(password=CALIBRATION_PASSWORD, settings=settings)
+            durations_ms.append((time.perf_counter() - started_at) * 1000)
+        return statistics.median(durations_ms)
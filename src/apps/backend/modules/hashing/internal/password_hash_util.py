@@ -0,0 +1,79 @@
+from typing import Any
+
+import bcrypt
+
+from modules.config.config_service import ConfigService
+from modules.hashing.errors import HashingAlgorithmUnavailableError
+from modules.hashing.types import PasswordHashAlgorithm, PasswordHashSettings
+
+ARGON2ID_HASH_PREFIX = "$argon2id$"
+
+
+class PasswordHashUtil:
+    @staticmethod
+    def get_target_settings() -> PasswordHashSettings:
+        return PasswordHashSettings(
+            algorithm=PasswordHashAlgorithm(ConfigService[str].get_value(key="hashing.algorithm")),
+            bcrypt_rounds=ConfigService[int].get_value(key="hashing.bcrypt_rounds"),
+            argon2_time_cost=ConfigService[int].get_value(key="hashing.argon2_time_cost"),
+            argon2_memory_cost_kib=ConfigService[int].get_value(key="hashing.argon2_memory_cost_kib"),
+            argon2_parallelism=ConfigService[int].get_value(key="hashing.argon2_parallelism"),
+        )
+
+    @staticmethod
+    def hash_password(*, password: str, settings: PasswordHashSettings) -> str:
+        if settings.algorithm == PasswordHashAlgorithm.ARGON2ID:
+            return str(PasswordHashUtil._get_argon2_hasher(settings).hash(password))
+
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode()
+
+    @staticmethod
+    def compare_password(*, password: str, hashed_password: str) -> bool:
+        # The algorithm comes from the stored hash, so accounts keep working while the target algorithm changes
+        if hashed_password.startswith(ARGON2ID_HASH_PREFIX):
+            argon2 = PasswordHashUtil._import_argon2()
+            try:
+                # The cost parameters are read from the hash itself, so a default hasher can verify any of them
+                return bool(argon2.PasswordHasher().verify(hashed_password, password))
+            except (argon2.exceptions.VerifyMismatchError, argon2.exceptions.InvalidHashError):
+                return False
+
+        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    @staticmethod
+    def needs_rehash(*, hashed_password: str, settings: PasswordHashSettings) -> bool:
+        if not hashed_password:
+            return False
+
+        if settings.algorithm == PasswordHashAlgorithm.ARGON2ID:
+            if not hashed_password.startswith(ARGON2ID_HASH_PREFIX):
+                return True
+            return bool(PasswordHashUtil._get_argon2_hasher(settings).check_needs_rehash(hashed_password))
+
+        if hashed_password.startswith(ARGON2ID_HASH_PREFIX):
+            return True
+        # bcrypt hashes look like $2b$<rounds>$<salt and hash>
+        return PasswordHashUtil.get_bcrypt_rounds(hashed_password) != settings.bcrypt_rounds
+
+    @staticmethod
+    def get_bcrypt_rounds(hashed_password: str) -> int:
+        try:
+            return int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return 0
+
+    @staticmethod
+    def _get_argon2_hasher(settings: PasswordHashSettings) -> Any:
+        return PasswordHashUtil._import_argon2().PasswordHasher(
+            time_cost=settings.argon2_time_cost,
+            memory_cost=settings.argon2_memory_cost_kib,
+            parallelism=settings.argon2_parallelism,
+        )
+
+    @staticmethod
+    def _import_argon2() -> Any:
+        try:
+            import argon2
+        except ImportError:
+            raise HashingAlgorithmUnavailableError(algorithm=PasswordHashAlgorithm.ARGON2ID)
+        return argon2
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class PasswordHashAlgorithm(StrEnum):
+    BCRYPT = "bcrypt"
+    # Needs the optional argon2-cffi package
+    ARGON2ID = "argon2id"
+
+
+@dataclass(frozen=True)
+class PasswordHashSettings:
+    algorithm: PasswordHashAlgorithm
+    bcrypt_rounds: int
+    argon2_time_cost: int
+    argon2_memory_cost_kib: int
+    argon2_parallelism: int
+
+
+@dataclass(frozen=True)
+class CalibratePasswordHashParams:
+    algorithm: PasswordHashAlgorithm
+    target_ms: float
+    samples: int = 3
+
+
+@dataclass(frozen=True)
+class PasswordHashCalibrationResult:
+    settings: PasswordHashSettings
+    # Median time of one hash at the chosen cost on this host
+    hash_ms: float
+
+
+@dataclass(frozen=True)
+class HashingStats:
+    # Calls holding a slot, whether running in the pool or waiting for a free worker
+    in_flight: int
+    queue_depth: int
+    completed_count: int
+    rejected_count: int
+    # Submit to result, so queueing time is included; computed over the most recent calls
+    latency_p50_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+
+
+@dataclass(frozen=True)
+class HashingErrorCode:
+    QUEUE_FULL: str = "HASHING_ERR_01"
+    ALGORITHM_UNAVAILABLE: str = "HASHING_ERR_02"
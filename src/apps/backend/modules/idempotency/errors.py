@@ -0,0 +1,25 @@
+from modules.application.errors import AppError
+from modules.idempotency.types import IdempotencyErrorCode
+
+
+class IdempotencyKeyInvalidError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=IdempotencyErrorCode.INVALID_KEY, http_status_code=400, message=message)
+
+
+class IdempotencyKeyReusedError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=IdempotencyErrorCode.KEY_REUSED,
+            http_status_code=422,
+            message="Idempotency key was already used for a request with a different body.",
+        )
+
+
+class IdempotencyRequestInProgressError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=IdempotencyErrorCode.REQUEST_IN_PROGRESS,
+            http_status_code=409,
+            message="A request with this idempotency key is still being processed.",
+        )
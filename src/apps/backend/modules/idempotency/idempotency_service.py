@@ -0,0 +1,24 @@
+from typing import Optional
+
+from modules.idempotency.internal.idempotency_writer import IdempotencyWriter
+from modules.idempotency.types import (
+    AcquireIdempotencyKeyParams,
+    CompleteIdempotencyKeyParams,
+    IdempotentResponse,
+    ReleaseIdempotencyKeyParams,
+)
+
+
+class IdempotencyService:
+    @staticmethod
+    def acquire_idempotency_key(*, params: AcquireIdempotencyKeyParams) -> Optional[IdempotentResponse]:
+        """Return the stored response to replay, or None when the caller now owns the key and must run the request."""
+        return IdempotencyWriter.acquire_key(params=params)
+
+    @staticmethod
+    def complete_idempotency_key(*, params: CompleteIdempotencyKeyParams) -> None:
+        IdempotencyWriter.complete_key(params=params)
+
+    @staticmethod
+    def release_idempotency_key(*, params: ReleaseIdempotencyKeyParams) -> None:
+        IdempotencyWriter.release_key(params=params)
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from modules.idempotency.internal.idempotency_util import IdempotencyUtil
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
+from modules.idempotency.types import IdempotencyRecord
+
+
+class IdempotencyReader:
+    @staticmethod
+    def get_record(*, key: str) -> Optional[IdempotencyRecord]:
+        # The TTL monitor only runs periodically, so expired records are filtered out explicitly
+        record_bson = IdempotencyRecordRepository.collection().find_one(
+            {"_id": key, "expires_at": {"$gt": datetime.now()}}
+        )
+        if record_bson is None:
+            return None
+        return IdempotencyUtil.convert_idempotency_record_bson_to_idempotency_record(record_bson)
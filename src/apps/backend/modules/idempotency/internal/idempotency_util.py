@@ -0,0 +1,17 @@
+from typing import Any
+
+from modules.idempotency.internal.store.idempotency_record_model import IdempotencyRecordModel
+from modules.idempotency.types import IdempotencyRecord, IdempotencyRecordStatus, IdempotentResponse
+
+
+class IdempotencyUtil:
+    @staticmethod
+    def convert_idempotency_record_bson_to_idempotency_record(record_bson: dict[str, Any]) -> IdempotencyRecord:
+        validated_record_data = IdempotencyRecordModel.from_bson(record_bson)
+        response_data = validated_record_data.response
+        return IdempotencyRecord(
+            key=validated_record_data.id,
+            request_hash=validated_record_data.request_hash,
+            status=IdempotencyRecordStatus(validated_record_data.status),
+            response=IdempotentResponse(**response_data) if response_data else None,
+        )
@@ -0,0 +1,92 @@
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from modules.config.config_service import ConfigService
+from modules.idempotency.errors import IdempotencyKeyReusedError, IdempotencyRequestInProgressError
+from modules.idempotency.internal.idempotency_reader import IdempotencyReader
+from modules.idempotency.internal.store.idempotency_record_model import IdempotencyRecordModel
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
+from modules.idempotency.types import (
+    AcquireIdempotencyKeyParams,
+    CompleteIdempotencyKeyParams,
+    IdempotencyRecordStatus,
+    IdempotentResponse,
+    ReleaseIdempotencyKeyParams,
+)
+
+
+class IdempotencyWriter:
+    @staticmethod
+    def acquire_key(*, params: AcquireIdempotencyKeyParams) -> Optional[IdempotentResponse]:
+        wait_seconds = ConfigService[float].get_value(key="idempotency.wait_seconds")
+        poll_interval_seconds = ConfigService[float].get_value(key="idempotency.poll_interval_seconds")
+        deadline = time.monotonic() + wait_seconds
+
+        # Concurrent duplicates poll until the first request stores its response instead of executing again
+        while True:
+            if IdempotencyWriter._claim_key(params=params):
+                return None
+
+            record = IdempotencyReader.get_record(key=params.key)
+            if record is not None:
+                if record.request_hash != params.request_hash:
+                    raise IdempotencyKeyReusedError()
+                if record.status == IdempotencyRecordStatus.COMPLETED and record.response is not None:
+                    return record.response
+
+            if time.monotonic() >= deadline:
+                raise IdempotencyRequestInProgressError()
+            time.sleep(poll_interval_seconds)
+
+    @staticmethod
+    def complete_key(*, params: CompleteIdempotencyKeyParams) -> None:
+        IdempotencyRecordRepository.collection().update_one(
+            {"_id": params.key, "status": IdempotencyRecordStatus.PENDING},
+            {"$set": {"status": IdempotencyRecordStatus.COMPLETED, "response": asdict(params.response)}},
+        )
+
+    @staticmethod
+    def release_key(*, params: ReleaseIdempotencyKeyParams) -> None:
+        # Failed requests give the key back so a retry can execute them again
+        IdempotencyRecordRepository.collection().delete_one(
+            {"_id": params.key, "status": IdempotencyRecordStatus.PENDING}
+        )
+
+    @staticmethod
+    def _claim_key(*, params: AcquireIdempotencyKeyParams) -> bool:
+        now = datetime.now()
+        record_bson = IdempotencyRecordModel(
+            created_at=now,
+            expires_at=now + timedelta(seconds=ConfigService[int].get_value(key="idempotency.ttl_seconds")),
+            id=params.key,
+            locked_until=now + timedelta(seconds=ConfigService[int].get_value(key="idempotency.lock_seconds")),
+            request_hash=params.request_hash,
+            status=IdempotencyRecordStatus.PENDING,
+        ).to_bson()
+
+        try:
+            IdempotencyRecordRepository.collection().insert_one(record_bson)
+            return True
+        except DuplicateKeyError:
+            pass
+
+        # Take over records the TTL monitor has not removed yet, and claims whose owner died mid-request
+        takeover_result = IdempotencyRecordRepository.collection().replace_one(
+            {
+                "_id": params.key,
+                "$or": [
+                    {"expires_at": {"$lte": now}},
+                    {
+                        "status": IdempotencyRecordStatus.PENDING,
+                        "request_hash": params.request_hash,
+                        "locked_until": {"$lte": now},
+                    },
+                ],
+            },
+            record_bson,
+        )
+        return bool(takeover_result.modified_count == 1)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from modules.application.base_model import BaseModel
+from modules.idempotency.types import IdempotencyRecordStatus
+
+
+@dataclass
+class IdempotencyRecordModel(BaseModel):
+    # The id is the scoped idempotency key, so the unique _id index arbitrates concurrent claims
+    id: str
+    expires_at: datetime
+    locked_until: datetime
+    request_hash: str
+    status: str
+    created_at: Optional[datetime] = None
+    response: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "IdempotencyRecordModel":
+        return cls(
+            created_at=bson_data.get("created_at"),
+            expires_at=bson_data["expires_at"],
+            id=bson_data["_id"],
+            locked_until=bson_data["locked_until"],
+            request_hash=bson_data.get("request_hash", ""),
+            response=bson_data.get("response"),
+            status=bson_data.get("status", IdempotencyRecordStatus.PENDING),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "idempotency_records"
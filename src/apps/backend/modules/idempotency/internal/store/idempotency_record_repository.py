@@ -0,0 +1,10 @@
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository
+from modules.idempotency.internal.store.idempotency_record_model import IdempotencyRecordModel
+
+
+class IdempotencyRecordRepository(ApplicationRepository):
+    collection_name = IdempotencyRecordModel.get_collection_name()
+
+    indexes = [IndexModel("expires_at", expireAfterSeconds=0, name="expires_at_ttl_index")]
@@ -0,0 +1,91 @@
+import hashlib
+import json
+from functools import wraps
+from typing import Any, Callable
+
+from flask import Response, make_response, request
+
+from modules.idempotency.errors import IdempotencyKeyInvalidError
+from modules.idempotency.idempotency_service import IdempotencyService
+from modules.idempotency.types import (
+    AcquireIdempotencyKeyParams,
+    CompleteIdempotencyKeyParams,
+    IdempotentResponse,
+    ReleaseIdempotencyKeyParams,
+)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+REPLAYED_RESPONSE_HEADERS = ["Content-Type", "ETag", "Location"]
+# Stored responses outlive the request, so secrets that a view happens to return are left out of the replay
+REDACTED_RESPONSE_FIELDS = ["hashed_password"]
+
+
+def idempotency_middleware(next_func: Callable) -> Callable:
+    @wraps(next_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if idempotency_key is None:
+            return next_func(*args, **kwargs)
+
+        if not idempotency_key or len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise IdempotencyKeyInvalidError(
+                f"{IDEMPOTENCY_KEY_HEADER} must be between 1 and {IDEMPOTENCY_KEY_MAX_LENGTH} characters."
+            )
+
+        # Keys are scoped to the route, whose path already carries the account for account owned resources
+        key = hashlib.sha256(f"{request.method}:{request.path}:{idempotency_key}".encode("utf-8")).hexdigest()
+        request_hash = hashlib.sha256(request.get_data()).hexdigest()
+
+        stored_response = IdempotencyService.acquire_idempotency_key(
+            params=AcquireIdempotencyKeyParams(key=key, request_hash=request_hash)
+        )
+        if stored_response is not None:
+            replayed_response = make_response(
+                stored_response.body, stored_response.status_code, stored_response.headers
+            )
+            replayed_response.headers["Idempotent-Replayed"] = "true"
+            return replayed_response
+
+        try:
+            response = make_response(next_func(*args, **kwargs))
+        except Exception:
+            IdempotencyService.release_idempotency_key(params=ReleaseIdempotencyKeyParams(key=key))
+            raise
+
+        if response.status_code >= 500 or response.is_streamed:
+            IdempotencyService.release_idempotency_key(params=ReleaseIdempotencyKeyParams(key=key))
+            return response
+
+        IdempotencyService.complete_idempotency_key(
+            params=CompleteIdempotencyKeyParams(
+                key=key,
+                response=IdempotentResponse(
+                    status_code=response.status_code,
+                    body=_get_redacted_response_body(response),
+                    headers={
+                        header: response.headers[header]
+                        for header in REPLAYED_RESPONSE_HEADERS
+                        if header in response.headers
+                    },
+                ),
+            )
+        )
+        return response
+
+    return wrapper
+
+
+def _get_redacted_response_body(response: Response) -> str:
+    if not response.is_json:
+        return response.get_data(as_text=True)
+
+    return json.dumps(_redact(response.get_json()))
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _redact(item) for key, item in value.items() if key not in REDACTED_RESPONSE_FIELDS}
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Optional
+
+
+class IdempotencyRecordStatus(StrEnum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+
+@dataclass(frozen=True)
+class IdempotentResponse:
+    status_code: int
+    body: str
+    headers: dict[str, str]
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    key: str
+    request_hash: str
+    status: IdempotencyRecordStatus
+    # Only set once the original request has completed
+    response: Optional[IdempotentResponse] = None
+
+
+@dataclass(frozen=True)
+class AcquireIdempotencyKeyParams:
+    key: str
+    request_hash: str
+
+
+@dataclass(frozen=True)
+class CompleteIdempotencyKeyParams:
+    key: str
+    response: IdempotentResponse
+
+
+@dataclass(frozen=True)
+class ReleaseIdempotencyKeyParams:
+    key: str
+
+
+@dataclass(frozen=True)
+class IdempotencyErrorCode:
+    INVALID_KEY: str = "IDEMPOTENCY_ERR_01"
+    KEY_REUSED: str = "IDEMPOTENCY_ERR_02"
+    REQUEST_IN_PROGRESS: str = "IDEMPOTENCY_ERR_03"
@@ -31,10 +31,10 @@ class AccountNotificationPreferenceWriter:
         ).to_bson()
 
         query = AccountNotificationPreferencesRepository.collection().insert_one(preferences_model)
-        created_preferences = AccountNotificationPreferencesRepository.collection().find_one({"_id": query.inserted_id})
+        preferences_model["_id"] = query.inserted_id
 
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
-            created_preferences
+            preferences_model
         )
 
     @staticmethod
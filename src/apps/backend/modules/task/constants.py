@@ -0,0 +1,29 @@
+from typing import List
+
+from modules.task.types import TaskField
+
+# The fields=summary preset; without fields the list returns full tasks so existing clients keep their keys
+TASK_SUMMARY_FIELDS = [TaskField.ID, TaskField.ACCOUNT_ID, TaskField.TITLE]
+
+TASK_FIELD_PRESETS: dict[str, List[TaskField]] = {"all": list(TaskField), "summary": TASK_SUMMARY_FIELDS}
+
+# Fields the task list can be sorted and filtered by; each one is backed by an (account_id, active, field, _id) index
+TASK_SORT_FIELDS = ["created_at", "updated_at", "title", "rank"]
+
+# Tag filters are served by the (account_id, active, tags, updated_at, _id) index, so they always sort by updated_at
+TASK_TAGS_SORT_FIELD = "updated_at"
+TASK_TAG_MAX_LENGTH = 50
+TASK_TAGS_MAX_PER_TASK = 20
+TASK_TAGS_FILTER_MAX = 10
+
+TASK_COMMENT_MAX_LENGTH = 5000
+TASK_COMMENTS_MAX_SIZE = 100
+
+TASK_SEARCH_QUERY_MAX_LENGTH = 256
+# Text score ordering is an in-memory sort, so the number of scored documents returned per page is bounded
+TASK_SEARCH_MAX_SIZE = 100
+
+TASK_AUTOCOMPLETE_MAX_SIZE = 20
+
+TASK_CHANGES_DEFAULT_SIZE = 100
+TASK_CHANGES_MAX_SIZE = 1000
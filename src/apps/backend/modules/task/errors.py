@@ -12,3 +12,39 @@ class TaskNotFoundError(AppError):
 class TaskBadRequestError(AppError):
     def __init__(self, message: str) -> None:
         super().__init__(code=TaskErrorCode.BAD_REQUEST, http_status_code=400, message=message)
+
+
+class TaskCommentNotFoundError(AppError):
+    def __init__(self, comment_id: str) -> None:
+        super().__init__(
+            code=TaskErrorCode.COMMENT_NOT_FOUND,
+            http_status_code=404,
+            message=f"Comment with id {comment_id} not found.",
+        )
+
+
+class TaskPreconditionFailedError(AppError):
+    def __init__(self, task_id: str) -> None:
+        super().__init__(
+            code=TaskErrorCode.PRECONDITION_FAILED,
+            http_status_code=412,
+            message=f"Task with id {task_id} was modified by another request.",
+        )
+
+
+class TaskEventsUnavailableError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=TaskErrorCode.EVENTS_UNAVAILABLE,
+            http_status_code=503,
+            message="Too many task event streams are open. Please retry later.",
+        )
+
+
+class TaskEventsUnsupportedError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=TaskErrorCode.EVENTS_UNSUPPORTED,
+            http_status_code=501,
+            message="Task events need MongoDB change streams, which require a replica set or sharded cluster.",
+        )
@@ -0,0 +1,10 @@
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository
+
+
+class TaskCacheEntryRepository(ApplicationRepository):
+    collection_name = "task_cache_entries"
+
+    # Generation documents have no expires_at, so the TTL monitor only removes cached values
+    indexes = [IndexModel("expires_at", expireAfterSeconds=0, name="expires_at_ttl_index")]
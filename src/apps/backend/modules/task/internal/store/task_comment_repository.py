@@ -0,0 +1,45 @@
+from pymongo import IndexModel
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_comment_model import TaskCommentModel
+
+TASK_COMMENT_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account_id", "content", "task_id", "created_at", "updated_at"],
+        "properties": {
+            "account_id": {"bsonType": "string"},
+            "content": {"bsonType": "string"},
+            "task_id": {"bsonType": "string"},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+        },
+    }
+}
+
+
+class TaskCommentRepository(ApplicationRepository):
+    collection_name = TaskCommentModel.get_collection_name()
+
+    # Serves the oldest-first comment pages of a task, including the keyset seek on (created_at, _id)
+    indexes = [IndexModel([("task_id", 1), ("created_at", 1), ("_id", 1)], name="task_id_created_at_id_index")]
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": TASK_COMMENT_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:
+                collection.database.create_collection(cls.collection_name, validator=TASK_COMMENT_VALIDATION_SCHEMA)
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection task_comments: {e.details}")
+        return True
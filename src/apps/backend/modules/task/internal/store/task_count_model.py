@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskCountModel(BaseModel):
+    account_id: str
+    active_task_count: int
+    created_at: Optional[datetime] = datetime.now()
+    id: Optional[ObjectId | str] = None
+    updated_at: Optional[datetime] = datetime.now()
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskCountModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            active_task_count=bson_data.get("active_task_count", 0),
+            created_at=bson_data.get("created_at"),
+            id=bson_data.get("_id"),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_counts"
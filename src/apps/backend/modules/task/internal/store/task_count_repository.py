@@ -0,0 +1,43 @@
+from pymongo import IndexModel
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_count_model import TaskCountModel
+
+TASK_COUNT_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account_id", "active_task_count", "created_at", "updated_at"],
+        "properties": {
+            "account_id": {"bsonType": "string"},
+            "active_task_count": {"bsonType": ["int", "long"]},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+        },
+    }
+}
+
+
+class TaskCountRepository(ApplicationRepository):
+    collection_name = TaskCountModel.get_collection_name()
+
+    indexes = [IndexModel("account_id", unique=True, name="account_id_unique_index")]
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": TASK_COUNT_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:
+                collection.database.create_collection(cls.collection_name, validator=TASK_COUNT_VALIDATION_SCHEMA)
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection task_counts: {e.details}")
+        return True
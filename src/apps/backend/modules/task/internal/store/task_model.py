@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from bson import ObjectId
 
@@ -13,20 +13,31 @@ class TaskModel(BaseModel):
     description: str
     title: str
     active: bool = True
+    comment_count: int = 0
     created_at: Optional[datetime] = datetime.now()
     id: Optional[ObjectId | str] = None
+    rank: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    title_prefixes: List[str] = field(default_factory=list)
     updated_at: Optional[datetime] = datetime.now()
+    version: int = 1
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "TaskModel":
         return cls(
             account_id=bson_data.get("account_id", ""),
             active=bson_data.get("active", True),
+            comment_count=bson_data.get("comment_count", 0),
             created_at=bson_data.get("created_at"),
             description=bson_data.get("description", ""),
             id=bson_data.get("_id"),
+            rank=bson_data.get("rank"),
+            tags=bson_data.get("tags", []),
             title=bson_data.get("title", ""),
+            title_prefixes=bson_data.get("title_prefixes", []),
             updated_at=bson_data.get("updated_at"),
+            # Tasks written before versioning start at 0 so their first update still changes the version
+            version=bson_data.get("version", 0),
         )
 
     @staticmethod
@@ -1,7 +1,9 @@
+from pymongo import IndexModel
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
 from modules.application.repository import ApplicationRepository
+from modules.task.constants import TASK_SORT_FIELDS, TASK_TAGS_SORT_FIELD
 from modules.task.internal.store.task_model import TaskModel
 from modules.logger.logger import Logger
 
@@ -13,9 +15,15 @@ TASK_VALIDATION_SCHEMA = {
             "account_id": {"bsonType": "string"},
             "description": {"bsonType": "string"},
             "title": {"bsonType": "string"},
+            "rank": {"bsonType": "string"},
+            "tags": {"bsonType": "array", "items": {"bsonType": "string"}},
+            "title_prefixes": {"bsonType": "array", "items": {"bsonType": "string"}},
             "active": {"bsonType": "bool"},
+            "batch_write_id": {"bsonType": "objectId"},
+            "comment_count": {"bsonType": ["int", "long"]},
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
+            "version": {"bsonType": ["int", "long"]},
         },
     }
 }
@@ -24,12 +32,38 @@ TASK_VALIDATION_SCHEMA = {
 class TaskRepository(ApplicationRepository):
     collection_name = TaskModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index(
+    indexes = [
+        IndexModel(
             [("active", 1), ("account_id", 1)], name="active_account_id_index", partialFilterExpression={"active": True}
-        )
+        ),
+        *[
+            IndexModel(
+                [("account_id", 1), ("active", 1), (sort_field, -1), ("_id", -1)],
+                name=f"account_id_active_{sort_field}_id_index",
+            )
+            for sort_field in TASK_SORT_FIELDS
+        ],
+        # Serves the changes feed, which includes soft-deleted tasks and so has no active prefix
+        IndexModel([("account_id", 1), ("updated_at", 1), ("_id", 1)], name="account_id_updated_at_id_index"),
+        IndexModel(
+            [("account_id", 1), ("active", 1), ("title_prefixes", 1), ("updated_at", -1)],
+            name="account_id_active_title_prefixes_updated_at_index",
+        ),
+        # Multikey on tags; a tag filter sorts by updated_at so the index serves both the match and the order
+        IndexModel(
+            [("account_id", 1), ("active", 1), ("tags", 1), (TASK_TAGS_SORT_FIELD, -1), ("_id", -1)],
+            name=f"account_id_active_tags_{TASK_TAGS_SORT_FIELD}_id_index",
+        ),
+        # The equality prefix lets $text searches stay inside one account's active tasks
+        IndexModel(
+            [("account_id", 1), ("active", 1), ("title", "text"), ("description", "text")],
+            name="account_id_active_title_description_text_index",
+            weights={"title": 3, "description": 1},
+        ),
+    ]
 
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": TASK_VALIDATION_SCHEMA,
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskTagCountModel(BaseModel):
+    account_id: str
+    count: int
+    tag: str
+    created_at: Optional[datetime] = datetime.now()
+    id: Optional[ObjectId | str] = None
+    updated_at: Optional[datetime] = datetime.now()
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskTagCountModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            count=bson_data.get("count", 0),
+            created_at=bson_data.get("created_at"),
+            id=bson_data.get("_id"),
+            tag=bson_data.get("tag", ""),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_tag_counts"
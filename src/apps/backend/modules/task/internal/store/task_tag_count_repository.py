@@ -0,0 +1,13 @@
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_tag_count_model import TaskTagCountModel
+
+
+class TaskTagCountRepository(ApplicationRepository):
+    collection_name = TaskTagCountModel.get_collection_name()
+
+    indexes = [
+        IndexModel([("account_id", 1), ("tag", 1)], unique=True, name="account_id_tag_unique_index"),
+        IndexModel([("account_id", 1), ("count", -1), ("tag", 1)], name="account_id_count_tag_index"),
+    ]
@@ -0,0 +1,254 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, TypeVar
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_cache_entry_repository import TaskCacheEntryRepository
+from modules.task.types import TaskCacheBackendType, TaskCacheStats
+
+T = TypeVar("T")
+
+
+class TaskCacheBackend(ABC):
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Lookups run on every gunicorn worker thread, and a bare += can drop updates between threads
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, account_id: str, key: str) -> tuple[Optional[dict[str, Any]], int]:
+        """Returns the cached value if it belongs to the current account generation, together with that generation."""
+
+    @abstractmethod
+    def set(self, account_id: str, key: str, generation: int, value: dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def bump_generation(self, account_id: str) -> None:
+        pass
+
+    def get_stats(self) -> TaskCacheStats:
+        with self._stats_lock:
+            return TaskCacheStats(hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+    def _count(self, *, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+
+class InMemoryTaskCacheBackend(TaskCacheBackend):
+    """Process local LRU cache, only coherent when the app runs a single worker process."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: int) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, int, dict[str, Any]]] = OrderedDict()
+        # Generations are only kept while an entry written before the bump could still be alive, and are bounded by
+        # the same LRU limit as the entries. Accounts without a generation fall back to the floor, which is raised
+        # whenever a generation is evicted early so that no stale entry of that account becomes reachable again.
+        self._generations: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._generation_floor = 0
+        self._last_generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, account_id: str, key: str) -> tuple[Optional[dict[str, Any]], int]:
+        cache_key = f"{account_id}:{key}"
+        with self._lock:
+            generation = self._get_generation(account_id)
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._count(misses=1)
+                return None, generation
+
+            expires_at, entry_generation, value = entry
+            if expires_at <= time.monotonic() or entry_generation != generation:
+                del self._entries[cache_key]
+                self._count(misses=1, evictions=1)
+                return None, generation
+
+            self._entries.move_to_end(cache_key)
+            self._count(hits=1)
+            return value, generation
+
+    def set(self, account_id: str, key: str, generation: int, value: dict[str, Any]) -> None:
+        cache_key = f"{account_id}:{key}"
+        with self._lock:
+            # A load that started before an invalidation must not overwrite the cache with what it read
+            if generation != self._get_generation(account_id):
+                return
+
+            self._entries[cache_key] = (time.monotonic() + self.ttl_seconds, generation, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._count(evictions=1)
+
+    def bump_generation(self, account_id: str) -> None:
+        with self._lock:
+            self._last_generation += 1
+            self._generations[account_id] = (time.monotonic() + self.ttl_seconds, self._last_generation)
+            self._generations.move_to_end(account_id)
+            self._evict_generations()
+
+    def get_generation_count(self) -> int:
+        with self._lock:
+            self._evict_generations()
+            return len(self._generations)
+
+    def _get_generation(self, account_id: str) -> int:
+        self._evict_generations()
+        record = self._generations.get(account_id)
+        return record[1] if record else self._generation_floor
+
+    def _evict_generations(self) -> None:
+        # Generations are ordered by bump time and share one TTL, so expired ones are always at the front. Once
+        # expired, every entry written before that bump has expired too, so the account can return to the floor.
+        now = time.monotonic()
+        while self._generations:
+            expires_at, generation = next(iter(self._generations.values()))
+            if expires_at > now and len(self._generations) <= self.max_entries:
+                break
+
+            self._generations.popitem(last=False)
+            if expires_at > now:
+                self._generation_floor = max(self._generation_floor, generation)
+
+
+class MongoTaskCacheBackend(TaskCacheBackend):
+    """Shared cache stored in a TTL collection, so every gunicorn worker sees the same entries and generations."""
+
+    def __init__(self, *, ttl_seconds: int) -> None:
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, account_id: str, key: str) -> tuple[Optional[dict[str, Any]], int]:
+        # The generation and the entry are fetched in one round trip, and the entry only counts when its generation
+        # still matches, so an invalidation makes every older entry of the account unreachable at once
+        generation_id = f"generation:{account_id}"
+        entry_id = f"{account_id}:{key}"
+        documents = {
+            document["_id"]: document
+            for document in TaskCacheEntryRepository.collection().find({"_id": {"$in": [generation_id, entry_id]}})
+        }
+        generation = int(documents[generation_id]["generation"]) if generation_id in documents else 0
+
+        entry_bson = documents.get(entry_id)
+        if entry_bson is None or entry_bson.get("generation", 0) != generation:
+            self._count(misses=1)
+            return None, generation
+
+        # The TTL monitor only runs periodically, so expired entries can still be returned by the server
+        if entry_bson["expires_at"] <= datetime.now():
+            self._count(misses=1, evictions=1)
+            return None, generation
+
+        self._count(hits=1)
+        value: dict[str, Any] = entry_bson["value"]
+        return value, generation
+
+    def set(self, account_id: str, key: str, generation: int, value: dict[str, Any]) -> None:
+        TaskCacheEntryRepository.collection().replace_one(
+            {"_id": f"{account_id}:{key}"},
+            {
+                "generation": generation,
+                "value": value,
+                "expires_at": datetime.now() + timedelta(seconds=self.ttl_seconds),
+            },
+            upsert=True,
+        )
+
+    def bump_generation(self, account_id: str) -> None:
+        TaskCacheEntryRepository.collection().update_one(
+            {"_id": f"generation:{account_id}"}, {"$inc": {"generation": 1}}, upsert=True
+        )
+
+
+class TaskCache:
+    _backend: Optional[TaskCacheBackend] = None
+    _initialized = False
+    _stats_log_interval_seconds = 0
+    _stats_logged_at = 0.0
+
+    @classmethod
+    def get_backend(cls) -> Optional[TaskCacheBackend]:
+        if not cls._initialized:
+            cls._backend = cls._create_backend()
+            cls._stats_log_interval_seconds = ConfigService[int].get_value(key="tasks.cache.stats_log_interval_seconds")
+            cls._stats_logged_at = time.monotonic()
+            cls._initialized = True
+
+        return cls._backend
+
+    @classmethod
+    def get_or_load(
+        cls,
+        *,
+        account_id: str,
+        key: str,
+        load: Callable[[], T],
+        serialize: Callable[[T], dict[str, Any]],
+        deserialize: Callable[[dict[str, Any]], T],
+    ) -> T:
+        backend = cls.get_backend()
+        if backend is None:
+            return load()
+
+        cached_value, generation = backend.get(account_id, key)
+        cls._log_stats_if_due(backend)
+        if cached_value is not None:
+            return deserialize(cached_value)
+
+        value = load()
+        backend.set(account_id, key, generation, serialize(value))
+        return value
+
+    @classmethod
+    def invalidate_account(cls, *, account_id: str) -> None:
+        backend = cls.get_backend()
+        if backend is not None:
+            backend.bump_generation(account_id)
+
+    @classmethod
+    def get_stats(cls) -> TaskCacheStats:
+        backend = cls.get_backend()
+        if backend is None:
+            return TaskCacheStats(hits=0, misses=0, evictions=0)
+        return backend.get_stats()
+
+    @classmethod
+    def _log_stats_if_due(cls, backend: TaskCacheBackend) -> None:
+        # The counters are per process, so every worker logs its own and the totals are summed from the logs
+        now = time.monotonic()
+        if cls._stats_log_interval_seconds <= 0 or now - cls._stats_logged_at < cls._stats_log_interval_seconds:
+            return
+
+        cls._stats_logged_at = now
+        stats = backend.get_stats()
+        Logger.info(
+            message=f"Task cache stats (pid {os.getpid()}): {stats.hits} hits, {stats.misses} misses, "
+            f"{stats.evictions} evictions"
+        )
+
+    @staticmethod
+    def _create_backend() -> Optional[TaskCacheBackend]:
+        if not ConfigService[bool].get_value(key="tasks.cache.enabled"):
+            return None
+
+        ttl_seconds = ConfigService[int].get_value(key="tasks.cache.ttl_seconds")
+        backend_type = ConfigService[str].get_value(key="tasks.cache.backend")
+        if backend_type == TaskCacheBackendType.MONGO:
+            return MongoTaskCacheBackend(ttl_seconds=ttl_seconds)
+
+        return InMemoryTaskCacheBackend(
+            max_entries=ConfigService[int].get_value(key="tasks.cache.max_entries"), ttl_seconds=ttl_seconds
+        )
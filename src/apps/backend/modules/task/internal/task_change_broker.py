@@ -0,0 +1,143 @@
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from modules.logger.logger import Logger
+from modules.task.errors import TaskEventsUnavailableError, TaskEventsUnsupportedError
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import TaskChangeEvent, TaskChangeEventType
+
+WATCH_RETRY_DELAY_SECONDS = 5
+
+# Only the fields a subscriber needs are shipped from the server; _id is the resume token and must stay
+TASK_CHANGE_STREAM_PIPELINE: list[dict[str, Any]] = [
+    {"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}},
+    {
+        "$project": {
+            "operationType": 1,
+            "fullDocument._id": 1,
+            "fullDocument.account_id": 1,
+            "fullDocument.active": 1,
+            "fullDocument.comment_count": 1,
+            "fullDocument.description": 1,
+            "fullDocument.rank": 1,
+            "fullDocument.tags": 1,
+            "fullDocument.title": 1,
+            "fullDocument.updated_at": 1,
+            "fullDocument.version": 1,
+        }
+    },
+]
+
+
+class TaskChangeSubscription:
+    def __init__(self, *, account_id: str, queue_size: int) -> None:
+        self.account_id = account_id
+        self.events: queue.Queue[TaskChangeEvent] = queue.Queue(maxsize=queue_size)
+        # Set when the client fell behind and events were dropped; it must resync before trusting the stream
+        self.overflowed = False
+
+    def get(self, *, timeout: float) -> Optional[TaskChangeEvent]:
+        if self.overflowed:
+            return TaskChangeEvent(type=TaskChangeEventType.RESYNC, account_id=self.account_id)
+
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class TaskChangeBroker:
+    """Fans one change stream per process out to in-memory subscriber queues, keyed by account."""
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[str, set[TaskChangeSubscription]] = {}
+        self._subscription_count = 0
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._change_streams_supported: Optional[bool] = None
+
+    def ensure_watching(self) -> None:
+        with self._lock:
+            # Checked once per process; a standalone server would otherwise fail every watch attempt forever
+            if self._change_streams_supported is None:
+                self._change_streams_supported = self._supports_change_streams()
+                if not self._change_streams_supported:
+                    Logger.error(message="Task change streams need a replica set, task events are disabled")
+            if not self._change_streams_supported:
+                raise TaskEventsUnsupportedError()
+
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name="task-change-stream", daemon=True)
+                self._watcher.start()
+
+    def subscribe(self, *, account_id: str, queue_size: int, max_subscriptions: int) -> TaskChangeSubscription:
+        subscription = TaskChangeSubscription(account_id=account_id, queue_size=queue_size)
+        with self._lock:
+            # Every subscriber holds a worker thread for as long as it is connected
+            if self._subscription_count >= max_subscriptions:
+                raise TaskEventsUnavailableError()
+            self._subscriptions.setdefault(account_id, set()).add(subscription)
+            self._subscription_count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: TaskChangeSubscription) -> None:
+        with self._lock:
+            account_subscriptions = self._subscriptions.get(subscription.account_id, set())
+            if subscription in account_subscriptions:
+                account_subscriptions.discard(subscription)
+                self._subscription_count -= 1
+            if not account_subscriptions:
+                self._subscriptions.pop(subscription.account_id, None)
+
+    def publish(self, event: TaskChangeEvent) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.account_id, ()))
+
+        for subscription in subscriptions:
+            # A slow client must never block the watcher thread or the other subscribers
+            try:
+                subscription.events.put_nowait(event)
+            except queue.Full:
+                subscription.overflowed = True
+
+    def _watch(self) -> None:
+        resume_token = None
+        while True:
+            try:
+                with TaskRepository.collection().watch(
+                    TASK_CHANGE_STREAM_PIPELINE, full_document="updateLookup", resume_after=resume_token
+                ) as stream:
+                    for change in stream:
+                        resume_token = stream.resume_token
+                        event = TaskUtil.convert_change_to_task_change_event(change)
+                        if event is not None:
+                            self.publish(event)
+            except OperationFailure as e:
+                # The server refused to resume (e.g. the oplog rolled past the token), so events were lost
+                Logger.error(message=f"Task change stream cannot resume, restarting from now: {e.details}")
+                resume_token = None
+                self._request_resync()
+                time.sleep(WATCH_RETRY_DELAY_SECONDS)
+            except PyMongoError as e:
+                Logger.error(message=f"Task change stream failed, retrying in {WATCH_RETRY_DELAY_SECONDS}s: {e}")
+                time.sleep(WATCH_RETRY_DELAY_SECONDS)
+
+    @staticmethod
+    def _supports_change_streams() -> bool:
+        # Change streams read the oplog, which only replica set members and mongos routers expose
+        hello = TaskRepository.collection().database.command("hello")
+        return "setName" in hello or hello.get("msg") == "isdbgrid"
+
+    def _request_resync(self) -> None:
+        with self._lock:
+            for account_subscriptions in self._subscriptions.values():
+                for subscription in account_subscriptions:
+                    subscription.overflowed = True
+
+
+TASK_CHANGE_BROKER = TaskChangeBroker()
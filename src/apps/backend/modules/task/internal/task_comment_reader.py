@@ -0,0 +1,44 @@
+from typing import Any
+
+from bson.objectid import ObjectId
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.types import CursorPaginationResult, SortDirection, SortParams
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
+from modules.task.internal.store.task_comment_repository import TaskCommentRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_comment_util import TaskCommentUtil
+from modules.task.types import GetTaskCommentsParams, TaskComment
+
+TASK_COMMENT_SORT_PARAMS = SortParams(sort_by="created_at", sort_direction=SortDirection.ASC)
+
+
+class TaskCommentReader:
+    @staticmethod
+    def get_task_comments(*, params: GetTaskCommentsParams) -> CursorPaginationResult[TaskComment]:
+        if not TaskRepository.collection().find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True}, projection={"_id": 1}
+        ):
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        size = params.pagination_params.size
+        filter_query: dict[str, Any] = {"task_id": params.task_id, "account_id": params.account_id}
+        if params.pagination_params.cursor:
+            try:
+                created_at, last_id = BaseModel.decode_cursor(params.pagination_params.cursor)
+            except ValueError:
+                raise TaskBadRequestError("Cursor is invalid")
+            filter_query = {
+                "$and": [filter_query, BaseModel.build_keyset_filter(TASK_COMMENT_SORT_PARAMS, created_at, last_id)]
+            }
+
+        cursor = TaskCommentRepository.collection().find(filter_query)
+        comments_bson = list(BaseModel.apply_sort_params(cursor, TASK_COMMENT_SORT_PARAMS).limit(size + 1))
+
+        next_cursor = None
+        if len(comments_bson) > size:
+            comments_bson = comments_bson[:size]
+            next_cursor = BaseModel.encode_cursor(comments_bson[-1]["created_at"], comments_bson[-1]["_id"])
+
+        comments = [TaskCommentUtil.convert_task_comment_bson_to_task_comment(bson) for bson in comments_bson]
+        return CursorPaginationResult(items=comments, next_cursor=next_cursor)
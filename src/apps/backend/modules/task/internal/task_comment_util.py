@@ -0,0 +1,18 @@
+from typing import Any
+
+from modules.task.internal.store.task_comment_model import TaskCommentModel
+from modules.task.types import TaskComment
+
+
+class TaskCommentUtil:
+    @staticmethod
+    def convert_task_comment_bson_to_task_comment(comment_bson: dict[str, Any]) -> TaskComment:
+        validated_comment_data = TaskCommentModel.from_bson(comment_bson)
+        return TaskComment(
+            account_id=validated_comment_data.account_id,
+            content=validated_comment_data.content,
+            created_at=validated_comment_data.created_at,
+            id=str(validated_comment_data.id),
+            task_id=validated_comment_data.task_id,
+            updated_at=validated_comment_data.updated_at,
+        )
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Any
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import PyMongoError
+
+from modules.task.errors import TaskCommentNotFoundError, TaskNotFoundError
+from modules.task.internal.store.task_comment_model import TaskCommentModel
+from modules.task.internal.store.task_comment_repository import TaskCommentRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_cache import TaskCache
+from modules.task.internal.task_comment_util import TaskCommentUtil
+from modules.task.types import CreateTaskCommentParams, DeleteTaskCommentParams, TaskComment, UpdateTaskCommentParams
+
+
+class TaskCommentWriter:
+    @staticmethod
+    def create_task_comment(*, params: CreateTaskCommentParams) -> TaskComment:
+        # Bumping the count first also checks that the task exists and belongs to the account
+        if not TaskCommentWriter._increment_comment_count(
+            account_id=params.account_id, task_id=params.task_id, delta=1
+        ):
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        now = datetime.now()
+        comment_bson = TaskCommentModel(
+            account_id=params.account_id, content=params.content, created_at=now, task_id=params.task_id, updated_at=now
+        ).to_bson()
+
+        try:
+            query = TaskCommentRepository.collection().insert_one(comment_bson)
+        except PyMongoError:
+            TaskCommentWriter._increment_comment_count(account_id=params.account_id, task_id=params.task_id, delta=-1)
+            raise
+
+        comment_bson["_id"] = query.inserted_id
+        return TaskCommentUtil.convert_task_comment_bson_to_task_comment(comment_bson)
+
+    @staticmethod
+    def update_task_comment(*, params: UpdateTaskCommentParams) -> TaskComment:
+        TaskCommentWriter._assert_task_is_active(account_id=params.account_id, task_id=params.task_id)
+
+        updated_comment_bson = TaskCommentRepository.collection().find_one_and_update(
+            TaskCommentWriter._get_comment_filter(
+                account_id=params.account_id, task_id=params.task_id, comment_id=params.comment_id
+            ),
+            {"$set": {"content": params.content, "updated_at": datetime.now()}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if updated_comment_bson is None:
+            raise TaskCommentNotFoundError(comment_id=params.comment_id)
+
+        return TaskCommentUtil.convert_task_comment_bson_to_task_comment(updated_comment_bson)
+
+    @staticmethod
+    def delete_task_comment(*, params: DeleteTaskCommentParams) -> None:
+        TaskCommentWriter._assert_task_is_active(account_id=params.account_id, task_id=params.task_id)
+
+        delete_result = TaskCommentRepository.collection().delete_one(
+            TaskCommentWriter._get_comment_filter(
+                account_id=params.account_id, task_id=params.task_id, comment_id=params.comment_id
+            )
+        )
+
+        if delete_result.deleted_count == 0:
+            raise TaskCommentNotFoundError(comment_id=params.comment_id)
+
+        TaskCommentWriter._increment_comment_count(account_id=params.account_id, task_id=params.task_id, delta=-1)
+
+    @staticmethod
+    def _increment_comment_count(*, account_id: str, task_id: str, delta: int) -> bool:
+        # The version and updated_at move too, so ETags and the changes feed pick up the new count
+        update_result = TaskRepository.collection().update_one(
+            TaskCommentWriter._get_task_filter(account_id=account_id, task_id=task_id),
+            {"$inc": {"comment_count": delta, "version": 1}, "$set": {"updated_at": datetime.now()}},
+        )
+        if update_result.matched_count == 0:
+            return False
+
+        TaskCache.invalidate_account(account_id=account_id)
+        return True
+
+    @staticmethod
+    def _assert_task_is_active(*, account_id: str, task_id: str) -> None:
+        task_filter = TaskCommentWriter._get_task_filter(account_id=account_id, task_id=task_id)
+        if TaskRepository.collection().find_one(task_filter, {"_id": 1}) is None:
+            raise TaskNotFoundError(task_id=task_id)
+
+    @staticmethod
+    def _get_task_filter(*, account_id: str, task_id: str) -> dict[str, Any]:
+        return {"_id": ObjectId(task_id), "account_id": account_id, "active": True}
+
+    @staticmethod
+    def _get_comment_filter(*, account_id: str, task_id: str, comment_id: str) -> dict[str, Any]:
+        return {"_id": ObjectId(comment_id), "task_id": task_id, "account_id": account_id}
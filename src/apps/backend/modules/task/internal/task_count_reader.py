@@ -0,0 +1,15 @@
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+
+
+class TaskCountReader:
+    @staticmethod
+    def get_active_task_count(*, account_id: str) -> int:
+        task_count_bson = TaskCountRepository.collection().find_one(
+            {"account_id": account_id}, projection={"active_task_count": 1}
+        )
+        if task_count_bson is not None:
+            return int(task_count_bson["active_task_count"])
+
+        # Accounts without a counter yet are counted directly until the counter gets seeded
+        return int(TaskRepository.collection().count_documents({"account_id": account_id, "active": True}))
@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import Iterator, Optional
+
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from modules.task.internal.store.task_count_model import TaskCountModel
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_cache import TaskCache
+from modules.task.types import TaskCountReconciliationResult
+
+RECONCILIATION_BATCH_SIZE = 500
+
+
+class TaskCountWriter:
+    @staticmethod
+    def increment_active_task_count(*, account_id: str, delta: int) -> None:
+        update_result = TaskCountRepository.collection().update_one(
+            {"account_id": account_id}, {"$inc": {"active_task_count": delta}, "$set": {"updated_at": datetime.now()}}
+        )
+
+        if update_result.matched_count == 0:
+            TaskCountWriter._seed_active_task_count(account_id=account_id)
+
+    @staticmethod
+    def reconcile_active_task_counts() -> TaskCountReconciliationResult:
+        accounts_checked = 0
+        accounts_repaired = 0
+        counted_account_ids: set[str] = set()
+
+        for batch in TaskCountWriter._iterate_actual_active_task_counts():
+            counted_account_ids.update(batch.keys())
+            stored_counts = {
+                task_count_bson["account_id"]: task_count_bson["active_task_count"]
+                for task_count_bson in TaskCountRepository.collection().find(
+                    {"account_id": {"$in": list(batch.keys())}}, projection={"account_id": 1, "active_task_count": 1}
+                )
+            }
+            accounts_checked += len(batch)
+            accounts_repaired += TaskCountWriter._repair_task_counts(
+                {
+                    account_id: (stored_counts.get(account_id), actual_count)
+                    for account_id, actual_count in batch.items()
+                    if stored_counts.get(account_id) != actual_count
+                }
+            )
+
+        # Seeded accounts that no longer have any active task are absent from the aggregation
+        stale_task_counts = TaskCountRepository.collection().find(
+            {"active_task_count": {"$ne": 0}}, projection={"account_id": 1, "active_task_count": 1}
+        )
+        stale_counts = {
+            task_count_bson["account_id"]: (task_count_bson["active_task_count"], 0)
+            for task_count_bson in stale_task_counts
+            if task_count_bson["account_id"] not in counted_account_ids
+        }
+        accounts_checked += len(stale_counts)
+        accounts_repaired += TaskCountWriter._repair_task_counts(stale_counts)
+
+        return TaskCountReconciliationResult(accounts_checked=accounts_checked, accounts_repaired=accounts_repaired)
+
+    @staticmethod
+    def _iterate_actual_active_task_counts() -> Iterator[dict[str, int]]:
+        cursor = TaskRepository.collection().aggregate(
+            [{"$match": {"active": True}}, {"$group": {"_id": "$account_id", "active_task_count": {"$sum": 1}}}],
+            allowDiskUse=True,
+            batchSize=RECONCILIATION_BATCH_SIZE,
+        )
+
+        batch: dict[str, int] = {}
+        for group in cursor:
+            batch[group["_id"]] = group["active_task_count"]
+            if len(batch) >= RECONCILIATION_BATCH_SIZE:
+                yield batch
+                batch = {}
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _seed_active_task_count(*, account_id: str) -> None:
+        # The count already includes the write that triggered seeding
+        active_task_count = TaskRepository.collection().count_documents({"account_id": account_id, "active": True})
+        now = datetime.now()
+        task_count_bson = TaskCountModel(
+            account_id=account_id, active_task_count=active_task_count, created_at=now, updated_at=now
+        ).to_bson()
+
+        try:
+            TaskCountRepository.collection().update_one(
+                {"account_id": account_id}, {"$setOnInsert": task_count_bson}, upsert=True
+            )
+        except DuplicateKeyError:
+            # A concurrent write seeded the counter first; any drift is repaired by reconciliation
+            pass
+
+    @staticmethod
+    def _repair_task_counts(counts: dict[str, tuple[Optional[int], int]]) -> int:
+        if not counts:
+            return 0
+
+        now = datetime.now()
+        repair_result = TaskCountRepository.collection().bulk_write(
+            [
+                TaskCountWriter._get_repair_operation(
+                    account_id=account_id, stored_count=stored_count, actual_count=actual_count, now=now
+                )
+                for account_id, (stored_count, actual_count) in counts.items()
+            ],
+            ordered=False,
+        )
+        # Cached list pages carry the old total, so repaired accounts start a new cache generation
+        for account_id in counts:
+            TaskCache.invalidate_account(account_id=account_id)
+        return int(repair_result.modified_count) + int(repair_result.upserted_count)
+
+    @staticmethod
+    def _get_repair_operation(
+        *, account_id: str, stored_count: Optional[int], actual_count: int, now: datetime
+    ) -> UpdateOne:
+        if stored_count is None:
+            # Only seeds a missing counter; one seeded concurrently already counted its own write
+            return UpdateOne(
+                {"account_id": account_id},
+                {
+                    "$setOnInsert": TaskCountModel(
+                        account_id=account_id, active_task_count=actual_count, created_at=now, updated_at=now
+                    ).to_bson()
+                },
+                upsert=True,
+            )
+
+        # A counter that moved since it was read took a concurrent $inc that must not be overwritten, so the repair
+        # only applies while it still holds the stored value, and a missed account is checked again by the next run
+        return UpdateOne(
+            {"account_id": account_id, "active_task_count": stored_count},
+            {"$set": {"active_task_count": actual_count, "updated_at": now}},
+        )
@@ -1,39 +1,343 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, Iterator, Optional
+
 from bson.objectid import ObjectId
 
 from modules.application.common.base_model import BaseModel
-from modules.application.common.types import PaginationResult
-from modules.task.errors import TaskNotFoundError
+from modules.application.common.types import CursorPaginationResult, PaginationResult, SortDirection, SortParams
+from modules.config.config_service import ConfigService
+from modules.task.constants import TASK_SORT_FIELDS, TASK_TAGS_SORT_FIELD
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
 from modules.task.internal.store.task_repository import TaskRepository
-from modules.task.internal.task_util import TaskUtil
-from modules.task.types import GetPaginatedTasksParams, GetTaskParams, Task
+from modules.task.internal.task_cache import TaskCache
+from modules.task.internal.task_change_broker import TASK_CHANGE_BROKER, TaskChangeSubscription
+from modules.task.internal.task_count_reader import TaskCountReader
+from modules.task.internal.task_util import TITLE_PREFIX_MAX_LENGTH, TaskUtil
+from modules.task.types import (
+    AutocompleteTasksParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetPaginatedTasksParams,
+    GetTaskChangesParams,
+    GetTaskParams,
+    GetTasksByIdsParams,
+    SearchTasksParams,
+    StreamTaskChangesParams,
+    Task,
+    TaskAutocompleteResult,
+    TaskAutocompleteSuggestion,
+    TaskBatchGetResult,
+    TaskChangeEvent,
+    TaskChangeEventType,
+    TaskChangesResult,
+    TaskFilterParams,
+    TaskSearchResult,
+)
+
+DEFAULT_TASK_SORT_PARAMS = SortParams(sort_by="created_at", sort_direction=SortDirection.DESC)
+TASK_SEARCH_SORT_PARAMS = SortParams(sort_by="score", sort_direction=SortDirection.DESC)
+TASK_CHANGES_SORT_PARAMS = SortParams(sort_by="updated_at", sort_direction=SortDirection.ASC)
+TASK_EXPORT_PROJECTION = {"_id": 1, "created_at": 1, "description": 1, "title": 1, "updated_at": 1}
 
 
 class TaskReader:
     @staticmethod
     def get_task(*, params: GetTaskParams) -> Task:
+        return TaskCache.get_or_load(
+            account_id=params.account_id,
+            key=TaskUtil.get_cache_key("task", params),
+            load=lambda: TaskReader._load_task(params=params),
+            serialize=asdict,
+            deserialize=TaskUtil.convert_cache_value_to_task,
+        )
+
+    @staticmethod
+    def get_task_version(*, params: GetTaskParams) -> int:
         task_bson = TaskRepository.collection().find_one(
-            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True}
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            projection={"version": 1},
         )
         if task_bson is None:
             raise TaskNotFoundError(task_id=params.task_id)
-        return TaskUtil.convert_task_bson_to_task(task_bson)
+        return int(task_bson.get("version", 0))
+
+    @staticmethod
+    def get_tasks_by_ids(*, params: GetTasksByIdsParams) -> TaskBatchGetResult:
+        task_ids = list(dict.fromkeys(params.task_ids))
+        # Malformed ids can never match a task, so they are reported missing without being queried
+        object_ids = [ObjectId(task_id) for task_id in task_ids if ObjectId.is_valid(task_id)]
+
+        tasks_by_id: dict[str, Task] = {}
+        if object_ids:
+            tasks_bson = TaskRepository.collection().find(
+                {"_id": {"$in": object_ids}, "account_id": params.account_id, "active": True},
+                projection=TaskUtil.get_task_projection(params.fields),
+            )
+            for task_bson in tasks_bson:
+                task = TaskUtil.convert_task_bson_to_task(task_bson)
+                tasks_by_id[task.id] = task
+
+        return TaskBatchGetResult(
+            items=[tasks_by_id[task_id] for task_id in task_ids if task_id in tasks_by_id],
+            missing_ids=[task_id for task_id in task_ids if task_id not in tasks_by_id],
+        )
 
     @staticmethod
     def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
-        filter_query = {"account_id": params.account_id, "active": True}
-        total_count = TaskRepository.collection().count_documents(filter_query)
-        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
-            params.pagination_params, total_count
+        return TaskCache.get_or_load(
+            account_id=params.account_id,
+            key=TaskUtil.get_cache_key("list", params),
+            load=lambda: TaskReader._load_paginated_tasks(params=params),
+            serialize=asdict,
+            deserialize=TaskUtil.convert_cache_value_to_pagination_result,
+        )
+
+    @staticmethod
+    def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        return TaskCache.get_or_load(
+            account_id=params.account_id,
+            key=TaskUtil.get_cache_key("cursor_list", params),
+            load=lambda: TaskReader._load_cursor_paginated_tasks(params=params),
+            serialize=asdict,
+            deserialize=TaskUtil.convert_cache_value_to_cursor_pagination_result,
+        )
+
+    @staticmethod
+    def _load_task(*, params: GetTaskParams) -> Task:
+        task_bson = TaskRepository.collection().find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            projection=TaskUtil.get_task_projection(params.fields),
         )
-        cursor = TaskRepository.collection().find(filter_query)
+        if task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+        return TaskUtil.convert_task_bson_to_task(task_bson)
 
-        if params.sort_params:
-            cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
-        else:
-            cursor = cursor.sort([("created_at", -1), ("_id", -1)])
+    @staticmethod
+    def _load_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
+        sort_params = TaskReader._get_list_sort_params(
+            sort_params=params.sort_params, filter_params=params.filter_params
+        )
+        filter_query = TaskUtil.build_task_filter_query(
+            account_id=params.account_id, filter_params=params.filter_params
+        )
+        total_count: Optional[int] = None
+        if params.include_total and params.filter_params is not None:
+            # The account counter only knows the unfiltered total; this count runs on the index serving the page
+            total_count = TaskRepository.collection().count_documents(filter_query)
+        elif params.include_total:
+            total_count = TaskCountReader.get_active_task_count(account_id=params.account_id)
+        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
+            params.pagination_params, total_count or 0
+        )
+        cursor = TaskRepository.collection().find(filter_query, projection=TaskUtil.get_task_projection(params.fields))
+        cursor = BaseModel.apply_sort_params(cursor, sort_params)
 
         tasks_bson = list(cursor.skip(skip).limit(pagination_params.size))
         tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
         return PaginationResult(
-            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+            items=tasks,
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages if total_count is not None else None,
+        )
+
+    @staticmethod
+    def _load_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        sort_params = TaskReader._get_list_sort_params(
+            sort_params=params.sort_params, filter_params=params.filter_params
+        )
+        size = params.pagination_params.size
+        filter_query = TaskUtil.build_task_filter_query(
+            account_id=params.account_id, filter_params=params.filter_params
+        )
+
+        if params.pagination_params.cursor:
+            try:
+                sort_value, last_id = BaseModel.decode_cursor(params.pagination_params.cursor)
+            except ValueError:
+                raise TaskBadRequestError("Cursor is invalid")
+            # $and keeps a filter range and the keyset range on the same field from overwriting each other
+            filter_query = {"$and": [filter_query, BaseModel.build_keyset_filter(sort_params, sort_value, last_id)]}
+
+        # The sort field is always projected because the next cursor is built from it
+        projection = TaskUtil.get_task_projection(params.fields, extra_fields=[sort_params.sort_by])
+        cursor = TaskRepository.collection().find(filter_query, projection=projection)
+        cursor = BaseModel.apply_sort_params(cursor, sort_params)
+
+        # Fetch one extra document to know whether another page exists without counting
+        tasks_bson = list(cursor.limit(size + 1))
+        next_cursor = None
+        if len(tasks_bson) > size:
+            tasks_bson = tasks_bson[:size]
+            last_task_bson = tasks_bson[-1]
+            next_cursor = BaseModel.encode_cursor(last_task_bson.get(sort_params.sort_by), last_task_bson["_id"])
+
+        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        return CursorPaginationResult(items=tasks, next_cursor=next_cursor)
+
+    @staticmethod
+    def _get_list_sort_params(
+        *, sort_params: Optional[SortParams], filter_params: Optional[TaskFilterParams]
+    ) -> SortParams:
+        # Each list index is (account_id, active, field, _id), so one index can only serve a filter on its sort field
+        filtered_fields = TaskUtil.get_filtered_fields(filter_params)
+        if filter_params is not None and filter_params.tags:
+            filtered_fields = list(dict.fromkeys([TASK_TAGS_SORT_FIELD, *filtered_fields]))
+        if len(filtered_fields) > 1:
+            raise TaskBadRequestError(f"Filters on {' and '.join(filtered_fields)} cannot be combined")
+
+        if sort_params is None:
+            if filtered_fields:
+                return SortParams(sort_by=filtered_fields[0], sort_direction=SortDirection.DESC)
+            return DEFAULT_TASK_SORT_PARAMS
+
+        if sort_params.sort_by not in TASK_SORT_FIELDS:
+            raise TaskBadRequestError(f"Sort field must be one of {', '.join(TASK_SORT_FIELDS)}")
+
+        if filtered_fields and filtered_fields[0] != sort_params.sort_by:
+            raise TaskBadRequestError(f"Filtering on {filtered_fields[0]} requires sorting by {filtered_fields[0]}")
+
+        return sort_params
+
+    @staticmethod
+    def search_tasks(*, params: SearchTasksParams) -> CursorPaginationResult[TaskSearchResult]:
+        size = params.pagination_params.size
+        pipeline: list[dict[str, Any]] = [
+            {"$match": {"account_id": params.account_id, "active": True, "$text": {"$search": params.query}}},
+            {"$addFields": {"score": {"$meta": "textScore"}}},
+        ]
+
+        if params.pagination_params.cursor:
+            try:
+                score, last_id = BaseModel.decode_cursor(params.pagination_params.cursor)
+            except ValueError:
+                raise TaskBadRequestError("Cursor is invalid")
+            pipeline.append({"$match": BaseModel.build_keyset_filter(TASK_SEARCH_SORT_PARAMS, score, last_id)})
+
+        # Text score ordering cannot come from an index; $sort followed by $limit keeps only the top documents
+        pipeline.extend([{"$sort": dict(BaseModel.get_sort_spec(TASK_SEARCH_SORT_PARAMS))}, {"$limit": size + 1}])
+        tasks_bson = list(TaskRepository.collection().aggregate(pipeline))
+
+        next_cursor = None
+        if len(tasks_bson) > size:
+            tasks_bson = tasks_bson[:size]
+            next_cursor = BaseModel.encode_cursor(tasks_bson[-1]["score"], tasks_bson[-1]["_id"])
+
+        pattern = TaskUtil.get_search_terms_pattern(params.query)
+        results = [
+            TaskSearchResult(
+                task=TaskUtil.convert_task_bson_to_task(task_bson),
+                score=task_bson["score"],
+                snippets=TaskUtil.build_search_snippets(task_bson, pattern),
+            )
+            for task_bson in tasks_bson
+        ]
+        return CursorPaginationResult(items=results, next_cursor=next_cursor)
+
+    @staticmethod
+    def autocomplete_tasks(*, params: AutocompleteTasksParams) -> TaskAutocompleteResult:
+        return TaskCache.get_or_load(
+            account_id=params.account_id,
+            key=TaskUtil.get_cache_key("autocomplete", params),
+            load=lambda: TaskReader._load_autocomplete_tasks(params=params),
+            serialize=asdict,
+            deserialize=TaskUtil.convert_cache_value_to_autocomplete_result,
+        )
+
+    @staticmethod
+    def _load_autocomplete_tasks(*, params: AutocompleteTasksParams) -> TaskAutocompleteResult:
+        prefixes = [word[:TITLE_PREFIX_MAX_LENGTH] for word in TaskUtil.normalize_title(params.query)]
+        if not prefixes:
+            return TaskAutocompleteResult(items=[])
+
+        # Every typed word must prefix some title word; the index bounds come from the first one
+        cursor = (
+            TaskRepository.collection()
+            .find(
+                {"account_id": params.account_id, "active": True, "title_prefixes": {"$all": prefixes}},
+                projection={"title": 1},
+            )
+            .sort([("updated_at", -1)])
+            .limit(params.size)
+        )
+        return TaskAutocompleteResult(
+            items=[
+                TaskAutocompleteSuggestion(id=str(task_bson["_id"]), title=task_bson["title"]) for task_bson in cursor
+            ]
+        )
+
+    @staticmethod
+    def get_task_changes(*, params: GetTaskChangesParams) -> TaskChangesResult:
+        # Writes still in flight can commit with an earlier updated_at than one already returned, so the feed
+        # stops short of the most recent few seconds instead of skipping those writes forever
+        settle_seconds = ConfigService[int].get_value(key="tasks.changes_settle_seconds")
+        filter_query: dict[str, Any] = {
+            "account_id": params.account_id,
+            "updated_at": {"$lte": datetime.now() - timedelta(seconds=settle_seconds)},
+        }
+
+        if params.since:
+            try:
+                updated_at, last_id = BaseModel.decode_cursor(params.since)
+            except ValueError:
+                raise TaskBadRequestError("Sync token is invalid")
+            filter_query = {
+                "$and": [filter_query, BaseModel.build_keyset_filter(TASK_CHANGES_SORT_PARAMS, updated_at, last_id)]
+            }
+
+        cursor = TaskRepository.collection().find(filter_query, projection={"title_prefixes": 0})
+        tasks_bson = list(BaseModel.apply_sort_params(cursor, TASK_CHANGES_SORT_PARAMS).limit(params.size + 1))
+
+        has_more = len(tasks_bson) > params.size
+        tasks_bson = tasks_bson[: params.size]
+        next_token = params.since
+        if tasks_bson:
+            next_token = BaseModel.encode_cursor(tasks_bson[-1]["updated_at"], tasks_bson[-1]["_id"])
+
+        return TaskChangesResult(
+            changes=[TaskUtil.convert_task_bson_to_task_change(task_bson) for task_bson in tasks_bson],
+            has_more=has_more,
+            next_token=next_token,
         )
+
+    @staticmethod
+    def stream_task_changes(*, params: StreamTaskChangesParams) -> Iterator[Optional[TaskChangeEvent]]:
+        # Subscribing happens before the stream is returned, so a refused client gets an error instead of a stream
+        TASK_CHANGE_BROKER.ensure_watching()
+        subscription = TASK_CHANGE_BROKER.subscribe(
+            account_id=params.account_id, queue_size=params.queue_size, max_subscriptions=params.max_connections
+        )
+        events = TaskReader._iter_task_changes(subscription=subscription, heartbeat_seconds=params.heartbeat_seconds)
+        # Advancing into the try block means closing or dropping the stream always releases the subscription
+        next(events)
+        return events
+
+    @staticmethod
+    def _iter_task_changes(
+        *, subscription: TaskChangeSubscription, heartbeat_seconds: int
+    ) -> Iterator[Optional[TaskChangeEvent]]:
+        # Yields None whenever heartbeat_seconds pass without an event so callers can keep the connection alive
+        try:
+            yield None
+            while True:
+                event = subscription.get(timeout=heartbeat_seconds)
+                yield event
+                if event is not None and event.type == TaskChangeEventType.RESYNC:
+                    return
+        finally:
+            TASK_CHANGE_BROKER.unsubscribe(subscription)
+
+    @staticmethod
+    def export_tasks(*, params: ExportTasksParams) -> Iterator[str]:
+        # Walking the default sort index with a bounded batch_size keeps memory flat and avoids skip/count costs
+        cursor = TaskRepository.collection().find(
+            {"account_id": params.account_id, "active": True}, projection=TASK_EXPORT_PROJECTION
+        )
+        cursor = BaseModel.apply_sort_params(cursor, DEFAULT_TASK_SORT_PARAMS).batch_size(params.batch_size)
+
+        rows = (TaskUtil.convert_task_bson_to_task_export_row(task_bson) for task_bson in cursor)
+        try:
+            yield from TaskUtil.serialize_export_rows(rows=rows, export_format=params.export_format)
+        finally:
+            cursor.close()
@@ -0,0 +1,17 @@
+from typing import List
+
+from modules.task.internal.store.task_tag_count_repository import TaskTagCountRepository
+from modules.task.types import GetTaskTagCountsParams, TaskTagCount
+
+
+class TaskTagCountReader:
+    @staticmethod
+    def get_tag_counts(*, params: GetTaskTagCountsParams) -> List[TaskTagCount]:
+        tag_counts_bson = (
+            TaskTagCountRepository.collection()
+            .find({"account_id": params.account_id, "count": {"$gt": 0}}, projection={"_id": 0, "tag": 1, "count": 1})
+            .sort([("count", -1), ("tag", 1)])
+        )
+        return [
+            TaskTagCount(tag=tag_count_bson["tag"], count=tag_count_bson["count"]) for tag_count_bson in tag_counts_bson
+        ]
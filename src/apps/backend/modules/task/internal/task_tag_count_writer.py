@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from modules.task.internal.store.task_tag_count_repository import TaskTagCountRepository
+
+
+class TaskTagCountWriter:
+    @staticmethod
+    def increment_tag_counts(*, account_id: str, tag_deltas: dict[str, int]) -> None:
+        tag_deltas = {tag: delta for tag, delta in tag_deltas.items() if delta}
+        if not tag_deltas:
+            return
+
+        now = datetime.now()
+        TaskTagCountRepository.collection().bulk_write(
+            [
+                UpdateOne(
+                    {"account_id": account_id, "tag": tag},
+                    {"$inc": {"count": delta}, "$set": {"updated_at": now}, "$setOnInsert": {"created_at": now}},
+                    upsert=True,
+                )
+                for tag, delta in tag_deltas.items()
+            ],
+            ordered=False,
+        )
+
+        # Tags no task carries anymore are dropped so the per account listing stays small
+        decremented_tags = [tag for tag, delta in tag_deltas.items() if delta < 0]
+        if decremented_tags:
+            TaskTagCountRepository.collection().delete_many(
+                {"account_id": account_id, "tag": {"$in": decremented_tags}, "count": {"$lte": 0}}
+            )
@@ -1,7 +1,47 @@
-from typing import Any
+import csv
+import hashlib
+import io
+import json
+import re
+import string
+import unicodedata
+from dataclasses import asdict, astuple, fields
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional
 
+from bson.objectid import ObjectId
+
+from modules.application.common.types import CursorPaginationResult, PaginationParams, PaginationResult
 from modules.task.internal.store.task_model import TaskModel
-from modules.task.types import Task
+from modules.task.types import (
+    Task,
+    TaskAutocompleteResult,
+    TaskAutocompleteSuggestion,
+    TaskBatchOperation,
+    TaskBatchOperationType,
+    TaskChange,
+    TaskChangeEvent,
+    TaskChangeEventType,
+    TaskExportFormat,
+    TaskExportRow,
+    TaskField,
+    TaskFilterParams,
+    TaskImportFormat,
+    TaskSearchSnippet,
+    TaskTagsMatch,
+)
+
+SEARCH_SNIPPET_RADIUS = 80
+# Bounds on the edge n-grams stored per task, so long titles cannot bloat the multikey index
+TITLE_PREFIX_MAX_LENGTH = 20
+TITLE_PREFIX_MAX_WORDS = 12
+# Rank digits in ascending byte order, so Python and Mongo compare ranks the same way
+RANK_DIGITS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+# Appended ranks are a fixed width integer head plus a non-zero digit, so no rank ever ends in the zero digit
+RANK_INTEGER_WIDTH = 7
+RANK_SUFFIX = RANK_DIGITS[len(RANK_DIGITS) // 2]
+# Wide enough for the three byte ObjectId counter that breaks ties between appends in the same millisecond
+RANK_COUNTER_WIDTH = 5
 
 
 class TaskUtil:
@@ -10,7 +50,345 @@ class TaskUtil:
         validated_task_data = TaskModel.from_bson(task_bson)
         return Task(
             account_id=validated_task_data.account_id,
-            description=validated_task_data.description,
+            description=validated_task_data.description if "description" in task_bson else None,
             id=str(validated_task_data.id),
-            title=validated_task_data.title,
+            title=validated_task_data.title if "title" in task_bson else None,
+            version=validated_task_data.version,
+            tags=validated_task_data.tags,
+            rank=validated_task_data.rank,
+            comment_count=validated_task_data.comment_count,
+        )
+
+    @staticmethod
+    def convert_task_bson_to_task_change(task_bson: dict[str, Any]) -> TaskChange:
+        deleted = not task_bson.get("active", True)
+        return TaskChange(
+            id=str(task_bson["_id"]),
+            deleted=deleted,
+            updated_at=task_bson["updated_at"],
+            task=None if deleted else TaskUtil.convert_task_bson_to_task(task_bson),
+        )
+
+    @staticmethod
+    def convert_change_to_task_change_event(change: dict[str, Any]) -> Optional[TaskChangeEvent]:
+        task_bson = change.get("fullDocument")
+        # updateLookup yields no document when the task was removed before the lookup ran
+        if not task_bson:
+            return None
+
+        if not task_bson.get("active", True):
+            event_type = TaskChangeEventType.DELETED
+        elif change["operationType"] == "insert":
+            event_type = TaskChangeEventType.CREATED
+        else:
+            event_type = TaskChangeEventType.UPDATED
+
+        return TaskChangeEvent(
+            type=event_type,
+            account_id=task_bson["account_id"],
+            task_id=str(task_bson["_id"]),
+            updated_at=task_bson.get("updated_at"),
+            task=None if event_type == TaskChangeEventType.DELETED else TaskUtil.convert_task_bson_to_task(task_bson),
+        )
+
+    @staticmethod
+    def get_cache_key(prefix: str, params: Any) -> str:
+        # Params are frozen dataclasses, so their repr is a stable description of the query
+        return f"{prefix}:{hashlib.sha1(repr(params).encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def convert_cache_value_to_task(value: dict[str, Any]) -> Task:
+        return Task(**value)
+
+    @staticmethod
+    def convert_cache_value_to_pagination_result(value: dict[str, Any]) -> PaginationResult[Task]:
+        return PaginationResult(
+            items=[Task(**item) for item in value["items"]],
+            pagination_params=PaginationParams(**value["pagination_params"]),
+            total_count=value["total_count"],
+            total_pages=value["total_pages"],
+        )
+
+    @staticmethod
+    def convert_cache_value_to_cursor_pagination_result(value: dict[str, Any]) -> CursorPaginationResult[Task]:
+        return CursorPaginationResult(items=[Task(**item) for item in value["items"]], next_cursor=value["next_cursor"])
+
+    @staticmethod
+    def normalize_title(title: str) -> List[str]:
+        # Accents are stripped so "Resume" matches "résumé" in either direction
+        decomposed_title = unicodedata.normalize("NFKD", title)
+        ascii_title = "".join(char for char in decomposed_title if not unicodedata.combining(char))
+        return re.findall(r"\w+", ascii_title.casefold())
+
+    @staticmethod
+    def get_initial_rank() -> str:
+        return TaskUtil._encode_rank_integer(len(RANK_DIGITS) ** RANK_INTEGER_WIDTH // 2)
+
+    @staticmethod
+    def get_append_rank(created_at: datetime, task_id: ObjectId) -> str:
+        # Appends need no read: the head is the creation time in milliseconds, which is past every rank handed out
+        # by get_initial_rank and get_rank_after, and the ObjectId counter orders tasks created in the same millisecond
+        rank_integer = min(int(created_at.timestamp() * 1000), len(RANK_DIGITS) ** RANK_INTEGER_WIDTH - 1)
+        counter = int.from_bytes(task_id.binary[-3:], "big")
+        counter_digits = []
+        for _ in range(RANK_COUNTER_WIDTH):
+            counter, digit = divmod(counter, len(RANK_DIGITS))
+            counter_digits.append(RANK_DIGITS[digit])
+        return (
+            TaskUtil._encode_rank_integer(rank_integer)[:RANK_INTEGER_WIDTH]
+            + "".join(reversed(counter_digits))
+            + RANK_SUFFIX
+        )
+
+    @staticmethod
+    def get_rank_after(rank: str) -> str:
+        # Appending bumps the integer head, so ranks only grow once the head space is exhausted
+        rank_integer = TaskUtil._decode_rank_integer(rank)
+        if rank_integer + 1 < len(RANK_DIGITS) ** RANK_INTEGER_WIDTH:
+            return TaskUtil._encode_rank_integer(rank_integer + 1)
+        return TaskUtil.get_rank_between(rank, None)
+
+    @staticmethod
+    def get_rank_before(rank: str) -> str:
+        rank_integer = TaskUtil._decode_rank_integer(rank)
+        if rank_integer > 0:
+            return TaskUtil._encode_rank_integer(rank_integer - 1)
+        return TaskUtil.get_rank_between("", rank)
+
+    @staticmethod
+    def get_rank_between(lower: str, upper: Optional[str]) -> str:
+        # Concurrent writes can leave two tasks on one rank; nothing fits between them, so the rank goes after both
+        if upper is not None and upper <= lower:
+            return lower + RANK_SUFFIX
+        return TaskUtil._get_rank_midpoint(lower, upper)
+
+    @staticmethod
+    def _get_rank_midpoint(lower: str, upper: Optional[str]) -> str:
+        # An empty lower is the start of the list and a missing upper the end of it
+        if upper is not None:
+            prefix_length = 0
+            while (lower[prefix_length] if prefix_length < len(lower) else RANK_DIGITS[0]) == upper[prefix_length]:
+                prefix_length += 1
+            if prefix_length:
+                return upper[:prefix_length] + TaskUtil._get_rank_midpoint(lower[prefix_length:], upper[prefix_length:])
+
+        lower_digit = RANK_DIGITS.index(lower[0]) if lower else 0
+        upper_digit = RANK_DIGITS.index(upper[0]) if upper is not None else len(RANK_DIGITS)
+        if upper_digit - lower_digit > 1:
+            return RANK_DIGITS[(lower_digit + upper_digit + 1) // 2]
+        if upper is not None and len(upper) > 1:
+            return upper[0]
+        return RANK_DIGITS[lower_digit] + TaskUtil._get_rank_midpoint(lower[1:], None)
+
+    @staticmethod
+    def _encode_rank_integer(value: int) -> str:
+        digits = []
+        for _ in range(RANK_INTEGER_WIDTH):
+            value, digit = divmod(value, len(RANK_DIGITS))
+            digits.append(RANK_DIGITS[digit])
+        return "".join(reversed(digits)) + RANK_SUFFIX
+
+    @staticmethod
+    def _decode_rank_integer(rank: str) -> int:
+        value = 0
+        for digit in rank[:RANK_INTEGER_WIDTH].ljust(RANK_INTEGER_WIDTH, RANK_DIGITS[0]):
+            value = value * len(RANK_DIGITS) + RANK_DIGITS.index(digit)
+        return value
+
+    @staticmethod
+    def normalize_tag(tag: str) -> str:
+        return tag.strip().casefold()
+
+    @staticmethod
+    def normalize_tags(tags: Iterable[str]) -> List[str]:
+        normalized_tags = (TaskUtil.normalize_tag(tag) for tag in tags)
+        return list(dict.fromkeys(tag for tag in normalized_tags if tag))
+
+    @staticmethod
+    def build_title_prefixes(title: str) -> List[str]:
+        prefixes: dict[str, None] = {}
+        for word in TaskUtil.normalize_title(title)[:TITLE_PREFIX_MAX_WORDS]:
+            for length in range(1, min(len(word), TITLE_PREFIX_MAX_LENGTH) + 1):
+                prefixes[word[:length]] = None
+        return list(prefixes)
+
+    @staticmethod
+    def convert_cache_value_to_autocomplete_result(value: dict[str, Any]) -> TaskAutocompleteResult:
+        return TaskAutocompleteResult(items=[TaskAutocompleteSuggestion(**item) for item in value["items"]])
+
+    @staticmethod
+    def get_task_projection(
+        fields: Optional[List[TaskField]], extra_fields: Optional[List[str]] = None
+    ) -> dict[str, int]:
+        if fields is None:
+            return {"title_prefixes": 0}
+
+        projection = {"_id": 1, "account_id": 1, "version": 1}
+        for field in [*fields, *(extra_fields or [])]:
+            if field != TaskField.ID:
+                projection[field] = 1
+        return projection
+
+    @staticmethod
+    def get_filtered_fields(filter_params: Optional[TaskFilterParams]) -> List[str]:
+        if filter_params is None:
+            return []
+
+        filtered_fields = []
+        if filter_params.created_after is not None or filter_params.created_before is not None:
+            filtered_fields.append("created_at")
+        if filter_params.updated_after is not None or filter_params.updated_before is not None:
+            filtered_fields.append("updated_at")
+        if filter_params.title_prefix:
+            filtered_fields.append("title")
+        return filtered_fields
+
+    @staticmethod
+    def build_task_filter_query(*, account_id: str, filter_params: Optional[TaskFilterParams]) -> dict[str, Any]:
+        filter_query: dict[str, Any] = {"account_id": account_id, "active": True}
+        if filter_params is None:
+            return filter_query
+
+        date_ranges = [
+            ("created_at", filter_params.created_after, filter_params.created_before),
+            ("updated_at", filter_params.updated_after, filter_params.updated_before),
+        ]
+        for field, lower_bound, upper_bound in date_ranges:
+            bounds = {}
+            if lower_bound is not None:
+                bounds["$gt"] = lower_bound
+            if upper_bound is not None:
+                bounds["$lt"] = upper_bound
+            if bounds:
+                filter_query[field] = bounds
+
+        if filter_params.title_prefix:
+            # Only an anchored, case sensitive regex is turned into index bounds instead of a full index scan
+            filter_query["title"] = {"$regex": f"^{re.escape(filter_params.title_prefix)}"}
+
+        if filter_params.tags:
+            tags_operator = "$all" if filter_params.tags_match == TaskTagsMatch.ALL else "$in"
+            filter_query["tags"] = {tags_operator: TaskUtil.normalize_tags(filter_params.tags)}
+
+        return filter_query
+
+    @staticmethod
+    def validate_batch_operation(operation: TaskBatchOperation) -> Optional[str]:
+        if operation.op not in list(TaskBatchOperationType):
+            return f"Operation must be one of {', '.join(TaskBatchOperationType)}"
+
+        if operation.task_id is not None and not isinstance(operation.task_id, str):
+            return "task_id must be a string"
+
+        if operation.op != TaskBatchOperationType.CREATE and not (
+            operation.task_id and ObjectId.is_valid(operation.task_id)
+        ):
+            return "A valid task_id is required"
+
+        if operation.op != TaskBatchOperationType.DELETE:
+            if not isinstance(operation.title, str) or not operation.title:
+                return "Title is required"
+            if not isinstance(operation.description, str) or not operation.description:
+                return "Description is required"
+
+        return None
+
+    @staticmethod
+    def iter_import_rows(
+        *, lines: Iterable[str], import_format: TaskImportFormat
+    ) -> Iterator[tuple[int, Optional[dict[str, Any]]]]:
+        # Rows that cannot be parsed are yielded as None so the importer can report them by line number
+        if import_format == TaskImportFormat.CSV:
+            reader = csv.DictReader(lines)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None
+                continue
+            yield line_number, row if isinstance(row, dict) else None
+
+    @staticmethod
+    def validate_import_row(row: Optional[dict[str, Any]]) -> Optional[str]:
+        if row is None:
+            return "Row is not a valid object"
+        if not isinstance(row.get("title"), str) or not row["title"]:
+            return "Title is required"
+        if not isinstance(row.get("description"), str) or not row["description"]:
+            return "Description is required"
+        return None
+
+    @staticmethod
+    def convert_task_bson_to_task_export_row(task_bson: dict[str, Any]) -> TaskExportRow:
+        return TaskExportRow(
+            id=str(task_bson["_id"]),
+            title=task_bson.get("title", ""),
+            description=task_bson.get("description", ""),
+            created_at=task_bson.get("created_at"),
+            updated_at=task_bson.get("updated_at"),
         )
+
+    @staticmethod
+    def serialize_export_rows(*, rows: Iterable[TaskExportRow], export_format: TaskExportFormat) -> Iterator[str]:
+        if export_format == TaskExportFormat.NDJSON:
+            for row in rows:
+                yield json.dumps(asdict(row), default=TaskUtil._serialize_export_value) + "\n"
+            return
+
+        # A single reusable buffer keeps csv quoting rules without holding more than one row at a time
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([field.name for field in fields(TaskExportRow)])
+        yield TaskUtil._drain_buffer(buffer)
+        for row in rows:
+            writer.writerow([TaskUtil._serialize_export_value(value) for value in astuple(row)])
+            yield TaskUtil._drain_buffer(buffer)
+
+    @staticmethod
+    def _drain_buffer(buffer: io.StringIO) -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return value
+
+    @staticmethod
+    def _serialize_export_value(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if value is None:
+            return ""
+        return value
+
+    @staticmethod
+    def get_search_terms_pattern(query: str) -> Optional[re.Pattern[str]]:
+        # Negated terms never appear in results; the trailing \w* roughly mirrors Mongo's stemming
+        terms = [term for term in re.findall(r"-?\w+", query) if not term.startswith("-")]
+        if not terms:
+            return None
+        return re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\w*", re.IGNORECASE)
+
+    @staticmethod
+    def build_search_snippets(task_bson: dict[str, Any], pattern: Optional[re.Pattern[str]]) -> List[TaskSearchSnippet]:
+        if pattern is None:
+            return []
+
+        snippets = []
+        for field in ("title", "description"):
+            text = task_bson.get(field) or ""
+            matches = [match.span() for match in pattern.finditer(text)]
+            if not matches:
+                continue
+
+            start = max(0, matches[0][0] - SEARCH_SNIPPET_RADIUS)
+            end = min(len(text), matches[0][1] + SEARCH_SNIPPET_RADIUS)
+            highlights = [
+                [match_start - start, match_end - start] for match_start, match_end in matches if match_end <= end
+            ]
+            snippets.append(TaskSearchSnippet(field=field, text=text[start:end], highlights=highlights))
+        return snippets
@@ -1,19 +1,36 @@
 from datetime import datetime
+from typing import Any, Iterator, NoReturn, Optional, Union
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
-from modules.task.errors import TaskNotFoundError
+from modules.task.constants import TASK_TAGS_MAX_PER_TASK
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError, TaskPreconditionFailedError
 from modules.task.internal.store.task_model import TaskModel
 from modules.task.internal.store.task_repository import TaskRepository
-from modules.task.internal.task_reader import TaskReader
+from modules.task.internal.task_cache import TaskCache
+from modules.task.internal.task_count_writer import TaskCountWriter
+from modules.task.internal.task_tag_count_writer import TaskTagCountWriter
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import (
+    AddTaskTagsParams,
+    BatchWriteTasksParams,
     CreateTaskParams,
     DeleteTaskParams,
-    GetTaskParams,
+    ImportTasksParams,
+    MoveTaskParams,
+    RemoveTaskTagParams,
     Task,
+    TaskBatchOperation,
+    TaskBatchOperationError,
+    TaskBatchOperationResult,
+    TaskBatchOperationType,
+    TaskBatchWriteResult,
     TaskDeletionResult,
+    TaskErrorCode,
+    TaskImportProgress,
+    TaskImportRowError,
     UpdateTaskParams,
 )
 
@@ -21,40 +38,539 @@ from modules.task.types import (
 class TaskWriter:
     @staticmethod
     def create_task(*, params: CreateTaskParams) -> Task:
+        # Timestamps are set explicitly because the model defaults are evaluated once at import time
+        now = datetime.now()
+        task_id = ObjectId()
         task_bson = TaskModel(
-            account_id=params.account_id, description=params.description, title=params.title
+            account_id=params.account_id,
+            created_at=now,
+            description=params.description,
+            id=task_id,
+            rank=TaskUtil.get_append_rank(now, task_id),
+            title=params.title,
+            title_prefixes=TaskUtil.build_title_prefixes(params.title),
+            updated_at=now,
         ).to_bson()
 
         query = TaskRepository.collection().insert_one(task_bson)
-        created_task_bson = TaskRepository.collection().find_one({"_id": query.inserted_id})
+        task_bson["_id"] = query.inserted_id
+        TaskCountWriter.increment_active_task_count(account_id=params.account_id, delta=1)
+        TaskCache.invalidate_account(account_id=params.account_id)
 
-        return TaskUtil.convert_task_bson_to_task(created_task_bson)
+        return TaskUtil.convert_task_bson_to_task(task_bson)
 
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
         updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
-            {"$set": {"description": params.description, "title": params.title, "updated_at": datetime.now()}},
+            TaskWriter._get_versioned_task_filter(
+                account_id=params.account_id, task_id=params.task_id, expected_version=params.expected_version
+            ),
+            {
+                "$set": {
+                    "description": params.description,
+                    "title": params.title,
+                    "title_prefixes": TaskUtil.build_title_prefixes(params.title),
+                    "updated_at": datetime.now(),
+                },
+                "$inc": {"version": 1},
+            },
+            projection={"title_prefixes": 0},
             return_document=ReturnDocument.AFTER,
         )
 
         if updated_task_bson is None:
-            raise TaskNotFoundError(task_id=params.task_id)
+            TaskWriter._raise_write_miss(
+                account_id=params.account_id, task_id=params.task_id, expected_version=params.expected_version
+            )
 
+        TaskCache.invalidate_account(account_id=params.account_id)
         return TaskUtil.convert_task_bson_to_task(updated_task_bson)
 
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
-        task = TaskReader.get_task(params=GetTaskParams(account_id=params.account_id, task_id=params.task_id))
-
         deletion_time = datetime.now()
         updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(task.id)},
-            {"$set": {"active": False, "updated_at": deletion_time}},
-            return_document=ReturnDocument.AFTER,
+            TaskWriter._get_versioned_task_filter(
+                account_id=params.account_id, task_id=params.task_id, expected_version=params.expected_version
+            ),
+            {"$set": {"active": False, "updated_at": deletion_time}, "$inc": {"version": 1}},
+            projection={"tags": 1},
         )
 
         if updated_task_bson is None:
-            raise TaskNotFoundError(task_id=params.task_id)
+            TaskWriter._raise_write_miss(
+                account_id=params.account_id, task_id=params.task_id, expected_version=params.expected_version
+            )
+
+        TaskCountWriter.increment_active_task_count(account_id=params.account_id, delta=-1)
+        TaskTagCountWriter.increment_tag_counts(
+            account_id=params.account_id, tag_deltas={tag: -1 for tag in updated_task_bson.get("tags", [])}
+        )
+        TaskCache.invalidate_account(account_id=params.account_id)
 
         return TaskDeletionResult(task_id=params.task_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    def move_task(*, params: MoveTaskParams) -> Task:
+        if params.after_task_id == params.task_id:
+            raise TaskBadRequestError("A task cannot be moved after itself")
+
+        lower_rank = ""
+        if params.after_task_id is not None:
+            after_task_bson = TaskRepository.collection().find_one(
+                {"_id": ObjectId(params.after_task_id), "account_id": params.account_id, "active": True},
+                projection={"rank": 1},
+            )
+            if after_task_bson is None:
+                raise TaskNotFoundError(task_id=params.after_task_id)
+            if after_task_bson.get("rank") is None:
+                raise TaskBadRequestError(f"Task with id {params.after_task_id} has no rank yet")
+            lower_rank = after_task_bson["rank"]
+
+        # Only the neighbour that ends up after the task is needed, read off the (account_id, active, rank) index
+        upper_task_bson = TaskRepository.collection().find_one(
+            {
+                "account_id": params.account_id,
+                "active": True,
+                "rank": {"$gt": lower_rank},
+                "_id": {"$ne": ObjectId(params.task_id)},
+            },
+            projection={"rank": 1},
+            sort=[("rank", 1), ("_id", 1)],
+        )
+        upper_rank = upper_task_bson["rank"] if upper_task_bson else None
+
+        if upper_rank is None:
+            rank = TaskUtil.get_rank_after(lower_rank) if lower_rank else TaskUtil.get_initial_rank()
+        elif not lower_rank:
+            rank = TaskUtil.get_rank_before(upper_rank)
+        else:
+            rank = TaskUtil.get_rank_between(lower_rank, upper_rank)
+
+        moved_task_bson = TaskRepository.collection().find_one_and_update(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            {"$set": {"rank": rank, "updated_at": datetime.now()}, "$inc": {"version": 1}},
+            projection={"title_prefixes": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if moved_task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        TaskCache.invalidate_account(account_id=params.account_id)
+        return TaskUtil.convert_task_bson_to_task(moved_task_bson)
+
+    @staticmethod
+    def add_task_tags(*, params: AddTaskTagsParams) -> Task:
+        tags = TaskUtil.normalize_tags(params.tags)
+        previous_task_bson = TaskRepository.collection().find_one_and_update(
+            {
+                "_id": ObjectId(params.task_id),
+                "account_id": params.account_id,
+                "active": True,
+                # Caps the array without a prior read: the update only applies while every requested tag fits
+                f"tags.{TASK_TAGS_MAX_PER_TASK - len(tags)}": {"$exists": False},
+            },
+            {"$addToSet": {"tags": {"$each": tags}}, "$set": {"updated_at": datetime.now()}, "$inc": {"version": 1}},
+            projection={"title_prefixes": 0},
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if previous_task_bson is None:
+            if TaskRepository.collection().find_one(
+                {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+                projection={"_id": 1},
+            ):
+                raise TaskBadRequestError(f"A task cannot have more than {TASK_TAGS_MAX_PER_TASK} tags")
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        # The pre-image tells exactly which tags this write added, so the counts never double count a retry
+        previous_tags = previous_task_bson.get("tags", [])
+        added_tags = [tag for tag in tags if tag not in previous_tags]
+        TaskTagCountWriter.increment_tag_counts(account_id=params.account_id, tag_deltas={tag: 1 for tag in added_tags})
+        TaskCache.invalidate_account(account_id=params.account_id)
+
+        return TaskUtil.convert_task_bson_to_task(
+            {
+                **previous_task_bson,
+                "tags": [*previous_tags, *added_tags],
+                "version": previous_task_bson.get("version", 0) + 1,
+            }
+        )
+
+    @staticmethod
+    def remove_task_tag(*, params: RemoveTaskTagParams) -> Task:
+        tag = TaskUtil.normalize_tag(params.tag)
+        previous_task_bson = TaskRepository.collection().find_one_and_update(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            {"$pull": {"tags": tag}, "$set": {"updated_at": datetime.now()}, "$inc": {"version": 1}},
+            projection={"title_prefixes": 0},
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if previous_task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        previous_tags = previous_task_bson.get("tags", [])
+        if tag in previous_tags:
+            TaskTagCountWriter.increment_tag_counts(account_id=params.account_id, tag_deltas={tag: -1})
+        TaskCache.invalidate_account(account_id=params.account_id)
+
+        return TaskUtil.convert_task_bson_to_task(
+            {
+                **previous_task_bson,
+                "tags": [previous_tag for previous_tag in previous_tags if previous_tag != tag],
+                "version": previous_task_bson.get("version", 0) + 1,
+            }
+        )
+
+    @staticmethod
+    def batch_write_tasks(*, params: BatchWriteTasksParams) -> TaskBatchWriteResult:
+        now = datetime.now()
+        results: dict[int, TaskBatchOperationResult] = {}
+        write_requests: list[Union[InsertOne, UpdateOne]] = []
+        write_request_indexes: list[int] = []
+        batched_task_ids: set[str] = set()
+        # Stamped on every update and delete, so the outcome of each one can be recovered if some did not match
+        batch_write_id = ObjectId()
+        existing_task_tags = TaskWriter._get_existing_task_tags(params=params)
+
+        for index, operation in enumerate(params.operations):
+            error_message = TaskUtil.validate_batch_operation(operation)
+            if (
+                error_message is None
+                and operation.op != TaskBatchOperationType.CREATE
+                and operation.task_id in batched_task_ids
+            ):
+                error_message = f"Task with id {operation.task_id} appears more than once in the batch."
+
+            if error_message is not None:
+                results[index] = TaskWriter._build_batch_failure(
+                    index=index, operation=operation, code=TaskErrorCode.BAD_REQUEST, message=error_message
+                )
+                continue
+
+            title = str(operation.title)
+            description = str(operation.description)
+            if operation.op == TaskBatchOperationType.CREATE:
+                task_id = ObjectId()
+                task_bson = TaskModel(
+                    account_id=params.account_id,
+                    created_at=now,
+                    description=description,
+                    id=task_id,
+                    rank=TaskUtil.get_append_rank(now, task_id),
+                    title=title,
+                    title_prefixes=TaskUtil.build_title_prefixes(title),
+                    updated_at=now,
+                ).to_bson()
+                write_requests.append(InsertOne(task_bson))
+                results[index] = TaskBatchOperationResult(
+                    index=index, op=operation.op, success=True, task_id=str(task_id)
+                )
+                write_request_indexes.append(index)
+                continue
+
+            task_id_str = str(operation.task_id)
+            batched_task_ids.add(task_id_str)
+            if task_id_str not in existing_task_tags:
+                results[index] = TaskWriter._build_batch_failure(
+                    index=index,
+                    operation=operation,
+                    code=TaskErrorCode.NOT_FOUND,
+                    message=f"Task with id {task_id_str} not found.",
+                )
+                continue
+
+            task_filter = {"_id": ObjectId(task_id_str), "account_id": params.account_id, "active": True}
+            update: dict[str, Any]
+            if operation.op == TaskBatchOperationType.UPDATE:
+                update = {
+                    "batch_write_id": batch_write_id,
+                    "description": description,
+                    "title": title,
+                    "title_prefixes": TaskUtil.build_title_prefixes(title),
+                    "updated_at": now,
+                }
+            else:
+                update = {"active": False, "batch_write_id": batch_write_id, "updated_at": now}
+            write_requests.append(UpdateOne(task_filter, {"$set": update, "$inc": {"version": 1}}))
+            results[index] = TaskBatchOperationResult(index=index, op=operation.op, success=True, task_id=task_id_str)
+            write_request_indexes.append(index)
+
+        if write_requests:
+            try:
+                matched_count = TaskRepository.collection().bulk_write(write_requests, ordered=False).matched_count
+            except BulkWriteError as e:
+                matched_count = e.details.get("nMatched", 0)
+                for write_error in e.details.get("writeErrors", []):
+                    index = write_request_indexes[write_error["index"]]
+                    results[index] = TaskWriter._build_batch_failure(
+                        index=index,
+                        operation=params.operations[index],
+                        code=TaskErrorCode.BAD_REQUEST,
+                        message=write_error.get("errmsg", "Write failed"),
+                    )
+
+            TaskWriter._reconcile_unmatched_batch_writes(
+                account_id=params.account_id,
+                batch_write_id=batch_write_id,
+                matched_count=int(matched_count),
+                operations=params.operations,
+                results=results,
+                write_request_indexes=write_request_indexes,
+            )
+
+        ordered_results = [results[index] for index in range(len(params.operations))]
+        active_task_delta = sum(
+            1 if result.op == TaskBatchOperationType.CREATE else -1
+            for result in ordered_results
+            if result.success and result.op != TaskBatchOperationType.UPDATE
+        )
+        if active_task_delta:
+            TaskCountWriter.increment_active_task_count(account_id=params.account_id, delta=active_task_delta)
+
+        tag_deltas: dict[str, int] = {}
+        for result in ordered_results:
+            if result.success and result.op == TaskBatchOperationType.DELETE:
+                for tag in existing_task_tags[str(result.task_id)]:
+                    tag_deltas[tag] = tag_deltas.get(tag, 0) - 1
+        TaskTagCountWriter.increment_tag_counts(account_id=params.account_id, tag_deltas=tag_deltas)
+
+        success_count = sum(1 for result in ordered_results if result.success)
+        if success_count:
+            TaskCache.invalidate_account(account_id=params.account_id)
+
+        return TaskBatchWriteResult(
+            results=ordered_results, success_count=success_count, error_count=len(ordered_results) - success_count
+        )
+
+    @staticmethod
+    def import_tasks(*, params: ImportTasksParams) -> Iterator[TaskImportProgress]:
+        chunk = 0
+        imported_count = 0
+        error_count = 0
+        tasks_bson: list[dict[str, Any]] = []
+        errors: list[TaskImportRowError] = []
+
+        rows = TaskUtil.iter_import_rows(lines=params.lines, import_format=params.import_format)
+        for line_number, row in rows:
+            error_message = TaskUtil.validate_import_row(row)
+            if error_message is not None or row is None:
+                errors.append(TaskImportRowError(line_number=line_number, message=str(error_message)))
+            else:
+                now = datetime.now()
+                task_id = ObjectId()
+                tasks_bson.append(
+                    TaskModel(
+                        account_id=params.account_id,
+                        created_at=now,
+                        description=row["description"],
+                        id=task_id,
+                        rank=TaskUtil.get_append_rank(now, task_id),
+                        title=row["title"],
+                        title_prefixes=TaskUtil.build_title_prefixes(row["title"]),
+                        updated_at=now,
+                    ).to_bson()
+                )
+
+            if len(tasks_bson) + len(errors) >= params.chunk_size:
+                chunk += 1
+                inserted_count = TaskWriter._insert_import_chunk(account_id=params.account_id, tasks_bson=tasks_bson)
+                imported_count += inserted_count
+                error_count += len(errors) + len(tasks_bson) - inserted_count
+                yield TaskImportProgress(
+                    chunk=chunk, imported_count=imported_count, error_count=error_count, errors=errors
+                )
+                tasks_bson, errors = [], []
+
+        if tasks_bson or errors:
+            chunk += 1
+            inserted_count = TaskWriter._insert_import_chunk(account_id=params.account_id, tasks_bson=tasks_bson)
+            imported_count += inserted_count
+            error_count += len(errors) + len(tasks_bson) - inserted_count
+            yield TaskImportProgress(chunk=chunk, imported_count=imported_count, error_count=error_count, errors=errors)
+
+    @staticmethod
+    def backfill_title_prefixes(*, batch_size: int) -> int:
+        updated_count = 0
+        cursor = TaskRepository.collection().find(
+            {"title_prefixes": {"$exists": False}}, projection={"title": 1}, batch_size=batch_size
+        )
+
+        updates: list[UpdateOne] = []
+        for task_bson in cursor:
+            updates.append(
+                UpdateOne(
+                    {"_id": task_bson["_id"]},
+                    {"$set": {"title_prefixes": TaskUtil.build_title_prefixes(task_bson.get("title", ""))}},
+                )
+            )
+            if len(updates) >= batch_size:
+                updated_count += TaskRepository.collection().bulk_write(updates, ordered=False).modified_count
+                updates = []
+
+        if updates:
+            updated_count += TaskRepository.collection().bulk_write(updates, ordered=False).modified_count
+
+        return updated_count
+
+    @staticmethod
+    def _insert_import_chunk(*, account_id: str, tasks_bson: list[dict[str, Any]]) -> int:
+        if not tasks_bson:
+            return 0
+
+        try:
+            inserted_count = len(TaskRepository.collection().insert_many(tasks_bson, ordered=False).inserted_ids)
+        except BulkWriteError as e:
+            inserted_count = int(e.details.get("nInserted", 0))
+
+        if inserted_count:
+            TaskCountWriter.increment_active_task_count(account_id=account_id, delta=inserted_count)
+            TaskCache.invalidate_account(account_id=account_id)
+        return inserted_count
+
+    @staticmethod
+    def backfill_ranks(*, batch_size: int) -> int:
+        updated_count = 0
+        next_ranks: dict[str, str] = {}
+        # Unranked tasks are appended after each account's ranked ones, oldest first
+        cursor = (
+            TaskRepository.collection()
+            .find(
+                {"rank": {"$exists": False}}, projection={"account_id": 1}, batch_size=batch_size, allow_disk_use=True
+            )
+            .sort([("account_id", 1), ("created_at", 1), ("_id", 1)])
+        )
+
+        updates: list[UpdateOne] = []
+        updated_account_ids: set[str] = set()
+        for task_bson in cursor:
+            account_id = task_bson["account_id"]
+            if account_id not in next_ranks:
+                next_ranks[account_id] = TaskWriter._get_next_rank(account_id=account_id)
+            # A new rank changes the task body, so it gets a new version for ETags and an updated_at for the changes feed
+            updates.append(
+                UpdateOne(
+                    {"_id": task_bson["_id"], "rank": {"$exists": False}},
+                    {"$set": {"rank": next_ranks[account_id], "updated_at": datetime.now()}, "$inc": {"version": 1}},
+                )
+            )
+            updated_account_ids.add(account_id)
+            next_ranks[account_id] = TaskUtil.get_rank_after(next_ranks[account_id])
+            if len(updates) >= batch_size:
+                updated_count += TaskWriter._write_backfilled_ranks(updates=updates, account_ids=updated_account_ids)
+                updates = []
+                updated_account_ids = set()
+
+        if updates:
+            updated_count += TaskWriter._write_backfilled_ranks(updates=updates, account_ids=updated_account_ids)
+
+        return updated_count
+
+    @staticmethod
+    def _write_backfilled_ranks(*, updates: list[UpdateOne], account_ids: set[str]) -> int:
+        modified_count = int(TaskRepository.collection().bulk_write(updates, ordered=False).modified_count)
+        for account_id in account_ids:
+            TaskCache.invalidate_account(account_id=account_id)
+        return modified_count
+
+    @staticmethod
+    def _get_next_rank(*, account_id: str) -> str:
+        # Only the backfill reads the last rank, once per account, to append unranked tasks after the ranked ones
+        last_task_bson = TaskRepository.collection().find_one(
+            {"account_id": account_id, "active": True, "rank": {"$exists": True}},
+            projection={"rank": 1},
+            sort=[("rank", -1), ("_id", -1)],
+        )
+        if last_task_bson is None:
+            return TaskUtil.get_initial_rank()
+        return TaskUtil.get_rank_after(last_task_bson["rank"])
+
+    @staticmethod
+    def _get_versioned_task_filter(*, account_id: str, task_id: str, expected_version: Optional[int]) -> dict[str, Any]:
+        task_filter: dict[str, Any] = {"_id": ObjectId(task_id), "account_id": account_id, "active": True}
+        if expected_version is not None:
+            # Tasks written before versioning have no version field and read as version 0
+            task_filter["version"] = expected_version if expected_version else {"$in": [0, None]}
+        return task_filter
+
+    @staticmethod
+    def _raise_write_miss(*, account_id: str, task_id: str, expected_version: Optional[int]) -> NoReturn:
+        # Only conditional writes need the extra lookup to tell a stale version apart from a missing task
+        if expected_version is not None and TaskRepository.collection().find_one(
+            {"_id": ObjectId(task_id), "account_id": account_id, "active": True}, projection={"_id": 1}
+        ):
+            raise TaskPreconditionFailedError(task_id=task_id)
+        raise TaskNotFoundError(task_id=task_id)
+
+    @staticmethod
+    def _get_existing_task_tags(*, params: BatchWriteTasksParams) -> dict[str, list[str]]:
+        task_ids = [
+            ObjectId(operation.task_id)
+            for operation in params.operations
+            if operation.op != TaskBatchOperationType.CREATE
+            and operation.task_id
+            and ObjectId.is_valid(operation.task_id)
+        ]
+        if not task_ids:
+            return {}
+
+        # Tags come along so deletes can decrement the tag counts without another lookup
+        existing_tasks = TaskRepository.collection().find(
+            {"_id": {"$in": task_ids}, "account_id": params.account_id, "active": True}, projection={"tags": 1}
+        )
+        return {str(task_bson["_id"]): task_bson.get("tags", []) for task_bson in existing_tasks}
+
+    @staticmethod
+    def _reconcile_unmatched_batch_writes(
+        *,
+        account_id: str,
+        batch_write_id: ObjectId,
+        matched_count: int,
+        operations: list[TaskBatchOperation],
+        results: dict[int, TaskBatchOperationResult],
+        write_request_indexes: list[int],
+    ) -> None:
+        update_indexes = [
+            index
+            for index in write_request_indexes
+            if operations[index].op != TaskBatchOperationType.CREATE and results[index].success
+        ]
+        if matched_count >= len(update_indexes):
+            return
+
+        # Tasks deleted between the existence check and the bulk write no longer match their filter. Deletes are
+        # final, so a task that is still active or carries this batch's stamp was written by this batch.
+        written_tasks = TaskRepository.collection().find(
+            {"_id": {"$in": [ObjectId(results[index].task_id) for index in update_indexes]}, "account_id": account_id},
+            projection={"active": 1, "batch_write_id": 1},
+        )
+        written_tasks_by_id = {str(task_bson["_id"]): task_bson for task_bson in written_tasks}
+        for index in update_indexes:
+            task_id = str(results[index].task_id)
+            task_bson = written_tasks_by_id.get(task_id)
+            if task_bson is not None and (
+                task_bson.get("batch_write_id") == batch_write_id
+                or (operations[index].op == TaskBatchOperationType.UPDATE and task_bson.get("active", True))
+            ):
+                continue
+
+            results[index] = TaskWriter._build_batch_failure(
+                index=index,
+                operation=operations[index],
+                code=TaskErrorCode.NOT_FOUND,
+                message=f"Task with id {task_id} not found.",
+            )
+
+    @staticmethod
+    def _build_batch_failure(
+        *, index: int, operation: TaskBatchOperation, code: str, message: str
+    ) -> TaskBatchOperationResult:
+        return TaskBatchOperationResult(
+            index=index,
+            op=operation.op,
+            success=False,
+            task_id=operation.task_id,
+            error=TaskBatchOperationError(code=code, message=message),
+        )
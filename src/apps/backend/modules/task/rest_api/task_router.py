@@ -1,6 +1,19 @@
 from flask import Blueprint
 
-from modules.task.rest_api.task_view import TaskView
+from modules.task.rest_api.task_view import (
+    TaskAutocompleteView,
+    TaskBatchGetView,
+    TaskBatchView,
+    TaskChangesView,
+    TaskCommentView,
+    TaskEventsView,
+    TaskExportView,
+    TaskImportView,
+    TaskMoveView,
+    TaskSearchView,
+    TaskTagsView,
+    TaskView,
+)
 
 
 class TaskRouter:
@@ -14,5 +27,65 @@ class TaskRouter:
             view_func=TaskView.as_view("task_view_by_id"),
             methods=["GET", "PATCH", "DELETE"],
         )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>:move",
+            view_func=TaskMoveView.as_view("task_move_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/tags", view_func=TaskTagsView.as_view("task_tags_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/tags",
+            view_func=TaskTagsView.as_view("task_tags_view_by_task"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/tags/<tag>",
+            view_func=TaskTagsView.as_view("task_tag_view"),
+            methods=["DELETE"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/comments",
+            view_func=TaskCommentView.as_view("task_comment_view"),
+            methods=["GET", "POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/comments/<comment_id>",
+            view_func=TaskCommentView.as_view("task_comment_view_by_id"),
+            methods=["PATCH", "DELETE"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:batch", view_func=TaskBatchView.as_view("task_batch_view"), methods=["POST"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:batchGet",
+            view_func=TaskBatchGetView.as_view("task_batch_get_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:import",
+            view_func=TaskImportView.as_view("task_import_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/export", view_func=TaskExportView.as_view("task_export_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/search", view_func=TaskSearchView.as_view("task_search_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/autocomplete",
+            view_func=TaskAutocompleteView.as_view("task_autocomplete_view"),
+            methods=["GET"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/changes",
+            view_func=TaskChangesView.as_view("task_changes_view"),
+            methods=["GET"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/events", view_func=TaskEventsView.as_view("task_events_view"), methods=["GET"]
+        )
 
         return blueprint
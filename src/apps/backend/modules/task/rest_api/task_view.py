@@ -1,26 +1,79 @@
-from dataclasses import asdict
-from typing import Optional
+import codecs
+import hashlib
+import json
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Union
 
-from flask import jsonify, request
+from flask import Response, jsonify, request, stream_with_context
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
 from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
+from modules.application.common.types import (
+    CursorPaginationParams,
+    CursorPaginationResult,
+    PaginationParams,
+    PaginationResult,
+    SortDirection,
+    SortParams,
+)
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.task.errors import TaskBadRequestError
+from modules.config.config_service import ConfigService
+from modules.idempotency.rest_api.idempotency_middleware import idempotency_middleware
+from modules.task.constants import (
+    TASK_AUTOCOMPLETE_MAX_SIZE,
+    TASK_CHANGES_DEFAULT_SIZE,
+    TASK_CHANGES_MAX_SIZE,
+    TASK_COMMENT_MAX_LENGTH,
+    TASK_COMMENTS_MAX_SIZE,
+    TASK_FIELD_PRESETS,
+    TASK_SEARCH_MAX_SIZE,
+    TASK_SEARCH_QUERY_MAX_LENGTH,
+    TASK_SORT_FIELDS,
+    TASK_TAG_MAX_LENGTH,
+    TASK_TAGS_FILTER_MAX,
+    TASK_TAGS_MAX_PER_TASK,
+)
+from modules.task.errors import TaskBadRequestError, TaskPreconditionFailedError
 from modules.task.task_service import TaskService
 from modules.task.types import (
+    AddTaskTagsParams,
+    AutocompleteTasksParams,
+    BatchWriteTasksParams,
+    CreateTaskCommentParams,
     CreateTaskParams,
+    DeleteTaskCommentParams,
     DeleteTaskParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
     GetPaginatedTasksParams,
+    GetTaskChangesParams,
+    GetTaskCommentsParams,
     GetTaskParams,
+    GetTasksByIdsParams,
+    GetTaskTagCountsParams,
+    ImportTasksParams,
+    MoveTaskParams,
+    RemoveTaskTagParams,
+    SearchTasksParams,
+    StreamTaskChangesParams,
+    Task,
+    TaskBatchOperation,
+    TaskChangeEvent,
+    TaskExportFormat,
+    TaskField,
+    TaskFilterParams,
+    TaskImportFormat,
+    TaskTagsMatch,
+    UpdateTaskCommentParams,
     UpdateTaskParams,
 )
 
 
 class TaskView(MethodView):
     @access_auth_middleware
+    @idempotency_middleware
     def post(self, account_id: str) -> ResponseReturnValue:
         request_data = request.get_json()
 
@@ -40,18 +93,36 @@ class TaskView(MethodView):
         created_task = TaskService.create_task(params=create_task_params)
         task_dict = asdict(created_task)
 
-        return jsonify(task_dict), 201
+        response = jsonify(task_dict)
+        response.set_etag(self._build_task_etag(created_task.id, created_task.version, None))
+        return response, 201
 
     @access_auth_middleware
     def get(self, account_id: str, task_id: Optional[str] = None) -> ResponseReturnValue:
         if task_id:
-            task_params = GetTaskParams(account_id=account_id, task_id=task_id)
+            fields = self._get_requested_fields(default=None)
+            task_params = GetTaskParams(account_id=account_id, task_id=task_id, fields=fields)
+
+            # Revalidation only needs the stored version, so an unchanged task is never loaded or serialized
+            if request.if_none_match:
+                task_version = TaskService.get_task_version(params=task_params)
+                etag = self._build_task_etag(task_id, task_version, fields)
+                if request.if_none_match.contains_weak(etag):
+                    return self._make_not_modified_response(etag)
+
             task = TaskService.get_task(params=task_params)
-            task_dict = asdict(task)
-            return jsonify(task_dict), 200
+            task_dict = self._serialize_task(task, fields)
+
+            response = jsonify(task_dict)
+            response.set_etag(self._build_task_etag(task.id, task.version, fields))
+            return response, 200
         else:
+            fields = self._get_requested_fields(default=None)
+            sort_params = self._get_requested_sort_params()
+            filter_params = self._get_requested_filter_params()
             page = request.args.get("page", type=int)
             size = request.args.get("size", type=int)
+            cursor = request.args.get("cursor")
 
             if page is not None and page < 1:
                 raise TaskBadRequestError("Page must be greater than 0")
@@ -59,19 +130,170 @@ class TaskView(MethodView):
             if size is not None and size < 1:
                 raise TaskBadRequestError("Size must be greater than 0")
 
+            if cursor is not None:
+                if page is not None:
+                    raise TaskBadRequestError("Page and cursor cannot be used together")
+
+                cursor_pagination_params = CursorPaginationParams(
+                    size=size if size is not None else DEFAULT_PAGINATION_PARAMS.size, cursor=cursor or None
+                )
+                cursor_tasks_params = GetCursorPaginatedTasksParams(
+                    account_id=account_id,
+                    pagination_params=cursor_pagination_params,
+                    sort_params=sort_params,
+                    fields=fields,
+                    filter_params=filter_params,
+                )
+
+                cursor_pagination_result = TaskService.get_cursor_paginated_tasks(params=cursor_tasks_params)
+
+                return self._make_task_list_response(cursor_pagination_result, fields)
+
             if page is None:
                 page = DEFAULT_PAGINATION_PARAMS.page
             if size is None:
                 size = DEFAULT_PAGINATION_PARAMS.size
 
+            include_total = request.args.get("include_total", "true").lower() != "false"
+
             pagination_params = PaginationParams(page=page, size=size, offset=0)
-            tasks_params = GetPaginatedTasksParams(account_id=account_id, pagination_params=pagination_params)
+            tasks_params = GetPaginatedTasksParams(
+                account_id=account_id,
+                pagination_params=pagination_params,
+                sort_params=sort_params,
+                include_total=include_total,
+                fields=fields,
+                filter_params=filter_params,
+            )
 
             pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
 
-            response_data = asdict(pagination_result)
+            return self._make_task_list_response(pagination_result, fields)
+
+    @staticmethod
+    def _get_requested_fields(default: Optional[List[TaskField]]) -> Optional[List[TaskField]]:
+        fields_arg = request.args.get("fields")
+        if fields_arg is None:
+            return default
+
+        if fields_arg in TASK_FIELD_PRESETS:
+            return TASK_FIELD_PRESETS[fields_arg]
+
+        requested_fields = [field.strip() for field in fields_arg.split(",") if field.strip()]
+        invalid_fields = [field for field in requested_fields if field not in list(TaskField)]
+        if not requested_fields or invalid_fields:
+            raise TaskBadRequestError(f"Fields must be a preset or a subset of {', '.join(TaskField)}")
+
+        return [TaskField(field) for field in dict.fromkeys(requested_fields)]
+
+    @staticmethod
+    def _get_requested_sort_params() -> Optional[SortParams]:
+        sort_by = request.args.get("sort_by")
+        sort_direction = request.args.get("sort_direction")
+        if sort_by is None:
+            if sort_direction is not None:
+                raise TaskBadRequestError("Sort direction requires sort_by")
+            return None
+
+        if sort_by not in TASK_SORT_FIELDS:
+            raise TaskBadRequestError(f"Sort field must be one of {', '.join(TASK_SORT_FIELDS)}")
+
+        try:
+            direction = SortDirection.from_string(sort_direction or SortDirection.DESC.string_value)
+        except ValueError:
+            raise TaskBadRequestError("Sort direction must be asc or desc")
+
+        return SortParams(sort_by=sort_by, sort_direction=direction)
+
+    @staticmethod
+    def _get_requested_filter_params() -> Optional[TaskFilterParams]:
+        filter_params = TaskFilterParams(
+            created_after=TaskView._get_datetime_arg("created_after"),
+            created_before=TaskView._get_datetime_arg("created_before"),
+            title_prefix=request.args.get("title_prefix") or None,
+            updated_after=TaskView._get_datetime_arg("updated_after"),
+            updated_before=TaskView._get_datetime_arg("updated_before"),
+            tags=TaskView._get_requested_tags_filter(),
+            tags_match=TaskView._get_requested_tags_match(),
+        )
+        return filter_params if filter_params != TaskFilterParams() else None
+
+    @staticmethod
+    def _get_requested_tags_filter() -> Optional[List[str]]:
+        tags_arg = request.args.get("tags")
+        if tags_arg is None:
+            return None
+
+        tags = [tag.strip() for tag in tags_arg.split(",") if tag.strip()]
+        if not tags or len(tags) > TASK_TAGS_FILTER_MAX:
+            raise TaskBadRequestError(f"Tags filter must contain between 1 and {TASK_TAGS_FILTER_MAX} tags")
+        return tags
 
-            return jsonify(response_data), 200
+    @staticmethod
+    def _get_requested_tags_match() -> TaskTagsMatch:
+        tags_match = request.args.get("tags_match", TaskTagsMatch.ANY)
+        if tags_match not in list(TaskTagsMatch):
+            raise TaskBadRequestError(f"Tags match must be one of {', '.join(TaskTagsMatch)}")
+        return TaskTagsMatch(tags_match)
+
+    @staticmethod
+    def _get_datetime_arg(name: str) -> Optional[datetime]:
+        value = request.args.get(name)
+        if value is None:
+            return None
+
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            raise TaskBadRequestError(f"{name} must be an ISO 8601 datetime")
+
+    @staticmethod
+    def _serialize_task(task: Task, fields: Optional[List[TaskField]]) -> dict[str, Any]:
+        if fields is None:
+            return asdict(task)
+        return {field: getattr(task, field) for field in fields}
+
+    @staticmethod
+    def _build_task_etag(task_id: str, version: int, fields: Optional[List[TaskField]]) -> str:
+        # Each field selection is a different representation of the task, so it is part of the tag
+        fields_suffix = f".{'-'.join(fields)}" if fields is not None else ""
+        return f"{task_id}.{version}{fields_suffix}"
+
+    @staticmethod
+    def _make_task_list_response(
+        result: Union[PaginationResult[Task], CursorPaginationResult[Task]], fields: Optional[List[TaskField]]
+    ) -> ResponseReturnValue:
+        response_data = asdict(replace(result, items=[]))
+        # The page metadata and the version of every item on it fully determine the response body
+        etag_source = repr((response_data, fields, [(task.id, task.version) for task in result.items]))
+        etag = hashlib.sha1(etag_source.encode("utf-8")).hexdigest()
+        if request.if_none_match.contains_weak(etag):
+            return TaskView._make_not_modified_response(etag)
+
+        response_data["items"] = [TaskView._serialize_task(task, fields) for task in result.items]
+        response = jsonify(response_data)
+        response.set_etag(etag)
+        return response, 200
+
+    @staticmethod
+    def _make_not_modified_response(etag: str) -> ResponseReturnValue:
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    @staticmethod
+    def _get_expected_version(task_id: str) -> Optional[int]:
+        if not request.if_match or request.if_match.star_tag:
+            return None
+
+        for etag in request.if_match:
+            etag_task_id, _, etag_rest = etag.partition(".")
+            etag_version = etag_rest.split(".")[0]
+            if etag_task_id == task_id and etag_version.isdigit():
+                return int(etag_version)
+
+        # None of the tags can ever match this task, so the precondition fails without touching the database
+        raise TaskPreconditionFailedError(task_id=task_id)
 
     @access_auth_middleware
     def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
@@ -87,18 +309,360 @@ class TaskView(MethodView):
             raise TaskBadRequestError("Description is required")
 
         update_task_params = UpdateTaskParams(
-            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+            account_id=account_id,
+            task_id=task_id,
+            title=request_data["title"],
+            description=request_data["description"],
+            expected_version=self._get_expected_version(task_id),
         )
 
         updated_task = TaskService.update_task(params=update_task_params)
         task_dict = asdict(updated_task)
 
-        return jsonify(task_dict), 200
+        response = jsonify(task_dict)
+        response.set_etag(self._build_task_etag(updated_task.id, updated_task.version, None))
+        return response, 200
 
     @access_auth_middleware
     def delete(self, account_id: str, task_id: str) -> ResponseReturnValue:
-        delete_params = DeleteTaskParams(account_id=account_id, task_id=task_id)
+        delete_params = DeleteTaskParams(
+            account_id=account_id, task_id=task_id, expected_version=self._get_expected_version(task_id)
+        )
 
         TaskService.delete_task(params=delete_params)
 
         return "", 204
+
+
+class TaskMoveView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None or "after_id" not in request_data:
+            raise TaskBadRequestError("after_id is required, use null to move the task first")
+
+        after_task_id = request_data["after_id"]
+        if after_task_id is not None and not isinstance(after_task_id, str):
+            raise TaskBadRequestError("after_id must be a task id or null")
+
+        moved_task = TaskService.move_task(
+            params=MoveTaskParams(account_id=account_id, task_id=task_id, after_task_id=after_task_id)
+        )
+
+        response = jsonify(asdict(moved_task))
+        response.set_etag(TaskView._build_task_etag(moved_task.id, moved_task.version, None))
+        return response, 200
+
+
+class TaskTagsView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        tag_counts = TaskService.get_task_tag_counts(params=GetTaskTagCountsParams(account_id=account_id))
+
+        return jsonify({"items": [asdict(tag_count) for tag_count in tag_counts]}), 200
+
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        tags = request_data.get("tags")
+        if not isinstance(tags, list) or not tags or len(tags) > TASK_TAGS_MAX_PER_TASK:
+            raise TaskBadRequestError(f"Tags must be a list of 1 to {TASK_TAGS_MAX_PER_TASK} tags")
+
+        if not all(isinstance(tag, str) and 0 < len(tag.strip()) <= TASK_TAG_MAX_LENGTH for tag in tags):
+            raise TaskBadRequestError(
+                f"Each tag must be a non-empty string of at most {TASK_TAG_MAX_LENGTH} characters"
+            )
+
+        task = TaskService.add_task_tags(params=AddTaskTagsParams(account_id=account_id, task_id=task_id, tags=tags))
+
+        response = jsonify(asdict(task))
+        response.set_etag(TaskView._build_task_etag(task.id, task.version, None))
+        return response, 200
+
+    @access_auth_middleware
+    def delete(self, account_id: str, task_id: str, tag: str) -> ResponseReturnValue:
+        task = TaskService.remove_task_tag(params=RemoveTaskTagParams(account_id=account_id, task_id=task_id, tag=tag))
+
+        response = jsonify(asdict(task))
+        response.set_etag(TaskView._build_task_etag(task.id, task.version, None))
+        return response, 200
+
+
+class TaskCommentView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        size = request.args.get("size", DEFAULT_PAGINATION_PARAMS.size, type=int)
+
+        if size < 1 or size > TASK_COMMENTS_MAX_SIZE:
+            raise TaskBadRequestError(f"Size must be between 1 and {TASK_COMMENTS_MAX_SIZE}")
+
+        comments_params = GetTaskCommentsParams(
+            account_id=account_id,
+            task_id=task_id,
+            pagination_params=CursorPaginationParams(size=size, cursor=request.args.get("cursor") or None),
+        )
+
+        comments_result = TaskService.get_task_comments(params=comments_params)
+
+        return jsonify(asdict(comments_result)), 200
+
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        content = self._get_requested_content()
+
+        comment = TaskService.create_task_comment(
+            params=CreateTaskCommentParams(account_id=account_id, task_id=task_id, content=content)
+        )
+
+        return jsonify(asdict(comment)), 201
+
+    @access_auth_middleware
+    def patch(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+        content = self._get_requested_content()
+
+        comment = TaskService.update_task_comment(
+            params=UpdateTaskCommentParams(
+                account_id=account_id, task_id=task_id, comment_id=comment_id, content=content
+            )
+        )
+
+        return jsonify(asdict(comment)), 200
+
+    @access_auth_middleware
+    def delete(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+        TaskService.delete_task_comment(
+            params=DeleteTaskCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+        )
+
+        return "", 204
+
+    @staticmethod
+    def _get_requested_content() -> str:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        content = request_data.get("content")
+        if not isinstance(content, str) or not content.strip():
+            raise TaskBadRequestError("Content is required")
+
+        if len(content) > TASK_COMMENT_MAX_LENGTH:
+            raise TaskBadRequestError(f"Content cannot be longer than {TASK_COMMENT_MAX_LENGTH} characters")
+
+        return content
+
+
+class TaskBatchView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        operations = request_data.get("operations")
+        if not isinstance(operations, list) or not operations:
+            raise TaskBadRequestError("Operations must be a non-empty list")
+
+        max_operations = ConfigService[int].get_value(key="tasks.batch_max_operations")
+        if len(operations) > max_operations:
+            raise TaskBadRequestError(f"A batch cannot contain more than {max_operations} operations")
+
+        if not all(isinstance(operation, dict) for operation in operations):
+            raise TaskBadRequestError("Each operation must be an object")
+
+        batch_write_params = BatchWriteTasksParams(
+            account_id=account_id,
+            operations=[
+                TaskBatchOperation(
+                    op=operation.get("op"),
+                    description=operation.get("description"),
+                    task_id=operation.get("task_id"),
+                    title=operation.get("title"),
+                )
+                for operation in operations
+            ],
+        )
+
+        batch_write_result = TaskService.batch_write_tasks(params=batch_write_params)
+
+        return jsonify(asdict(batch_write_result)), 200
+
+
+class TaskBatchGetView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        task_ids = request_data.get("ids")
+        if not isinstance(task_ids, list) or not task_ids:
+            raise TaskBadRequestError("Ids must be a non-empty list")
+
+        if not all(isinstance(task_id, str) for task_id in task_ids):
+            raise TaskBadRequestError("Each id must be a string")
+
+        max_ids = ConfigService[int].get_value(key="tasks.batch_get_max_ids")
+        if len(task_ids) > max_ids:
+            raise TaskBadRequestError(f"A batch get cannot contain more than {max_ids} ids")
+
+        fields = TaskView._get_requested_fields(default=None)
+        batch_get_params = GetTasksByIdsParams(account_id=account_id, task_ids=task_ids, fields=fields)
+
+        batch_get_result = TaskService.get_tasks_by_ids(params=batch_get_params)
+
+        return (
+            jsonify(
+                {
+                    "items": [TaskView._serialize_task(task, fields) for task in batch_get_result.items],
+                    "missing_ids": batch_get_result.missing_ids,
+                }
+            ),
+            200,
+        )
+
+
+class TaskImportView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        default_format = TaskImportFormat.CSV if request.mimetype == "text/csv" else TaskImportFormat.NDJSON
+        import_format = request.args.get("format", default_format)
+        if import_format not in list(TaskImportFormat):
+            raise TaskBadRequestError(f"Format must be one of {', '.join(TaskImportFormat)}")
+
+        # The body is decoded line by line from the request stream so the payload is never held in memory
+        import_tasks_params = ImportTasksParams(
+            account_id=account_id,
+            chunk_size=ConfigService[int].get_value(key="tasks.import_chunk_size"),
+            import_format=TaskImportFormat(import_format),
+            lines=codecs.iterdecode(request.stream, "utf-8"),
+        )
+
+        progress = TaskService.import_tasks(params=import_tasks_params)
+
+        return Response(
+            stream_with_context(json.dumps(asdict(chunk_progress)) + "\n" for chunk_progress in progress),
+            mimetype="application/x-ndjson",
+        )
+
+
+class TaskExportView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        export_format = request.args.get("format", TaskExportFormat.NDJSON)
+        if export_format not in list(TaskExportFormat):
+            raise TaskBadRequestError(f"Format must be one of {', '.join(TaskExportFormat)}")
+
+        export_tasks_params = ExportTasksParams(
+            account_id=account_id,
+            batch_size=ConfigService[int].get_value(key="tasks.export_batch_size"),
+            export_format=TaskExportFormat(export_format),
+        )
+
+        rows = TaskService.export_tasks(params=export_tasks_params)
+
+        mimetype = "text/csv" if export_format == TaskExportFormat.CSV else "application/x-ndjson"
+        return Response(
+            stream_with_context(rows),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename=tasks.{export_format}"},
+        )
+
+
+class TaskSearchView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        query = request.args.get("q", "").strip()
+        size = request.args.get("size", DEFAULT_PAGINATION_PARAMS.size, type=int)
+
+        if not query:
+            raise TaskBadRequestError("Search query is required")
+
+        if len(query) > TASK_SEARCH_QUERY_MAX_LENGTH:
+            raise TaskBadRequestError(f"Search query cannot be longer than {TASK_SEARCH_QUERY_MAX_LENGTH} characters")
+
+        if size < 1 or size > TASK_SEARCH_MAX_SIZE:
+            raise TaskBadRequestError(f"Size must be between 1 and {TASK_SEARCH_MAX_SIZE}")
+
+        search_tasks_params = SearchTasksParams(
+            account_id=account_id,
+            pagination_params=CursorPaginationParams(size=size, cursor=request.args.get("cursor") or None),
+            query=query,
+        )
+
+        search_result = TaskService.search_tasks(params=search_tasks_params)
+
+        return jsonify(asdict(search_result)), 200
+
+
+class TaskAutocompleteView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        query = request.args.get("q", "")[:TASK_SEARCH_QUERY_MAX_LENGTH]
+        size = request.args.get("size", DEFAULT_PAGINATION_PARAMS.size, type=int)
+
+        if size < 1 or size > TASK_AUTOCOMPLETE_MAX_SIZE:
+            raise TaskBadRequestError(f"Size must be between 1 and {TASK_AUTOCOMPLETE_MAX_SIZE}")
+
+        autocomplete_params = AutocompleteTasksParams(account_id=account_id, query=query, size=size)
+
+        autocomplete_result = TaskService.autocomplete_tasks(params=autocomplete_params)
+
+        response = jsonify(asdict(autocomplete_result))
+        # Lets the browser answer repeated keystrokes (e.g. after a backspace) without a round trip
+        response.cache_control.private = True
+        response.cache_control.max_age = ConfigService[int].get_value(key="tasks.autocomplete_cache_max_age_seconds")
+        return response, 200
+
+
+class TaskChangesView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        size = request.args.get("size", TASK_CHANGES_DEFAULT_SIZE, type=int)
+
+        if size < 1 or size > TASK_CHANGES_MAX_SIZE:
+            raise TaskBadRequestError(f"Size must be between 1 and {TASK_CHANGES_MAX_SIZE}")
+
+        changes_params = GetTaskChangesParams(account_id=account_id, size=size, since=request.args.get("since") or None)
+
+        changes_result = TaskService.get_task_changes(params=changes_params)
+
+        return jsonify(asdict(changes_result)), 200
+
+
+class TaskEventsView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        stream_params = StreamTaskChangesParams(
+            account_id=account_id,
+            heartbeat_seconds=ConfigService[int].get_value(key="tasks.events.heartbeat_seconds"),
+            max_connections=ConfigService[int].get_value(key="tasks.events.max_connections_per_process"),
+            queue_size=ConfigService[int].get_value(key="tasks.events.queue_size"),
+        )
+
+        events = TaskService.stream_task_changes(params=stream_params)
+
+        return Response(
+            stream_with_context(self._format_server_sent_events(events)),
+            mimetype="text/event-stream",
+            # Proxies must not buffer or cache the stream
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @staticmethod
+    def _format_server_sent_events(events: Iterator[Optional[TaskChangeEvent]]) -> Iterator[str]:
+        for event in events:
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            event_data = json.dumps(asdict(event), default=lambda value: value.isoformat())
+            yield f"event: {event.type}\ndata: {event_data}\n\n"
@@ -1,13 +1,48 @@
-from modules.application.common.types import PaginationResult
+from typing import Iterator, List, Optional
+
+from modules.application.common.types import CursorPaginationResult, PaginationResult
+from modules.task.internal.task_cache import TaskCache
+from modules.task.internal.task_comment_reader import TaskCommentReader
+from modules.task.internal.task_comment_writer import TaskCommentWriter
+from modules.task.internal.task_count_writer import TaskCountWriter
 from modules.task.internal.task_reader import TaskReader
+from modules.task.internal.task_tag_count_reader import TaskTagCountReader
 from modules.task.internal.task_writer import TaskWriter
 from modules.task.types import (
+    AddTaskTagsParams,
+    AutocompleteTasksParams,
+    BatchWriteTasksParams,
+    CreateTaskCommentParams,
     CreateTaskParams,
+    DeleteTaskCommentParams,
     DeleteTaskParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
     GetPaginatedTasksParams,
+    GetTaskChangesParams,
+    GetTaskCommentsParams,
     GetTaskParams,
+    GetTasksByIdsParams,
+    GetTaskTagCountsParams,
+    ImportTasksParams,
+    MoveTaskParams,
+    RemoveTaskTagParams,
+    SearchTasksParams,
+    StreamTaskChangesParams,
     Task,
+    TaskAutocompleteResult,
+    TaskBatchGetResult,
+    TaskBatchWriteResult,
+    TaskCacheStats,
+    TaskChangeEvent,
+    TaskChangesResult,
+    TaskComment,
+    TaskCountReconciliationResult,
     TaskDeletionResult,
+    TaskImportProgress,
+    TaskSearchResult,
+    TaskTagCount,
+    UpdateTaskCommentParams,
     UpdateTaskParams,
 )
 
@@ -21,10 +56,42 @@ class TaskService:
     def get_task(*, params: GetTaskParams) -> Task:
         return TaskReader.get_task(params=params)
 
+    @staticmethod
+    def get_task_version(*, params: GetTaskParams) -> int:
+        return TaskReader.get_task_version(params=params)
+
+    @staticmethod
+    def get_tasks_by_ids(*, params: GetTasksByIdsParams) -> TaskBatchGetResult:
+        return TaskReader.get_tasks_by_ids(params=params)
+
     @staticmethod
     def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
         return TaskReader.get_paginated_tasks(params=params)
 
+    @staticmethod
+    def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        return TaskReader.get_cursor_paginated_tasks(params=params)
+
+    @staticmethod
+    def search_tasks(*, params: SearchTasksParams) -> CursorPaginationResult[TaskSearchResult]:
+        return TaskReader.search_tasks(params=params)
+
+    @staticmethod
+    def autocomplete_tasks(*, params: AutocompleteTasksParams) -> TaskAutocompleteResult:
+        return TaskReader.autocomplete_tasks(params=params)
+
+    @staticmethod
+    def get_task_changes(*, params: GetTaskChangesParams) -> TaskChangesResult:
+        return TaskReader.get_task_changes(params=params)
+
+    @staticmethod
+    def stream_task_changes(*, params: StreamTaskChangesParams) -> Iterator[Optional[TaskChangeEvent]]:
+        return TaskReader.stream_task_changes(params=params)
+
+    @staticmethod
+    def export_tasks(*, params: ExportTasksParams) -> Iterator[str]:
+        return TaskReader.export_tasks(params=params)
+
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
         return TaskWriter.update_task(params=params)
@@ -32,3 +99,59 @@ class TaskService:
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
         return TaskWriter.delete_task(params=params)
+
+    @staticmethod
+    def move_task(*, params: MoveTaskParams) -> Task:
+        return TaskWriter.move_task(params=params)
+
+    @staticmethod
+    def add_task_tags(*, params: AddTaskTagsParams) -> Task:
+        return TaskWriter.add_task_tags(params=params)
+
+    @staticmethod
+    def remove_task_tag(*, params: RemoveTaskTagParams) -> Task:
+        return TaskWriter.remove_task_tag(params=params)
+
+    @staticmethod
+    def get_task_tag_counts(*, params: GetTaskTagCountsParams) -> List[TaskTagCount]:
+        return TaskTagCountReader.get_tag_counts(params=params)
+
+    @staticmethod
+    def create_task_comment(*, params: CreateTaskCommentParams) -> TaskComment:
+        return TaskCommentWriter.create_task_comment(params=params)
+
+    @staticmethod
+    def get_task_comments(*, params: GetTaskCommentsParams) -> CursorPaginationResult[TaskComment]:
+        return TaskCommentReader.get_task_comments(params=params)
+
+    @staticmethod
+    def update_task_comment(*, params: UpdateTaskCommentParams) -> TaskComment:
+        return TaskCommentWriter.update_task_comment(params=params)
+
+    @staticmethod
+    def delete_task_comment(*, params: DeleteTaskCommentParams) -> None:
+        return TaskCommentWriter.delete_task_comment(params=params)
+
+    @staticmethod
+    def batch_write_tasks(*, params: BatchWriteTasksParams) -> TaskBatchWriteResult:
+        return TaskWriter.batch_write_tasks(params=params)
+
+    @staticmethod
+    def import_tasks(*, params: ImportTasksParams) -> Iterator[TaskImportProgress]:
+        return TaskWriter.import_tasks(params=params)
+
+    @staticmethod
+    def backfill_title_prefixes(*, batch_size: int) -> int:
+        return TaskWriter.backfill_title_prefixes(batch_size=batch_size)
+
+    @staticmethod
+    def backfill_ranks(*, batch_size: int) -> int:
+        return TaskWriter.backfill_ranks(batch_size=batch_size)
+
+    @staticmethod
+    def reconcile_task_counts() -> TaskCountReconciliationResult:
+        return TaskCountWriter.reconcile_active_task_counts()
+
+    @staticmethod
+    def get_cache_stats() -> TaskCacheStats:
+        return TaskCache.get_stats()
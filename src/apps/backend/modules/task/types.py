@@ -1,22 +1,58 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from enum import StrEnum
+from typing import Iterable, List, Optional
 
-from modules.application.common.types import PaginationParams, PaginationResult, SortParams
+from modules.application.common.types import CursorPaginationParams, PaginationParams, SortParams
 
 
 @dataclass(frozen=True)
 class Task:
     id: str
     account_id: str
-    description: str
-    title: str
+    # None when the field was left out of the requested fields
+    description: Optional[str]
+    title: Optional[str]
+    version: int
+    tags: List[str] = field(default_factory=list)
+    # Manual ordering key; ranks compare as plain strings
+    rank: Optional[str] = None
+    comment_count: int = 0
+
+
+class TaskField(StrEnum):
+    ID = "id"
+    ACCOUNT_ID = "account_id"
+    DESCRIPTION = "description"
+    TITLE = "title"
+    VERSION = "version"
+    TAGS = "tags"
+    RANK = "rank"
+    COMMENT_COUNT = "comment_count"
+
+
+class TaskTagsMatch(StrEnum):
+    ANY = "any"
+    ALL = "all"
 
 
 @dataclass(frozen=True)
 class GetTaskParams:
     account_id: str
     task_id: str
+    fields: Optional[List[TaskField]] = None
+
+
+@dataclass(frozen=True)
+class TaskFilterParams:
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    # Case sensitive, so the anchored match can use the title index bounds
+    title_prefix: Optional[str] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+    tags: Optional[List[str]] = None
+    tags_match: TaskTagsMatch = TaskTagsMatch.ANY
 
 
 @dataclass(frozen=True)
@@ -24,6 +60,120 @@ class GetPaginatedTasksParams:
     account_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    include_total: bool = True
+    fields: Optional[List[TaskField]] = None
+    filter_params: Optional[TaskFilterParams] = None
+
+
+@dataclass(frozen=True)
+class GetCursorPaginatedTasksParams:
+    account_id: str
+    pagination_params: CursorPaginationParams
+    sort_params: Optional[SortParams] = None
+    fields: Optional[List[TaskField]] = None
+    filter_params: Optional[TaskFilterParams] = None
+
+
+@dataclass(frozen=True)
+class GetTasksByIdsParams:
+    account_id: str
+    task_ids: List[str]
+    fields: Optional[List[TaskField]] = None
+
+
+@dataclass(frozen=True)
+class TaskBatchGetResult:
+    # Both lists follow the order of the requested ids
+    items: List[Task]
+    missing_ids: List[str]
+
+
+@dataclass(frozen=True)
+class SearchTasksParams:
+    account_id: str
+    pagination_params: CursorPaginationParams
+    query: str
+
+
+@dataclass(frozen=True)
+class TaskSearchSnippet:
+    field: str
+    text: str
+    # [start, end) offsets of the matched terms within text
+    highlights: List[List[int]]
+
+
+@dataclass(frozen=True)
+class TaskSearchResult:
+    task: Task
+    score: float
+    snippets: List[TaskSearchSnippet]
+
+
+@dataclass(frozen=True)
+class AutocompleteTasksParams:
+    account_id: str
+    query: str
+    size: int
+
+
+@dataclass(frozen=True)
+class TaskAutocompleteSuggestion:
+    id: str
+    title: str
+
+
+@dataclass(frozen=True)
+class TaskAutocompleteResult:
+    items: List[TaskAutocompleteSuggestion]
+
+
+@dataclass(frozen=True)
+class GetTaskChangesParams:
+    account_id: str
+    size: int
+    since: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    id: str
+    deleted: bool
+    updated_at: datetime
+    # None for deleted tasks, whose content clients no longer need
+    task: Optional[Task] = None
+
+
+@dataclass(frozen=True)
+class TaskChangesResult:
+    changes: List[TaskChange]
+    has_more: bool
+    next_token: Optional[str]
+
+
+class TaskChangeEventType(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    # Sent when events were dropped for a subscriber, which must then resync via the changes feed
+    RESYNC = "resync"
+
+
+@dataclass(frozen=True)
+class TaskChangeEvent:
+    type: TaskChangeEventType
+    account_id: str
+    task_id: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    task: Optional[Task] = None
+
+
+@dataclass(frozen=True)
+class StreamTaskChangesParams:
+    account_id: str
+    heartbeat_seconds: int
+    max_connections: int
+    queue_size: int
 
 
 @dataclass(frozen=True)
@@ -39,12 +189,48 @@ class UpdateTaskParams:
     task_id: str
     description: str
     title: str
+    # When set, the write only applies if the stored version still matches (If-Match)
+    expected_version: Optional[int] = None
 
 
 @dataclass(frozen=True)
 class DeleteTaskParams:
     account_id: str
     task_id: str
+    expected_version: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class MoveTaskParams:
+    account_id: str
+    task_id: str
+    # The task is placed right after this one, or first in the list when None
+    after_task_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AddTaskTagsParams:
+    account_id: str
+    task_id: str
+    tags: List[str]
+
+
+@dataclass(frozen=True)
+class RemoveTaskTagParams:
+    account_id: str
+    task_id: str
+    tag: str
+
+
+@dataclass(frozen=True)
+class GetTaskTagCountsParams:
+    account_id: str
+
+
+@dataclass(frozen=True)
+class TaskTagCount:
+    tag: str
+    count: int
 
 
 @dataclass(frozen=True)
@@ -54,7 +240,158 @@ class TaskDeletionResult:
     success: bool
 
 
+class TaskBatchOperationType(StrEnum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class TaskBatchOperation:
+    op: str
+    description: Optional[str] = None
+    task_id: Optional[str] = None
+    title: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BatchWriteTasksParams:
+    account_id: str
+    operations: List[TaskBatchOperation]
+
+
+@dataclass(frozen=True)
+class TaskBatchOperationError:
+    code: str
+    message: str
+
+
+@dataclass(frozen=True)
+class TaskBatchOperationResult:
+    index: int
+    op: str
+    success: bool
+    task_id: Optional[str] = None
+    error: Optional[TaskBatchOperationError] = None
+
+
+@dataclass(frozen=True)
+class TaskBatchWriteResult:
+    results: List[TaskBatchOperationResult]
+    success_count: int
+    error_count: int
+
+
+class TaskExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass(frozen=True)
+class ExportTasksParams:
+    account_id: str
+    batch_size: int
+    export_format: TaskExportFormat
+
+
+@dataclass(frozen=True)
+class TaskExportRow:
+    id: str
+    title: str
+    description: str
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+class TaskImportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass(frozen=True)
+class ImportTasksParams:
+    account_id: str
+    chunk_size: int
+    import_format: TaskImportFormat
+    lines: Iterable[str]
+
+
+@dataclass(frozen=True)
+class TaskImportRowError:
+    line_number: int
+    message: str
+
+
+@dataclass(frozen=True)
+class TaskImportProgress:
+    chunk: int
+    imported_count: int
+    error_count: int
+    errors: List[TaskImportRowError]
+
+
+class TaskCacheBackendType(StrEnum):
+    MEMORY = "memory"
+    MONGO = "mongo"
+
+
+@dataclass(frozen=True)
+class TaskCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+
+
+@dataclass(frozen=True)
+class TaskCountReconciliationResult:
+    accounts_checked: int
+    accounts_repaired: int
+
+
+@dataclass(frozen=True)
+class TaskComment:
+    id: str
+    account_id: str
+    task_id: str
+    content: str
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class CreateTaskCommentParams:
+    account_id: str
+    task_id: str
+    content: str
+
+
+@dataclass(frozen=True)
+class GetTaskCommentsParams:
+    account_id: str
+    task_id: str
+    pagination_params: CursorPaginationParams
+
+
+@dataclass(frozen=True)
+class UpdateTaskCommentParams:
+    account_id: str
+    task_id: str
+    comment_id: str
+    content: str
+
+
+@dataclass(frozen=True)
+class DeleteTaskCommentParams:
+    account_id: str
+    task_id: str
+    comment_id: str
+
+
 @dataclass(frozen=True)
 class TaskErrorCode:
     NOT_FOUND: str = "TASK_ERR_01"
     BAD_REQUEST: str = "TASK_ERR_02"
+    PRECONDITION_FAILED: str = "TASK_ERR_03"
+    COMMENT_NOT_FOUND: str = "TASK_ERR_04"
+    EVENTS_UNAVAILABLE: str = "TASK_ERR_05"
+    EVENTS_UNSUPPORTED: str = "TASK_ERR_06"
@@ -0,0 +1,20 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+class TaskCountReconciliationWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        result = TaskService.reconcile_task_counts()
+        Logger.info(
+            message=f"Task counts reconciled: {result.accounts_repaired} of {result.accounts_checked} accounts repaired"
+        )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
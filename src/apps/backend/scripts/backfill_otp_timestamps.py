@@ -0,0 +1,19 @@
+import argparse
+
+from modules.authentication.authentication_service import AuthenticationService
+from modules.logger.logger import Logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Date OTPs stored without expires_at by their _id, so the TTL index can expire them."
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    updated_count = AuthenticationService.backfill_otp_timestamps(batch_size=args.batch_size)
+    Logger.info(message=f"Backfilled timestamps on {updated_count} OTPs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import argparse
+
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Give tasks written before manual ordering a rank, oldest first.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    updated_count = TaskService.backfill_ranks(batch_size=args.batch_size)
+    Logger.info(message=f"Backfilled ranks on {updated_count} tasks")
+
+
+if __name__ == "__main__":
+    main()
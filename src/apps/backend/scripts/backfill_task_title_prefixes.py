@@ -0,0 +1,19 @@
+import argparse
+
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Populate title_prefixes on tasks written before autocomplete existed."
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    updated_count = TaskService.backfill_title_prefixes(batch_size=args.batch_size)
+    Logger.info(message=f"Backfilled title prefixes on {updated_count} tasks")
+
+
+if __name__ == "__main__":
+    main()
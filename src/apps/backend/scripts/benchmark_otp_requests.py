@@ -0,0 +1,49 @@
+import argparse
+import statistics
+import time
+
+from modules.account.types import PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.types import CreateOTPParams
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Request OTPs for one phone number over and over and log the per-request cost of each window."
+    )
+    parser.add_argument("--country-code", default="+91")
+    parser.add_argument("--phone-number", default=None)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--window", type=int, default=500)
+    args = parser.parse_args()
+
+    # The default OTP skips the SMS provider, so the benchmark only measures the database work
+    if not ConfigService[bool].get_value(key="public.default_otp.enabled", default=False):
+        Logger.error(message="Enable public.default_otp (DEFAULT_OTP_ENABLED) so no SMS is sent while benchmarking")
+        return
+
+    phone_number = PhoneNumber(
+        country_code=args.country_code,
+        phone_number=args.phone_number
+        or ConfigService[str].get_value(key="public.default_otp.whitelisted_phone_number", default="9999999999"),
+    )
+    create_otp_params = CreateOTPParams(phone_number=phone_number)
+
+    window_durations_ms: list[float] = []
+    for request_number in range(1, args.requests + 1):
+        started_at = time.perf_counter()
+        AuthenticationService.create_otp(params=create_otp_params, account_id="")
+        window_durations_ms.append((time.perf_counter() - started_at) * 1000)
+
+        if request_number % args.window == 0:
+            Logger.info(
+                message=f"Requests {request_number - args.window + 1}-{request_number}: "
+                f"median {statistics.median(window_durations_ms):.2f}ms, max {max(window_durations_ms):.2f}ms"
+            )
+            window_durations_ms = []
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from typing import Any, Optional
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams
+
+results_lock = threading.Lock()
+
+
+def send_request(*, url: str, data: Optional[dict[str, Any]] = None, token: Optional[str] = None) -> tuple[int, Any]:
+    headers = {"Content-Type": "application/json"}
+    if token is not None:
+        headers["Authorization"] = f"Bearer {token}"
+
+    request = urllib.request.Request(
+        url, data=json.dumps(data).encode("utf-8") if data is not None else None, headers=headers
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, None
+
+
+def get_percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * percentile), len(sorted_values) - 1)]
+
+
+def run_load(*, duration_seconds: float, send: Any, latencies_ms: list[float], statuses: dict[int, int]) -> None:
+    deadline = time.monotonic() + duration_seconds
+
+    while time.monotonic() < deadline:
+        started_at = time.monotonic()
+        status, _ = send()
+        with results_lock:
+            latencies_ms.append((time.monotonic() - started_at) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+
+def log_results(*, name: str, latencies_ms: list[float], statuses: dict[int, int]) -> None:
+    sorted_latencies_ms = sorted(latencies_ms)
+    Logger.info(
+        message=f"{name}: {len(sorted_latencies_ms)} requests, "
+        f"p50 {get_percentile(sorted_latencies_ms, 0.5):.1f}ms, p99 {get_percentile(sorted_latencies_ms, 0.99):.1f}ms, "
+        f"statuses {dict(sorted(statuses.items()))}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure login and task read latency while both run concurrently against a running server."
+    )
+    parser.add_argument("--base-url", default="http://localhost:8080/api")
+    parser.add_argument("--duration-seconds", type=float, default=30)
+    parser.add_argument("--login-threads", type=int, default=16)
+    parser.add_argument("--read-threads", type=int, default=8)
+    args = parser.parse_args()
+
+    username = f"benchmark_{uuid.uuid4().hex}@example.com"
+    password = uuid.uuid4().hex
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            first_name="Benchmark", last_name="User", password=password, username=username
+        )
+    )
+    for i in range(20):
+        TaskService.create_task(
+            params=CreateTaskParams(account_id=account.id, description=f"Description {i}", title=f"Task {i}")
+        )
+
+    credentials = {"username": username, "password": password}
+    _, token_response = send_request(url=f"{args.base_url}/access-tokens", data=credentials)
+    token = token_response["token"]
+
+    login_latencies_ms: list[float] = []
+    login_statuses: dict[int, int] = {}
+    read_latencies_ms: list[float] = []
+    read_statuses: dict[int, int] = {}
+
+    def send_login() -> tuple[int, Any]:
+        return send_request(url=f"{args.base_url}/access-tokens", data=credentials)
+
+    def send_read() -> tuple[int, Any]:
+        return send_request(url=f"{args.base_url}/accounts/{account.id}/tasks", token=token)
+
+    threads = [
+        threading.Thread(
+            target=run_load,
+            kwargs={
+                "duration_seconds": args.duration_seconds,
+                "send": send_login,
+                "latencies_ms": login_latencies_ms,
+                "statuses": login_statuses,
+            },
+        )
+        for _ in range(args.login_threads)
+    ] + [
+        threading.Thread(
+            target=run_load,
+            kwargs={
+                "duration_seconds": args.duration_seconds,
+                "send": send_read,
+                "latencies_ms": read_latencies_ms,
+                "statuses": read_statuses,
+            },
+        )
+        for _ in range(args.read_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    log_results(name="Logins", latencies_ms=login_latencies_ms, statuses=login_statuses)
+    log_results(name="Task reads", latencies_ms=read_latencies_ms, statuses=read_statuses)
+
+    AccountService.delete_account(account_id=account.id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import os
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from modules.config.config_service import ConfigService
+from modules.hashing.hashing_service import HashingService
+from modules.hashing.types import CalibratePasswordHashParams, PasswordHashAlgorithm
+from modules.logger.logger import Logger
+
+CONFIG_DIRECTORY = Path(__file__).resolve().parents[4] / "config"
+
+
+def write_settings_to_config(*, filename: str, settings: dict[str, Any]) -> None:
+    config_path = CONFIG_DIRECTORY / filename
+    content: dict[str, Any] = {}
+    if config_path.exists():
+        with open(config_path, encoding="utf-8") as config_file:
+            content = yaml.safe_load(config_file) or {}
+
+    content["hashing"] = {**content.get("hashing", {}), **settings}
+    with open(config_path, "w", encoding="utf-8") as config_file:
+        yaml.safe_dump(content, config_file, sort_keys=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure password hashing on this host and pick the highest cost that stays within a target time."
+    )
+    parser.add_argument("--algorithm", choices=list(PasswordHashAlgorithm), default=None)
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help="Save the result in the config file of the current APP_ENV. Comments in that file are not kept.",
+    )
+    args = parser.parse_args()
+
+    algorithm = PasswordHashAlgorithm(args.algorithm or ConfigService[str].get_value(key="hashing.algorithm"))
+    result = HashingService.calibrate_password_hash(
+        params=CalibratePasswordHashParams(algorithm=algorithm, target_ms=args.target_ms, samples=args.samples)
+    )
+
+    if algorithm == PasswordHashAlgorithm.ARGON2ID:
+        settings = {"algorithm": str(algorithm), "argon2_time_cost": result.settings.argon2_time_cost}
+    else:
+        settings = {"algorithm": str(algorithm), "bcrypt_rounds": result.settings.bcrypt_rounds}
+
+    Logger.info(message=f"Calibrated {settings} at {result.hash_ms:.0f}ms per hash (target {args.target_ms:.0f}ms)")
+    if result.hash_ms > args.target_ms:
+        Logger.info(message="This host is slower than the target even at the minimum cost, which is kept regardless")
+
+    if args.write:
+        filename = f"{os.environ.get('APP_ENV', 'development')}.yml"
+        write_settings_to_config(filename=filename, settings=settings)
+        Logger.info(message=f"Wrote hashing settings to config/{filename}")
+
+
+if __name__ == "__main__":
+    main()
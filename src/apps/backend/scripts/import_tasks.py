@@ -0,0 +1,49 @@
+import argparse
+import os
+from typing import Optional
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import ImportTasksParams, TaskImportFormat
+
+
+def import_tasks(*, account_id: str, file_path: str, import_format: Optional[str], chunk_size: Optional[int]) -> None:
+    if import_format is None:
+        import_format = TaskImportFormat.CSV if file_path.endswith(".csv") else TaskImportFormat.NDJSON
+
+    with open(file_path, encoding="utf-8", newline="") as import_file:
+        import_tasks_params = ImportTasksParams(
+            account_id=account_id,
+            chunk_size=chunk_size or ConfigService[int].get_value(key="tasks.import_chunk_size"),
+            import_format=TaskImportFormat(import_format),
+            lines=import_file,
+        )
+
+        for progress in TaskService.import_tasks(params=import_tasks_params):
+            Logger.info(
+                message=f"Imported chunk {progress.chunk} from {os.path.basename(file_path)}: "
+                f"{progress.imported_count} tasks imported, {progress.error_count} rows failed"
+            )
+            for error in progress.errors:
+                Logger.error(message=f"Line {error.line_number}: {error.message}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stream an NDJSON or CSV file of tasks into an account.")
+    parser.add_argument("account_id")
+    parser.add_argument("file_path")
+    parser.add_argument("--format", dest="import_format", choices=list(TaskImportFormat))
+    parser.add_argument("--chunk-size", type=int)
+    args = parser.parse_args()
+
+    import_tasks(
+        account_id=args.account_id,
+        file_path=args.file_path,
+        import_format=args.import_format,
+        chunk_size=args.chunk_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
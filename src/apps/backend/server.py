@@ -15,6 +15,7 @@ from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
 
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+from modules.task.workers.task_count_reconciliation_worker import TaskCountReconciliationWorker
 from scripts.bootstrap_app import BootstrapApp
 
 load_dotenv()
@@ -36,6 +37,9 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Repair drift in the per-account task counters used by the task list
+    ApplicationService.schedule_worker_as_cron(cls=TaskCountReconciliationWorker, cron_schedule="0 3 * * *")
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
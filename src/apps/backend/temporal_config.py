@@ -4,10 +4,11 @@ from temporalio import activity, workflow
 
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.task.workers.task_count_reconciliation_worker import TaskCountReconciliationWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker, TaskCountReconciliationWorker]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
@@ -4,6 +4,7 @@ from typing import Callable
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
 from modules.logger.logger_manager import LoggerManager
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
@@ -21,3 +22,4 @@ class BaseTestAccount(unittest.TestCase):
         AccountRepository.collection().delete_many({})
         OTPRepository.collection().delete_many({})
         AccountNotificationPreferencesRepository.collection().delete_many({})
+        IdempotencyRecordRepository.collection().delete_many({})
@@ -14,6 +14,7 @@ from modules.account.types import (
 )
 from modules.authentication.types import AccessTokenErrorCode, OTPErrorCode
 from modules.config.config_service import ConfigService
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
 from modules.notification.sms_service import SMSService
 from tests.modules.account.base_test_account import BaseTestAccount
 
@@ -33,6 +34,40 @@ class TestAccountApi(BaseTestAccount):
             assert response.json, f"No response from API with status code:: {response.status}"
             assert response.json.get("username") == "username"
 
+    def test_create_account_with_idempotency_key_replays_response(self) -> None:
+        payload = json.dumps(
+            {"first_name": "first_name", "last_name": "last_name", "password": "password", "username": "username"}
+        )
+        headers = {**HEADERS, "Idempotency-Key": "create-account-1"}
+
+        with app.test_client() as client:
+            first_response = client.post(ACCOUNT_URL, headers=headers, data=payload)
+            retried_response = client.post(ACCOUNT_URL, headers=headers, data=payload)
+
+        assert first_response.status_code == 201
+        assert retried_response.status_code == 201
+        assert retried_response.headers["Idempotent-Replayed"] == "true"
+        assert retried_response.json == {
+            key: value for key, value in first_response.json.items() if key != "hashed_password"
+        }
+
+    def test_create_account_with_idempotency_key_does_not_store_password_hash(self) -> None:
+        payload = json.dumps(
+            {"first_name": "first_name", "last_name": "last_name", "password": "password", "username": "username"}
+        )
+        headers = {**HEADERS, "Idempotency-Key": "create-account-2"}
+
+        with app.test_client() as client:
+            response = client.post(ACCOUNT_URL, headers=headers, data=payload)
+
+        stored_bodies = [
+            record_bson["response"]["body"] for record_bson in IdempotencyRecordRepository.collection().find()
+        ]
+        assert response.status_code == 201
+        assert len(stored_bodies) == 1
+        assert "hashed_password" not in json.loads(stored_bodies[0])
+        assert response.json["hashed_password"] not in stored_bodies[0]
+
     def test_create_account_with_existing_user(self) -> None:
         account = AccountService.create_account_by_username_and_password(
             params=CreateAccountByUsernameAndPasswordParams(
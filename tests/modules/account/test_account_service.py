@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import patch
 
@@ -8,12 +9,14 @@ from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundEr
 from modules.account.types import (
     AccountErrorCode,
     AccountSearchByIdParams,
+    AccountSearchParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
     UpdateAccountProfileParams,
 )
 from modules.authentication.types import AccessTokenPayload
+from modules.hashing.internal.password_hash_util import PasswordHashUtil
 from tests.modules.account.base_test_account import BaseTestAccount
 
 
@@ -29,6 +32,23 @@ class TestAccountService(BaseTestAccount):
         assert account.first_name == "first_name"
         assert account.last_name == "last_name"
 
+    def test_login_rehashes_password_with_outdated_cost(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                password="password", username="username", first_name="first_name", last_name="last_name"
+            )
+        )
+        stored_rounds = PasswordHashUtil.get_bcrypt_rounds(account.hashed_password)
+        target_settings = replace(PasswordHashUtil.get_target_settings(), bcrypt_rounds=stored_rounds + 1)
+        login_params = AccountSearchParams(username="username", password="password")
+
+        with patch.object(PasswordHashUtil, "get_target_settings", return_value=target_settings):
+            rehashed_account = AccountService.get_account_by_username_and_password(params=login_params)
+            logged_in_account = AccountService.get_account_by_username_and_password(params=login_params)
+
+        assert PasswordHashUtil.get_bcrypt_rounds(rehashed_account.hashed_password) == stored_rounds + 1
+        assert logged_in_account.hashed_password == rehashed_account.hashed_password
+
     @patch("modules.authentication.authentication_service.AuthenticationService.verify_access_token")
     def test_get_account_by_id(self, mock_verify_access_token) -> None:
         account = AccountService.create_account_by_username_and_password(
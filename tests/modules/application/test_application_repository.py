@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class ExampleRepository(ApplicationRepository):
+    collection_name = "examples"
+
+    indexes = [
+        IndexModel([("conflicting", 1)], name="conflicting_index"),
+        IndexModel([("valid", 1)], name="valid_index"),
+    ]
+
+
+class TestApplicationRepository(BaseTestApplication):
+    def test_create_indexes_builds_the_indexes_after_a_failed_one(self) -> None:
+        collection = MagicMock()
+        collection.create_indexes.side_effect = [OperationFailure("Index already exists with a different name"), None]
+
+        ExampleRepository.create_indexes(collection)
+
+        created_index_names = [call.args[0][0].document["name"] for call in collection.create_indexes.call_args_list]
+        assert created_index_names == ["conflicting_index", "valid_index"]
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from bson.objectid import ObjectId
+
+from modules.account.types import PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internals.otp.store.otp_repository import OTP_RETENTION_SECONDS, OTPRepository
+from modules.authentication.types import CreateOTPParams, OTPStatus
+from modules.notification.sms_service import SMSService
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+
+class TestOTPService(BaseTestAccessToken):
+    @mock.patch.object(SMSService, "send_sms_for_account")
+    def test_create_otp_sets_timestamps(self, mock_send_sms) -> None:
+        created_before = datetime.now().replace(microsecond=0)
+
+        otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER), account_id="")
+        otp_bson = OTPRepository.collection().find_one({"_id": ObjectId(otp.id)})
+
+        assert otp_bson["created_at"] >= created_before
+        assert otp_bson["updated_at"] == otp_bson["created_at"]
+        assert otp_bson["expires_at"] == otp_bson["created_at"] + timedelta(seconds=OTP_RETENTION_SECONDS)
+
+    @mock.patch.object(SMSService, "send_sms_for_account")
+    def test_create_otp_expires_previous_otps(self, mock_send_sms) -> None:
+        otps = [
+            AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER), account_id="")
+            for _ in range(3)
+        ]
+
+        active_otps = list(
+            OTPRepository.collection().find(
+                {"phone_number": {"country_code": "+91", "phone_number": "9999999999"}, "active": True}
+            )
+        )
+        expired_count = OTPRepository.collection().count_documents({"status": OTPStatus.EXPIRED})
+
+        assert [str(otp_bson["_id"]) for otp_bson in active_otps] == [otps[-1].id]
+        assert expired_count == 2
+
+    def test_backfill_otp_timestamps(self) -> None:
+        otp_id = (
+            OTPRepository.collection()
+            .insert_one(
+                {
+                    "active": False,
+                    "otp_code": "1234",
+                    "phone_number": {"country_code": "+91", "phone_number": "9999999999"},
+                    "status": OTPStatus.EXPIRED,
+                }
+            )
+            .inserted_id
+        )
+
+        updated_count = AuthenticationService.backfill_otp_timestamps(batch_size=10)
+        otp_bson = OTPRepository.collection().find_one({"_id": otp_id})
+
+        assert updated_count == 1
+        assert otp_bson["created_at"] is not None
+        assert otp_bson["updated_at"] == otp_bson["created_at"]
+        assert otp_bson["expires_at"] == otp_bson["created_at"] + timedelta(seconds=OTP_RETENTION_SECONDS)
+        assert AuthenticationService.backfill_otp_timestamps(batch_size=10) == 0
+
+    def test_backfill_otp_timestamps_replaces_stale_creation_times(self) -> None:
+        stale_created_at = datetime(2020, 1, 1)
+        otp_id = (
+            OTPRepository.collection()
+            .insert_one(
+                {
+                    "active": True,
+                    "created_at": stale_created_at,
+                    "otp_code": "1234",
+                    "phone_number": {"country_code": "+91", "phone_number": "9999999999"},
+                    "status": OTPStatus.PENDING,
+                    "updated_at": stale_created_at,
+                }
+            )
+            .inserted_id
+        )
+
+        AuthenticationService.backfill_otp_timestamps(batch_size=10)
+        otp_bson = OTPRepository.collection().find_one({"_id": otp_id})
+
+        assert otp_bson["created_at"] > stale_created_at
+        assert otp_bson["updated_at"] == otp_bson["created_at"]
+        assert otp_bson["expires_at"] > datetime.now()
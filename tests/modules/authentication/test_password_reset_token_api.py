@@ -1,6 +1,8 @@
 import json
 from unittest import mock
 
+from bson.objectid import ObjectId
+
 from server import app
 
 from modules.account.account_service import AccountService
@@ -10,6 +12,9 @@ from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
 from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
 from modules.notification.email_service import EmailService
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
@@ -97,6 +102,86 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertTrue(updated_password_reset_token.is_used)
             self.assertTrue(mock_send_email.called)
 
+    def test_password_reset_token_is_stored_as_digest(self):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+
+        password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account.id, token)
+        token_bson = PasswordResetTokenRepository.collection().find_one({"_id": ObjectId(password_reset_token.id)})
+
+        self.assertNotIn("token", token_bson)
+        self.assertEqual(token_bson["token_digest"], PasswordResetTokenUtil.hash_password_reset_token(token))
+        self.assertEqual(
+            AuthenticationService.verify_password_reset_token(account.id, token).id, password_reset_token.id
+        )
+
+    def test_older_password_reset_link_is_rejected_after_a_new_one_is_issued(self):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        older_token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account.id, older_token)
+        newer_token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account.id, newer_token)
+
+        with self.assertRaises(AccountBadRequestError):
+            AuthenticationService.verify_password_reset_token(account.id, older_token)
+        self.assertFalse(AuthenticationService.verify_password_reset_token(account.id, newer_token).is_used)
+
+    def test_older_password_reset_link_is_rejected_after_the_newest_one_is_used(self):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        older_token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account.id, older_token)
+        newer_token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account.id, newer_token)
+
+        with app.test_client() as client:
+            reset_response = client.patch(
+                f"{ACCOUNT_API_URL}/{account.id}",
+                headers=HEADERS,
+                data=json.dumps({"new_password": "new_password", "token": newer_token}),
+            )
+            replay_response = client.patch(
+                f"{ACCOUNT_API_URL}/{account.id}",
+                headers=HEADERS,
+                data=json.dumps({"new_password": "other_password", "token": older_token}),
+            )
+
+        self.assertEqual(reset_response.status_code, 200)
+        self.assertEqual(replay_response.status_code, 400)
+
+    def test_legacy_bcrypt_password_reset_token_is_still_accepted(self):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenRepository.collection().insert_one(
+            {
+                "account": ObjectId(account.id),
+                "expires_at": PasswordResetTokenUtil.get_token_expires_at(),
+                "token": PasswordResetTokenUtil.hash_password(token),
+                "is_used": False,
+            }
+        )
+
+        password_reset_token = AuthenticationService.verify_password_reset_token(account.id, token)
+
+        self.assertFalse(password_reset_token.is_used)
+        with self.assertRaises(AccountBadRequestError):
+            AuthenticationService.verify_password_reset_token(account.id, "invalid_token")
+
     @mock.patch.object(EmailService, "send_email_for_account")
     def test_reset_account_password_account_not_found(self, mock_send_email):
         account_id = "661e42ec98423703a299a899"
@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+
+from modules.hashing.errors import HashingQueueFullError
+from modules.hashing.internal.hashing_executor import (
+    HashingExecutor,
+    compare_password_in_worker,
+    hash_password_in_worker,
+)
+from modules.hashing.types import PasswordHashAlgorithm, PasswordHashSettings
+
+SETTINGS = PasswordHashSettings(
+    algorithm=PasswordHashAlgorithm.BCRYPT,
+    bcrypt_rounds=4,
+    argon2_time_cost=1,
+    argon2_memory_cost_kib=1024,
+    argon2_parallelism=1,
+)
+
+
+class TestHashingExecutor(unittest.TestCase):
+    def test_hashes_and_compares_in_pool(self) -> None:
+        executor = HashingExecutor(pool_size=1, queue_size=1)
+
+        hashed_password = executor.run(hash_password_in_worker, "secret", SETTINGS)
+
+        assert executor.run(compare_password_in_worker, "secret", hashed_password)
+        assert not executor.run(compare_password_in_worker, "other", hashed_password)
+        assert executor.get_stats().completed_count == 3
+
+    def test_rejects_calls_when_queue_is_full(self) -> None:
+        executor = HashingExecutor(pool_size=0, queue_size=0)
+        release = threading.Event()
+        blocked_call = threading.Thread(target=executor.run, args=(release.wait, 5))
+        blocked_call.start()
+        while executor.get_stats().in_flight == 0:
+            time.sleep(0.01)
+
+        with self.assertRaises(HashingQueueFullError):
+            executor.run(hash_password_in_worker, "secret", SETTINGS)
+
+        release.set()
+        blocked_call.join()
+        stats = executor.get_stats()
+
+        assert stats.rejected_count == 1
+        assert stats.in_flight == 0
+        assert stats.latency_max_ms > 0
+        executor.run(hash_password_in_worker, "secret", SETTINGS)
+
+    def test_stats_report_queue_depth(self) -> None:
+        executor = HashingExecutor(pool_size=0, queue_size=2)
+        release = threading.Event()
+        blocked_calls = [threading.Thread(target=executor.run, args=(release.wait, 5)) for _ in range(3)]
+        for blocked_call in blocked_calls:
+            blocked_call.start()
+        while executor.get_stats().in_flight < 3:
+            time.sleep(0.01)
+
+        stats = executor.get_stats()
+
+        release.set()
+        for blocked_call in blocked_calls:
+            blocked_call.join()
+        assert stats.queue_depth == 2
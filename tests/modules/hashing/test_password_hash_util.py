@@ -0,0 +1,37 @@
+import unittest
+from dataclasses import replace
+
+from modules.hashing.internal.password_hash_util import PasswordHashUtil
+from modules.hashing.types import PasswordHashAlgorithm, PasswordHashSettings
+
+SETTINGS = PasswordHashSettings(
+    algorithm=PasswordHashAlgorithm.BCRYPT,
+    bcrypt_rounds=4,
+    argon2_time_cost=1,
+    argon2_memory_cost_kib=1024,
+    argon2_parallelism=1,
+)
+
+
+class TestPasswordHashUtil(unittest.TestCase):
+    def test_needs_rehash_when_bcrypt_cost_differs(self) -> None:
+        hashed_password = PasswordHashUtil.hash_password(password="secret", settings=SETTINGS)
+
+        assert PasswordHashUtil.get_bcrypt_rounds(hashed_password) == 4
+        assert not PasswordHashUtil.needs_rehash(hashed_password=hashed_password, settings=SETTINGS)
+        assert PasswordHashUtil.needs_rehash(
+            hashed_password=hashed_password, settings=replace(SETTINGS, bcrypt_rounds=5)
+        )
+
+    def test_needs_rehash_when_algorithm_differs(self) -> None:
+        hashed_password = PasswordHashUtil.hash_password(password="secret", settings=SETTINGS)
+
+        assert PasswordHashUtil.needs_rehash(
+            hashed_password=hashed_password, settings=replace(SETTINGS, algorithm=PasswordHashAlgorithm.ARGON2ID)
+        )
+        assert PasswordHashUtil.needs_rehash(
+            hashed_password="$argon2id$v=19$m=1024,t=1,p=1$c2FsdHNhbHQ$aGFzaGhhc2g", settings=SETTINGS
+        )
+
+    def test_accounts_without_password_are_never_rehashed(self) -> None:
+        assert not PasswordHashUtil.needs_rehash(hashed_password="", settings=SETTINGS)
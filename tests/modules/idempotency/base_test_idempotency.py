@@ -0,0 +1,12 @@
+import unittest
+
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
+from modules.logger.logger_manager import LoggerManager
+
+
+class BaseTestIdempotency(unittest.TestCase):
+    def setUp(self) -> None:
+        LoggerManager.mount_logger()
+
+    def tearDown(self) -> None:
+        IdempotencyRecordRepository.collection().delete_many({})
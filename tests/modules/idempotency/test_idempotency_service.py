@@ -0,0 +1,71 @@
+import threading
+from datetime import datetime, timedelta
+
+from modules.idempotency.errors import IdempotencyKeyReusedError, IdempotencyRequestInProgressError
+from modules.idempotency.idempotency_service import IdempotencyService
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
+from modules.idempotency.types import (
+    AcquireIdempotencyKeyParams,
+    CompleteIdempotencyKeyParams,
+    IdempotentResponse,
+    ReleaseIdempotencyKeyParams,
+)
+from tests.modules.idempotency.base_test_idempotency import BaseTestIdempotency
+
+
+class TestIdempotencyService(BaseTestIdempotency):
+    PARAMS = AcquireIdempotencyKeyParams(key="key-1", request_hash="hash-1")
+    RESPONSE = IdempotentResponse(status_code=201, body='{"id": "1"}', headers={"Content-Type": "application/json"})
+
+    def test_acquire_new_key_claims_it(self) -> None:
+        assert IdempotencyService.acquire_idempotency_key(params=self.PARAMS) is None
+
+    def test_acquire_completed_key_returns_stored_response(self) -> None:
+        IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+        IdempotencyService.complete_idempotency_key(
+            params=CompleteIdempotencyKeyParams(key=self.PARAMS.key, response=self.RESPONSE)
+        )
+
+        assert IdempotencyService.acquire_idempotency_key(params=self.PARAMS) == self.RESPONSE
+
+    def test_acquire_key_with_different_request_raises(self) -> None:
+        IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+
+        with self.assertRaises(IdempotencyKeyReusedError):
+            IdempotencyService.acquire_idempotency_key(
+                params=AcquireIdempotencyKeyParams(key=self.PARAMS.key, request_hash="hash-2")
+            )
+
+    def test_acquire_pending_key_raises_when_original_does_not_finish(self) -> None:
+        IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+
+        with self.assertRaises(IdempotencyRequestInProgressError):
+            IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+
+    def test_acquire_pending_key_waits_for_original_response(self) -> None:
+        IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+        completion = threading.Timer(
+            0.2,
+            IdempotencyService.complete_idempotency_key,
+            kwargs={"params": CompleteIdempotencyKeyParams(key=self.PARAMS.key, response=self.RESPONSE)},
+        )
+
+        completion.start()
+        response = IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+        completion.join()
+
+        assert response == self.RESPONSE
+
+    def test_released_key_can_be_acquired_again(self) -> None:
+        IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+        IdempotencyService.release_idempotency_key(params=ReleaseIdempotencyKeyParams(key=self.PARAMS.key))
+
+        assert IdempotencyService.acquire_idempotency_key(params=self.PARAMS) is None
+
+    def test_stale_pending_key_can_be_taken_over(self) -> None:
+        IdempotencyService.acquire_idempotency_key(params=self.PARAMS)
+        IdempotencyRecordRepository.collection().update_one(
+            {"_id": self.PARAMS.key}, {"$set": {"locked_until": datetime.now() - timedelta(seconds=1)}}
+        )
+
+        assert IdempotencyService.acquire_idempotency_key(params=self.PARAMS) is None
@@ -6,8 +6,12 @@ from server import app
 from modules.account.account_service import AccountService
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import CreateAccountByUsernameAndPasswordParams, Account
+from modules.idempotency.internal.store.idempotency_record_repository import IdempotencyRecordRepository
 from modules.logger.logger_manager import LoggerManager
+from modules.task.internal.store.task_comment_repository import TaskCommentRepository
+from modules.task.internal.store.task_count_repository import TaskCountRepository
 from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.store.task_tag_count_repository import TaskTagCountRepository
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from modules.task.task_service import TaskService
 from modules.task.types import CreateTaskParams, Task
@@ -30,7 +34,11 @@ class BaseTestTask(unittest.TestCase):
 
     def tearDown(self) -> None:
         TaskRepository.collection().delete_many({})
+        TaskCommentRepository.collection().delete_many({})
+        TaskCountRepository.collection().delete_many({})
+        TaskTagCountRepository.collection().delete_many({})
         AccountRepository.collection().delete_many({})
+        IdempotencyRecordRepository.collection().delete_many({})
 
     # URL HELPER METHODS
 
@@ -1,6 +1,11 @@
+import json
+from urllib.parse import quote
+
 from server import app
 
 from modules.authentication.types import AccessTokenErrorCode
+from modules.idempotency.types import IdempotencyErrorCode
+from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.types import TaskErrorCode
 from tests.modules.task.base_test_task import BaseTestTask
 
@@ -66,6 +71,52 @@ class TestTaskApi(BaseTestTask):
 
         self.assert_error_response(response, 401, AccessTokenErrorCode.ACCESS_TOKEN_INVALID)
 
+    def test_get_all_tasks_returns_full_tasks_by_default(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id)
+
+        response = self.make_authenticated_request("GET", account.id, token)
+
+        assert response.status_code == 200
+        assert response.json["items"][0]["description"] == self.DEFAULT_TASK_DESCRIPTION
+
+    def test_get_all_tasks_returns_summary_fields_on_request(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="fields=summary")
+
+        assert response.status_code == 200
+        assert set(response.json["items"][0].keys()) == {"id", "account_id", "title"}
+
+    def test_get_all_tasks_with_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id)
+
+        all_response = self.make_authenticated_request("GET", account.id, token, query_params="fields=all")
+        title_response = self.make_authenticated_request("GET", account.id, token, query_params="fields=id,title")
+
+        assert all_response.json["items"][0]["description"] == self.DEFAULT_TASK_DESCRIPTION
+        assert set(title_response.json["items"][0].keys()) == {"id", "title"}
+
+    def test_get_task_with_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, task_id=task.id, query_params="fields=title"
+        )
+
+        assert response.status_code == 200
+        assert response.json == {"title": task.title}
+
+    def test_get_all_tasks_with_invalid_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="fields=title,secret")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
     def test_get_all_tasks_empty(self) -> None:
         account, token = self.create_account_and_get_token()
 
@@ -106,6 +157,70 @@ class TestTaskApi(BaseTestTask):
 
         assert response1.json["items"][0]["id"] != response2.json["items"][0]["id"]
 
+    def test_get_all_tasks_without_total(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include_total=false")
+
+        assert response.status_code == 200
+        self.assert_pagination_response(response.json, expected_items_count=3)
+        assert response.json["total_count"] is None
+        assert response.json["total_pages"] is None
+
+    def test_get_all_tasks_with_cursor_pagination(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=5)
+
+        response1 = self.make_authenticated_request("GET", account.id, token, query_params="cursor=&size=2")
+        next_cursor = quote(response1.json["next_cursor"])
+        response2 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"cursor={next_cursor}&size=2"
+        )
+        next_cursor = quote(response2.json["next_cursor"])
+        response3 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"cursor={next_cursor}&size=2"
+        )
+
+        assert response1.status_code == 200
+        assert [item["title"] for item in response1.json["items"]] == ["Task 5", "Task 4"]
+        assert [item["title"] for item in response2.json["items"]] == ["Task 3", "Task 2"]
+        assert [item["title"] for item in response3.json["items"]] == ["Task 1"]
+        assert response3.json["next_cursor"] is None
+
+    def test_get_all_tasks_with_page_and_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="cursor=&page=1")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_with_sort_and_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+        self.create_test_task(account_id=account.id, title="Other")
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params="sort_by=title&sort_direction=desc&title_prefix=Task"
+        )
+
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json["items"]] == ["Task 3", "Task 2", "Task 1"]
+        assert response.json["total_count"] == 3
+
+    def test_get_all_tasks_with_unindexed_sort_and_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        unknown_sort = self.make_authenticated_request("GET", account.id, token, query_params="sort_by=description")
+        mismatched_filter = self.make_authenticated_request(
+            "GET", account.id, token, query_params="sort_by=title&updated_after=2024-01-01T00:00:00"
+        )
+        invalid_date = self.make_authenticated_request("GET", account.id, token, query_params="created_after=yesterday")
+
+        self.assert_error_response(unknown_sort, 400, TaskErrorCode.BAD_REQUEST)
+        self.assert_error_response(mismatched_filter, 400, TaskErrorCode.BAD_REQUEST)
+        self.assert_error_response(invalid_date, 400, TaskErrorCode.BAD_REQUEST)
+
     def test_get_all_tasks_no_auth(self) -> None:
         account, _ = self.create_account_and_get_token()
 
@@ -254,6 +369,414 @@ class TestTaskApi(BaseTestTask):
         assert verify_response.status_code == 200
         assert verify_response.json.get("id") == account1_task_id
 
+    def test_move_task_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}"}
+
+        with app.test_client() as client:
+            move_response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, tasks[2].id)}:move",
+                headers=headers,
+                data=json.dumps({"after_id": None}),
+            )
+            list_response = client.get(
+                f"{self.get_task_api_url(account.id)}?sort_by=rank&sort_direction=asc&cursor=", headers=headers
+            )
+
+        assert move_response.status_code == 200
+        assert move_response.json["rank"] < tasks[0].rank
+        assert [item["title"] for item in list_response.json["items"]] == ["Task 3", "Task 1", "Task 2"]
+
+    def test_move_task_requires_after_id(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}:move",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({}),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_task_tags_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}"}
+        tags_url = f"{self.get_task_by_id_api_url(account.id, tasks[0].id)}/tags"
+
+        with app.test_client() as client:
+            add_response = client.post(tags_url, headers=headers, data=json.dumps({"tags": ["work", "urgent"]}))
+            remove_response = client.delete(f"{tags_url}/urgent", headers=headers)
+            list_response = client.get(f"{self.get_task_api_url(account.id)}?tags=work&fields=all", headers=headers)
+            counts_response = client.get(f"{self.get_task_api_url(account.id)}/tags", headers=headers)
+
+        assert add_response.status_code == 200
+        assert add_response.json["tags"] == ["work", "urgent"]
+        assert remove_response.json["tags"] == ["work"]
+        assert [item["id"] for item in list_response.json["items"]] == [tasks[0].id]
+        assert list_response.json["items"][0]["tags"] == ["work"]
+        assert counts_response.json["items"] == [{"tag": "work", "count": 1}]
+
+    def test_add_task_tags_requires_tags(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}/tags",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"tags": []}),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_task_comments_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}"}
+        comments_url = f"{self.get_task_by_id_api_url(account.id, task.id)}/comments"
+
+        with app.test_client() as client:
+            create_responses = [
+                client.post(comments_url, headers=headers, data=json.dumps({"content": f"Comment {i}"}))
+                for i in range(3)
+            ]
+            patch_response = client.patch(
+                f"{comments_url}/{create_responses[0].json['id']}",
+                headers=headers,
+                data=json.dumps({"content": "Edited"}),
+            )
+            delete_response = client.delete(f"{comments_url}/{create_responses[2].json['id']}", headers=headers)
+            first_page = client.get(f"{comments_url}?size=1", headers=headers)
+            second_page = client.get(f"{comments_url}?size=1&cursor={first_page.json['next_cursor']}", headers=headers)
+            task_response = client.get(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}?fields=all", headers=headers
+            )
+
+        assert all(response.status_code == 201 for response in create_responses)
+        assert patch_response.json["content"] == "Edited"
+        assert delete_response.status_code == 204
+        assert [item["content"] for item in first_page.json["items"]] == ["Edited"]
+        assert [item["content"] for item in second_page.json["items"]] == ["Comment 1"]
+        assert second_page.json["next_cursor"] is None
+        assert task_response.json["comment_count"] == 2
+
+    def test_create_task_comment_requires_content(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}/comments",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"content": "  "}),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_task_comments_rejects_large_size(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}/comments?size=100000",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_batch_write_tasks_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        batch_data = {
+            "operations": [
+                {"op": "create", "title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION},
+                {"op": "delete", "task_id": task.id},
+                {"op": "archive", "task_id": task.id},
+            ]
+        }
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:batch",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps(batch_data),
+            )
+
+        assert response.status_code == 200
+        assert response.json.get("success_count") == 2
+        assert response.json.get("error_count") == 1
+        assert response.json["results"][2]["error"]["code"] == TaskErrorCode.BAD_REQUEST
+
+    def test_batch_write_tasks_requires_operations(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:batch",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"operations": []}),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_batch_get_tasks_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        missing_task_id = "507f1f77bcf86cd799439011"
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:batchGet?fields=summary",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"ids": [tasks[1].id, missing_task_id, tasks[0].id]}),
+            )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json["items"]] == [tasks[1].id, tasks[0].id]
+        assert set(response.json["items"][0].keys()) == {"id", "account_id", "title"}
+        assert response.json["missing_ids"] == [missing_task_id]
+
+    def test_batch_get_tasks_requires_ids(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:batchGet",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"ids": []}),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_import_tasks_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        import_body = "".join(
+            json.dumps({"title": f"Imported {i}", "description": self.DEFAULT_TASK_DESCRIPTION}) + "\n"
+            for i in range(3)
+        )
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:import",
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/x-ndjson"},
+                data=import_body,
+            )
+
+        assert response.status_code == 200
+        progress = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert progress[-1]["imported_count"] == 3
+        assert progress[-1]["error_count"] == 0
+
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert list_response.json.get("total_count") == 3
+
+    def test_import_tasks_invalid_format(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_api_url(account.id)}:import?format=xml",
+                headers={"Authorization": f"Bearer {token}"},
+                data="",
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_export_tasks_ndjson(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/export", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        exported_rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert {row["id"] for row in exported_rows} == {task.id for task in tasks}
+
+    def test_export_tasks_csv(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/export?format=csv", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/csv"
+        exported_lines = response.get_data(as_text=True).splitlines()
+        assert exported_lines[0] == "id,title,description,created_at,updated_at"
+        assert len(exported_lines) == 3
+
+    def test_search_tasks_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        other_account = self.create_test_account(username="otheruser@example.com")
+        task = self.create_test_task(account_id=account.id, title="Plan the offsite", description="Book a venue")
+        self.create_test_task(account_id=other_account.id, title="Plan the offsite", description="Book a venue")
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/search?q=offsite", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 200
+        assert [item["task"]["id"] for item in response.json["items"]] == [task.id]
+        assert response.json["items"][0]["snippets"][0]["highlights"] == [[9, 16]]
+
+    def test_search_tasks_requires_query(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/search?q=%20", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_search_tasks_rejects_large_size(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/search?q=offsite&size=100000",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_autocomplete_tasks_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id, title="Quarterly planning")
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/autocomplete?q=quar", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 200
+        assert response.json["items"] == [{"id": task.id, "title": "Quarterly planning"}]
+        assert response.cache_control.private
+        assert response.cache_control.max_age is not None
+
+    def test_autocomplete_tasks_rejects_large_size(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/autocomplete?q=a&size=500",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_task_changes_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with app.test_client() as client:
+            initial_response = client.get(
+                f"{self.get_task_api_url(account.id)}/changes", headers={"Authorization": f"Bearer {token}"}
+            )
+            next_token = quote(initial_response.json["next_token"])
+            delta_response = client.get(
+                f"{self.get_task_api_url(account.id)}/changes?since={next_token}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert initial_response.status_code == 200
+        assert [change["id"] for change in initial_response.json["changes"]] == [task.id]
+        assert delta_response.status_code == 200
+        assert delta_response.json["changes"] == []
+
+    def test_get_task_not_modified_with_matching_etag(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        task_url = self.get_task_by_id_api_url(account.id, task.id)
+
+        with app.test_client() as client:
+            first_response = client.get(task_url, headers={"Authorization": f"Bearer {token}"})
+            etag = first_response.headers["ETag"]
+            cached_response = client.get(task_url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag})
+
+        assert first_response.status_code == 200
+        assert first_response.json["version"] == 1
+        assert cached_response.status_code == 304
+        assert cached_response.data == b""
+
+    def test_get_all_tasks_not_modified_until_a_task_changes(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with app.test_client() as client:
+            first_response = client.get(self.get_task_api_url(account.id), headers={"Authorization": f"Bearer {token}"})
+            etag = first_response.headers["ETag"]
+            cached_response = client.get(
+                self.get_task_api_url(account.id), headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+            )
+
+        self.make_authenticated_request(
+            "PATCH", account.id, token, task_id=task.id, data={"title": "Changed", "description": "Changed"}
+        )
+
+        with app.test_client() as client:
+            changed_response = client.get(
+                self.get_task_api_url(account.id), headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+            )
+
+        assert cached_response.status_code == 304
+        assert changed_response.status_code == 200
+        assert changed_response.json["items"][0]["title"] == "Changed"
+
+    def test_update_task_with_stale_if_match(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        task_url = self.get_task_by_id_api_url(account.id, task.id)
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}"}
+        update_data = json.dumps({"title": "Updated Title", "description": "Updated Description"})
+
+        with app.test_client() as client:
+            etag = client.get(task_url, headers=headers).headers["ETag"]
+            first_update = client.patch(task_url, headers={**headers, "If-Match": etag}, data=update_data)
+            stale_update = client.patch(task_url, headers={**headers, "If-Match": etag}, data=update_data)
+            stale_delete = client.delete(task_url, headers={**headers, "If-Match": etag})
+            current_delete = client.delete(task_url, headers={**headers, "If-Match": first_update.headers["ETag"]})
+
+        assert first_update.status_code == 200
+        assert first_update.json["version"] == 2
+        self.assert_error_response(stale_update, 412, TaskErrorCode.PRECONDITION_FAILED)
+        self.assert_error_response(stale_delete, 412, TaskErrorCode.PRECONDITION_FAILED)
+        assert current_delete.status_code == 204
+
+    def test_create_task_with_idempotency_key_replays_response(self) -> None:
+        account, token = self.create_account_and_get_token()
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}", "Idempotency-Key": "create-task-1"}
+        task_data = json.dumps({"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION})
+
+        with app.test_client() as client:
+            first_response = client.post(self.get_task_api_url(account.id), headers=headers, data=task_data)
+            retried_response = client.post(self.get_task_api_url(account.id), headers=headers, data=task_data)
+            reused_response = client.post(
+                self.get_task_api_url(account.id),
+                headers=headers,
+                data=json.dumps({"title": "Other", "description": self.DEFAULT_TASK_DESCRIPTION}),
+            )
+
+        assert first_response.status_code == 201
+        assert retried_response.status_code == 201
+        assert retried_response.headers["Idempotent-Replayed"] == "true"
+        assert retried_response.json == first_response.json
+        assert retried_response.headers["ETag"] == first_response.headers["ETag"]
+        self.assert_error_response(reused_response, 422, IdempotencyErrorCode.KEY_REUSED)
+        assert TaskRepository.collection().count_documents({"account_id": account.id}) == 1
+
     def test_invalid_json_request_body(self) -> None:
         account, token = self.create_account_and_get_token()
         invalid_json_data = "invalid json"
@@ -0,0 +1,112 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from modules.task.internal.task_cache import InMemoryTaskCacheBackend, MongoTaskCacheBackend, TaskCache
+
+
+class TestTaskCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = InMemoryTaskCacheBackend(max_entries=2, ttl_seconds=60)
+        TaskCache._backend = self.backend
+        TaskCache._initialized = True
+
+    def tearDown(self) -> None:
+        TaskCache._backend = None
+        TaskCache._initialized = False
+        TaskCache._stats_log_interval_seconds = 0
+
+    def get_or_load(self, account_id: str, key: str, value: dict) -> dict:
+        return TaskCache.get_or_load(
+            account_id=account_id, key=key, load=lambda: value, serialize=dict, deserialize=dict
+        )
+
+    def test_in_memory_backend_evicts_least_recently_used_entry(self) -> None:
+        self.backend.set("account", "a", 0, {"value": 1})
+        self.backend.set("account", "b", 0, {"value": 2})
+        self.backend.get("account", "a")
+        self.backend.set("account", "c", 0, {"value": 3})
+
+        assert self.backend.get("account", "b") == (None, 0)
+        assert self.backend.get("account", "a") == ({"value": 1}, 0)
+        assert self.backend.get_stats().evictions == 1
+
+    def test_in_memory_backend_expires_entries(self) -> None:
+        backend = InMemoryTaskCacheBackend(max_entries=2, ttl_seconds=0)
+        backend.set("account", "a", 0, {"value": 1})
+        time.sleep(0.01)
+
+        assert backend.get("account", "a") == (None, 0)
+        assert backend.get_stats().misses == 1
+        assert backend.get_stats().evictions == 1
+
+    def test_get_or_load_returns_cached_value(self) -> None:
+        first_value = self.get_or_load("account", "task:1", {"title": "first"})
+        second_value = self.get_or_load("account", "task:1", {"title": "second"})
+
+        assert first_value == second_value == {"title": "first"}
+        stats = TaskCache.get_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_invalidate_account_only_drops_that_account(self) -> None:
+        self.get_or_load("account", "task:1", {"title": "first"})
+        self.get_or_load("other_account", "task:1", {"title": "other"})
+
+        TaskCache.invalidate_account(account_id="account")
+
+        assert self.get_or_load("account", "task:1", {"title": "second"}) == {"title": "second"}
+        assert self.get_or_load("other_account", "task:1", {"title": "changed"}) == {"title": "other"}
+
+    def test_load_started_before_invalidation_is_not_cached(self) -> None:
+        _, generation = self.backend.get("account", "task:1")
+        TaskCache.invalidate_account(account_id="account")
+        self.backend.set("account", "task:1", generation, {"title": "stale"})
+
+        assert self.get_or_load("account", "task:1", {"title": "fresh"}) == {"title": "fresh"}
+
+    def test_in_memory_backend_bounds_account_generations(self) -> None:
+        self.get_or_load("account", "task:1", {"title": "first"})
+
+        for index in range(10):
+            TaskCache.invalidate_account(account_id=f"account_{index}")
+        TaskCache.invalidate_account(account_id="account")
+
+        assert self.backend.get_generation_count() == 2
+        assert self.get_or_load("account", "task:1", {"title": "second"}) == {"title": "second"}
+
+    def test_in_memory_backend_forgets_expired_account_generations(self) -> None:
+        backend = InMemoryTaskCacheBackend(max_entries=2, ttl_seconds=0)
+        backend.bump_generation("account")
+        time.sleep(0.01)
+
+        assert backend.get_generation_count() == 0
+
+    def test_mongo_backend_counts_every_lookup_across_threads(self) -> None:
+        backend = MongoTaskCacheBackend(ttl_seconds=60)
+
+        def look_up() -> None:
+            for _ in range(1000):
+                backend.get("account", "task:1")
+
+        with patch("modules.task.internal.task_cache.TaskCacheEntryRepository.collection") as collection:
+            collection.return_value.find.return_value = []
+            threads = [threading.Thread(target=look_up) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert backend.get_stats().misses == 8000
+
+    def test_get_or_load_logs_stats_once_per_interval(self) -> None:
+        TaskCache._stats_log_interval_seconds = 60
+        TaskCache._stats_logged_at = time.monotonic() - 60
+
+        with patch("modules.task.internal.task_cache.Logger.info") as log_info:
+            self.get_or_load("account", "task:1", {"title": "first"})
+            self.get_or_load("account", "task:1", {"title": "second"})
+
+        log_info.assert_called_once()
+        assert "0 hits, 1 misses, 0 evictions" in log_info.call_args.kwargs["message"]
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+from modules.task.errors import TaskEventsUnavailableError, TaskEventsUnsupportedError
+from modules.task.internal.task_change_broker import TaskChangeBroker
+from modules.task.types import TaskChangeEvent, TaskChangeEventType
+
+
+class TestTaskChangeBroker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.broker = TaskChangeBroker()
+
+    def build_event(self, account_id: str, task_id: str) -> TaskChangeEvent:
+        return TaskChangeEvent(type=TaskChangeEventType.CREATED, account_id=account_id, task_id=task_id)
+
+    def test_publish_fans_out_to_subscribers_of_the_account(self) -> None:
+        first_subscription = self.broker.subscribe(account_id="account", queue_size=10, max_subscriptions=10)
+        second_subscription = self.broker.subscribe(account_id="account", queue_size=10, max_subscriptions=10)
+        other_subscription = self.broker.subscribe(account_id="other_account", queue_size=10, max_subscriptions=10)
+
+        self.broker.publish(self.build_event("account", "task"))
+
+        assert first_subscription.get(timeout=0).task_id == "task"
+        assert second_subscription.get(timeout=0).task_id == "task"
+        assert other_subscription.get(timeout=0) is None
+
+    def test_full_queue_asks_subscriber_to_resync(self) -> None:
+        slow_subscription = self.broker.subscribe(account_id="account", queue_size=1, max_subscriptions=10)
+        fast_subscription = self.broker.subscribe(account_id="account", queue_size=10, max_subscriptions=10)
+
+        self.broker.publish(self.build_event("account", "first"))
+        self.broker.publish(self.build_event("account", "second"))
+
+        assert slow_subscription.get(timeout=0).type == TaskChangeEventType.RESYNC
+        assert fast_subscription.get(timeout=0).task_id == "first"
+        assert fast_subscription.get(timeout=0).task_id == "second"
+
+    def test_unsubscribed_clients_stop_receiving_events(self) -> None:
+        subscription = self.broker.subscribe(account_id="account", queue_size=10, max_subscriptions=10)
+
+        self.broker.unsubscribe(subscription)
+        self.broker.publish(self.build_event("account", "task"))
+
+        assert subscription.get(timeout=0) is None
+
+    def test_subscribers_over_the_limit_are_refused(self) -> None:
+        subscription = self.broker.subscribe(account_id="account", queue_size=10, max_subscriptions=1)
+
+        with self.assertRaises(TaskEventsUnavailableError):
+            self.broker.subscribe(account_id="other_account", queue_size=10, max_subscriptions=1)
+
+        self.broker.unsubscribe(subscription)
+        self.broker.unsubscribe(subscription)
+        self.broker.subscribe(account_id="other_account", queue_size=10, max_subscriptions=1)
+        with self.assertRaises(TaskEventsUnavailableError):
+            self.broker.subscribe(account_id="account", queue_size=10, max_subscriptions=1)
+
+    def test_standalone_server_is_detected_once(self) -> None:
+        with patch.object(TaskChangeBroker, "_supports_change_streams", return_value=False) as supports_change_streams:
+            for _ in range(2):
+                with self.assertRaises(TaskEventsUnsupportedError):
+                    self.broker.ensure_watching()
+
+        supports_change_streams.assert_called_once()
@@ -0,0 +1,227 @@
+from datetime import datetime
+from typing import Any, Callable
+from unittest.mock import patch
+
+from pymongo.collection import Collection
+from pymongo.cursor import Cursor
+
+from modules.application.common.types import CursorPaginationParams, PaginationParams, SortDirection, SortParams
+from modules.task.constants import TASK_TAGS_SORT_FIELD
+from modules.task.internal.store.task_repository import TASK_SORT_FIELDS
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    AutocompleteTasksParams,
+    CreateTaskCommentParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetPaginatedTasksParams,
+    GetTaskChangesParams,
+    GetTaskCommentsParams,
+    GetTaskParams,
+    GetTasksByIdsParams,
+    SearchTasksParams,
+    TaskExportFormat,
+    TaskFilterParams,
+    TaskTagsMatch,
+)
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestTaskQueryPlans(BaseTestTask):
+    def setUp(self) -> None:
+        super().setUp()
+        self.account = self.create_test_account()
+        self.tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+
+    def explain_queries(self, read: Callable[[], Any]) -> list[dict[str, Any]]:
+        # The reader runs unchanged and every query it sends is recorded, so the plans explained are the real shapes
+        cursors: list[Cursor] = []
+        commands: list[tuple[Collection, dict[str, Any]]] = []
+        find, aggregate, count_documents = Collection.find, Collection.aggregate, Collection.count_documents
+
+        def record_find(collection: Collection, *args: Any, **kwargs: Any) -> Cursor:
+            cursor = find(collection, *args, **kwargs)
+            cursors.append(cursor)
+            return cursor
+
+        def record_aggregate(collection: Collection, pipeline: list[dict[str, Any]], *args: Any, **kwargs: Any) -> Any:
+            commands.append((collection, {"aggregate": collection.name, "pipeline": pipeline, "cursor": {}}))
+            return aggregate(collection, pipeline, *args, **kwargs)
+
+        def record_count_documents(
+            collection: Collection, filter_query: dict[str, Any], *args: Any, **kwargs: Any
+        ) -> int:
+            commands.append((collection, {"count": collection.name, "query": filter_query}))
+            return count_documents(collection, filter_query, *args, **kwargs)
+
+        with (
+            patch.object(Collection, "find", autospec=True, side_effect=record_find),
+            patch.object(Collection, "aggregate", autospec=True, side_effect=record_aggregate),
+            patch.object(Collection, "count_documents", autospec=True, side_effect=record_count_documents),
+        ):
+            read()
+
+        explanations = [cursor.explain() for cursor in cursors]
+        explanations.extend(
+            collection.database.command("explain", command, verbosity="queryPlanner")
+            for collection, command in commands
+        )
+        assert explanations, "The reader sent no queries"
+        return explanations
+
+    def get_winning_plans(self, explanation: Any) -> list[Any]:
+        if isinstance(explanation, dict):
+            if "winningPlan" in explanation:
+                return [explanation["winningPlan"]]
+            return [plan for value in explanation.values() for plan in self.get_winning_plans(value)]
+        if isinstance(explanation, list):
+            return [plan for value in explanation for plan in self.get_winning_plans(value)]
+        return []
+
+    def get_plan_stages(self, plan: Any) -> list[str]:
+        stages = []
+        if isinstance(plan, dict):
+            if "stage" in plan:
+                stages.append(plan["stage"])
+            for value in plan.values():
+                stages.extend(self.get_plan_stages(value))
+        elif isinstance(plan, list):
+            for value in plan:
+                stages.extend(self.get_plan_stages(value))
+        return stages
+
+    def assert_queries_use_index(self, read: Callable[[], Any], allow_sort: bool = False) -> None:
+        for explanation in self.explain_queries(read):
+            stages = self.get_plan_stages(self.get_winning_plans(explanation))
+
+            assert "COLLSCAN" not in stages, f"Expected an index scan, got stages {stages}"
+            assert allow_sort or "SORT" not in stages, f"Expected the sort to be served by an index, got {stages}"
+            assert any(
+                "IXSCAN" in stage or "IDHACK" in stage or stage == "COUNT_SCAN" for stage in stages
+            ), f"No index used in stages {stages}"
+
+    def get_list_params(self, **kwargs: Any) -> GetPaginatedTasksParams:
+        return GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=2, size=2, offset=0), **kwargs
+        )
+
+    def get_next_page_params(self, **kwargs: Any) -> GetCursorPaginatedTasksParams:
+        first_page = TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=self.account.id, pagination_params=CursorPaginationParams(size=2), **kwargs
+            )
+        )
+        assert first_page.next_cursor is not None
+        return GetCursorPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=CursorPaginationParams(size=2, cursor=first_page.next_cursor),
+            **kwargs,
+        )
+
+    def test_get_task_query_uses_index(self) -> None:
+        params = GetTaskParams(account_id=self.account.id, task_id=self.tasks[0].id)
+
+        self.assert_queries_use_index(lambda: TaskService.get_task(params=params))
+
+    def test_batch_get_query_uses_index(self) -> None:
+        params = GetTasksByIdsParams(account_id=self.account.id, task_ids=[task.id for task in self.tasks])
+
+        self.assert_queries_use_index(lambda: TaskService.get_tasks_by_ids(params=params))
+
+    def test_default_list_query_uses_index(self) -> None:
+        params = self.get_list_params()
+
+        self.assert_queries_use_index(lambda: TaskService.get_paginated_tasks(params=params))
+
+    def test_sorted_list_queries_use_index(self) -> None:
+        for sort_field in TASK_SORT_FIELDS:
+            for sort_direction in SortDirection:
+                params = self.get_list_params(sort_params=SortParams(sort_by=sort_field, sort_direction=sort_direction))
+
+                self.assert_queries_use_index(lambda: TaskService.get_paginated_tasks(params=params))
+
+    def test_cursor_list_queries_use_index(self) -> None:
+        for sort_field in TASK_SORT_FIELDS:
+            for sort_direction in SortDirection:
+                params = self.get_next_page_params(
+                    sort_params=SortParams(sort_by=sort_field, sort_direction=sort_direction)
+                )
+
+                self.assert_queries_use_index(lambda: TaskService.get_cursor_paginated_tasks(params=params))
+
+    def test_filtered_list_queries_use_index(self) -> None:
+        filters = {
+            "created_at": TaskFilterParams(created_before=datetime.now()),
+            "updated_at": TaskFilterParams(updated_after=datetime(2024, 1, 1)),
+            "title": TaskFilterParams(title_prefix="Task"),
+        }
+
+        for sort_field, filter_params in filters.items():
+            for sort_direction in SortDirection:
+                sort_params = SortParams(sort_by=sort_field, sort_direction=sort_direction)
+                list_params = self.get_list_params(sort_params=sort_params, filter_params=filter_params)
+                cursor_params = self.get_next_page_params(sort_params=sort_params, filter_params=filter_params)
+
+                self.assert_queries_use_index(lambda: TaskService.get_paginated_tasks(params=list_params))
+                self.assert_queries_use_index(lambda: TaskService.get_cursor_paginated_tasks(params=cursor_params))
+
+    def test_tag_filtered_list_queries_use_index(self) -> None:
+        for tags_match in TaskTagsMatch:
+            params = self.get_list_params(
+                sort_params=SortParams(sort_by=TASK_TAGS_SORT_FIELD, sort_direction=SortDirection.DESC),
+                filter_params=TaskFilterParams(tags=["work", "home"], tags_match=tags_match),
+            )
+
+            self.assert_queries_use_index(lambda: TaskService.get_paginated_tasks(params=params))
+
+    def test_export_query_uses_index(self) -> None:
+        params = ExportTasksParams(account_id=self.account.id, batch_size=2, export_format=TaskExportFormat.NDJSON)
+
+        self.assert_queries_use_index(lambda: list(TaskService.export_tasks(params=params)))
+
+    def test_autocomplete_query_uses_index(self) -> None:
+        params = AutocompleteTasksParams(account_id=self.account.id, query="tas 1", size=10)
+
+        self.assert_queries_use_index(lambda: TaskService.autocomplete_tasks(params=params))
+
+    def test_search_query_uses_text_index(self) -> None:
+        params = SearchTasksParams(
+            account_id=self.account.id, pagination_params=CursorPaginationParams(size=2), query="Task"
+        )
+        first_page = TaskService.search_tasks(params=params)
+        next_page_params = SearchTasksParams(
+            account_id=self.account.id,
+            pagination_params=CursorPaginationParams(size=2, cursor=first_page.next_cursor),
+            query="Task",
+        )
+
+        assert first_page.next_cursor is not None
+        # Text score ordering never comes from an index, so only the match has to use one
+        self.assert_queries_use_index(lambda: TaskService.search_tasks(params=params), allow_sort=True)
+        self.assert_queries_use_index(lambda: TaskService.search_tasks(params=next_page_params), allow_sort=True)
+
+    def test_changes_query_uses_index(self) -> None:
+        first_page = TaskService.get_task_changes(params=GetTaskChangesParams(account_id=self.account.id, size=2))
+        params = GetTaskChangesParams(account_id=self.account.id, size=2, since=first_page.next_token)
+
+        assert first_page.has_more
+        self.assert_queries_use_index(lambda: TaskService.get_task_changes(params=params))
+
+    def test_comments_query_uses_index(self) -> None:
+        task_id = self.tasks[0].id
+        for i in range(3):
+            TaskService.create_task_comment(
+                params=CreateTaskCommentParams(account_id=self.account.id, task_id=task_id, content=f"Comment {i}")
+            )
+        first_page = TaskService.get_task_comments(
+            params=GetTaskCommentsParams(
+                account_id=self.account.id, task_id=task_id, pagination_params=CursorPaginationParams(size=2)
+            )
+        )
+        params = GetTaskCommentsParams(
+            account_id=self.account.id,
+            task_id=task_id,
+            pagination_params=CursorPaginationParams(size=2, cursor=first_page.next_cursor),
+        )
+
+        self.assert_queries_use_index(lambda: TaskService.get_task_comments(params=params))
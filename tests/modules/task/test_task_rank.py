@@ -0,0 +1,59 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from modules.task.internal.task_util import RANK_DIGITS, TaskUtil
+
+
+class TestTaskRank(unittest.TestCase):
+    def assert_between(self, rank: str, lower: str, upper: str = None) -> None:
+        assert rank > lower, f"{rank} does not sort after {lower}"
+        assert upper is None or rank < upper, f"{rank} does not sort before {upper}"
+        assert not rank.endswith(RANK_DIGITS[0]), f"{rank} ends in the zero digit"
+
+    def test_appended_and_prepended_ranks_keep_a_fixed_length(self) -> None:
+        initial_rank = TaskUtil.get_initial_rank()
+        ranks = [initial_rank]
+        for _ in range(100):
+            ranks.append(TaskUtil.get_rank_after(ranks[-1]))
+            ranks.insert(0, TaskUtil.get_rank_before(ranks[0]))
+
+        assert ranks == sorted(ranks)
+        assert {len(rank) for rank in ranks} == {len(initial_rank)}
+
+    def test_rank_between_sorts_strictly_between_neighbours(self) -> None:
+        ranks = [TaskUtil.get_initial_rank()]
+        ranks.append(TaskUtil.get_rank_after(ranks[0]))
+        random.seed(0)
+
+        for _ in range(2000):
+            index = random.randrange(1, len(ranks))
+            rank = TaskUtil.get_rank_between(ranks[index - 1], ranks[index])
+
+            self.assert_between(rank, ranks[index - 1], ranks[index])
+            ranks.insert(index, rank)
+
+    def test_rank_before_and_after_the_ends_of_the_rank_space(self) -> None:
+        first_rank = TaskUtil.get_rank_between("", "0000001")
+        last_rank = RANK_DIGITS[-1] * 8
+
+        self.assert_between(TaskUtil.get_rank_before(first_rank), "", first_rank)
+        self.assert_between(TaskUtil.get_rank_after(last_rank), last_rank)
+
+    def test_rank_between_equal_ranks_sorts_after_both(self) -> None:
+        rank = TaskUtil.get_initial_rank()
+
+        self.assert_between(TaskUtil.get_rank_between(rank, rank), rank)
+
+    def test_append_ranks_sort_after_earlier_appends_and_existing_ranks(self) -> None:
+        created_at = datetime.now()
+        task_ids = [ObjectId() for _ in range(3)]
+        ranks = [TaskUtil.get_append_rank(created_at, task_id) for task_id in task_ids]
+        ranks.append(TaskUtil.get_append_rank(created_at + timedelta(milliseconds=1), ObjectId()))
+
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == len(ranks)
+        assert ranks[0] > TaskUtil.get_rank_after(TaskUtil.get_initial_rank())
+        self.assert_between(TaskUtil.get_rank_between(ranks[0], ranks[1]), ranks[0], ranks[1])
@@ -1,14 +1,52 @@
 from datetime import datetime
-
-from modules.application.common.types import PaginationParams
-from modules.task.errors import TaskNotFoundError
+from typing import Any
+from unittest.mock import patch
+
+from bson.objectid import ObjectId
+
+from modules.application.common.types import CursorPaginationParams, PaginationParams, SortDirection, SortParams
+from modules.application.repository import ApplicationRepositoryClient
+from modules.task.errors import (
+    TaskBadRequestError,
+    TaskCommentNotFoundError,
+    TaskEventsUnsupportedError,
+    TaskNotFoundError,
+)
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_count_writer import TaskCountWriter
+from modules.task.internal.task_writer import TaskWriter
 from modules.task.task_service import TaskService
 from modules.task.types import (
+    AddTaskTagsParams,
+    AutocompleteTasksParams,
+    BatchWriteTasksParams,
+    CreateTaskCommentParams,
     CreateTaskParams,
+    DeleteTaskCommentParams,
     DeleteTaskParams,
+    GetCursorPaginatedTasksParams,
     GetPaginatedTasksParams,
+    GetTaskChangesParams,
+    GetTaskCommentsParams,
     GetTaskParams,
+    GetTaskTagCountsParams,
+    GetTasksByIdsParams,
+    ImportTasksParams,
+    MoveTaskParams,
+    RemoveTaskTagParams,
+    SearchTasksParams,
+    StreamTaskChangesParams,
+    TaskBatchOperation,
+    TaskBatchOperationType,
+    TaskChangeEventType,
     TaskErrorCode,
+    TaskField,
+    TaskFilterParams,
+    TaskImportFormat,
+    TaskTagCount,
+    TaskTagsMatch,
+    UpdateTaskCommentParams,
     UpdateTaskParams,
 )
 from tests.modules.task.base_test_task import BaseTestTask
@@ -41,6 +79,17 @@ class TestTaskService(BaseTestTask):
         assert retrieved_task.title == self.DEFAULT_TASK_TITLE
         assert retrieved_task.description == self.DEFAULT_TASK_DESCRIPTION
 
+    def test_get_task_with_fields_skips_unrequested_fields(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+
+        task = TaskService.get_task(
+            params=GetTaskParams(account_id=self.account.id, task_id=created_task.id, fields=[TaskField.TITLE])
+        )
+
+        assert task.id == created_task.id
+        assert task.title == created_task.title
+        assert task.description is None
+
     def test_get_task_for_account_not_found(self) -> None:
         non_existent_task_id = "507f1f77bcf86cd799439011"
         get_params = GetTaskParams(account_id=self.account.id, task_id=non_existent_task_id)
@@ -50,6 +99,22 @@ class TestTaskService(BaseTestTask):
 
         assert context.exception.code == TaskErrorCode.NOT_FOUND
 
+    def test_get_tasks_by_ids_preserves_order_and_reports_missing(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        other_account = self.create_test_account(username="other@example.com")
+        other_task = self.create_test_task(account_id=other_account.id)
+        missing_task_id = "507f1f77bcf86cd799439011"
+
+        result = TaskService.get_tasks_by_ids(
+            params=GetTasksByIdsParams(
+                account_id=self.account.id,
+                task_ids=[tasks[2].id, missing_task_id, tasks[0].id, other_task.id, "not-an-id", tasks[2].id],
+            )
+        )
+
+        assert [task.id for task in result.items] == [tasks[2].id, tasks[0].id]
+        assert result.missing_ids == [missing_task_id, other_task.id, "not-an-id"]
+
     def test_get_paginated_tasks_empty(self) -> None:
         pagination_params = PaginationParams(page=1, size=10, offset=0)
         get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
@@ -95,6 +160,145 @@ class TestTaskService(BaseTestTask):
         assert result.pagination_params.page == 1
         assert result.pagination_params.size == 1
 
+    def test_get_paginated_tasks_total_count_tracks_writes(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=tasks[0].id))
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0)
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count == 2
+        assert result.total_pages == 1
+
+    def test_get_paginated_tasks_without_total(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            include_total=False,
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+        assert result.total_pages is None
+
+    def test_reconcile_task_counts_repairs_drift(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskCountRepository.collection().update_one(
+            {"account_id": self.account.id}, {"$set": {"active_task_count": 42}}
+        )
+
+        reconciliation_result = TaskService.reconcile_task_counts()
+
+        assert reconciliation_result.accounts_repaired == 1
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0)
+        )
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 3
+
+    def test_reconcile_task_counts_keeps_concurrent_increments(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskCountRepository.collection().update_one(
+            {"account_id": self.account.id}, {"$set": {"active_task_count": 42}}
+        )
+        get_repair_operation = TaskCountWriter._get_repair_operation
+
+        def create_task_before_repair(**kwargs: Any) -> Any:
+            self.create_test_task(account_id=self.account.id)
+            return get_repair_operation(**kwargs)
+
+        with patch.object(TaskCountWriter, "_get_repair_operation", side_effect=create_task_before_repair):
+            reconciliation_result = TaskService.reconcile_task_counts()
+
+        assert reconciliation_result.accounts_repaired == 0
+        task_count_bson = TaskCountRepository.collection().find_one({"account_id": self.account.id})
+        assert task_count_bson is not None
+        assert task_count_bson["active_task_count"] == 43
+
+    def test_get_cursor_paginated_tasks(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=CursorPaginationParams(size=3)
+        )
+
+        first_page = TaskService.get_cursor_paginated_tasks(params=get_params)
+
+        assert [task.title for task in first_page.items] == ["Task 5", "Task 4", "Task 3"]
+        assert first_page.next_cursor is not None
+
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=CursorPaginationParams(size=3, cursor=first_page.next_cursor)
+        )
+        second_page = TaskService.get_cursor_paginated_tasks(params=get_params)
+
+        assert [task.title for task in second_page.items] == ["Task 2", "Task 1"]
+        assert second_page.next_cursor is None
+
+    def test_get_cursor_paginated_tasks_with_title_prefix_filter(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        self.create_test_task(account_id=self.account.id, title="Other")
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=CursorPaginationParams(size=2),
+            sort_params=SortParams(sort_by="title", sort_direction=SortDirection.ASC),
+            filter_params=TaskFilterParams(title_prefix="Task"),
+        )
+
+        first_page = TaskService.get_cursor_paginated_tasks(params=get_params)
+        second_page = TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=CursorPaginationParams(size=2, cursor=first_page.next_cursor),
+                sort_params=get_params.sort_params,
+                filter_params=get_params.filter_params,
+            )
+        )
+
+        assert [task.title for task in first_page.items] == ["Task 1", "Task 2"]
+        assert [task.title for task in second_page.items] == ["Task 3"]
+
+    def test_get_paginated_tasks_with_created_at_range(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        created_before = datetime.now()
+        self.create_test_task(account_id=self.account.id, title="Later")
+
+        result = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=PaginationParams(page=1, size=10, offset=0),
+                filter_params=TaskFilterParams(created_before=created_before),
+            )
+        )
+
+        assert [task.title for task in result.items] == ["Task 2", "Task 1"]
+        assert result.total_count == 2
+
+    def test_get_paginated_tasks_rejects_filter_without_matching_index(self) -> None:
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            sort_params=SortParams(sort_by="title", sort_direction=SortDirection.ASC),
+            filter_params=TaskFilterParams(created_before=datetime.now()),
+        )
+
+        with self.assertRaises(TaskBadRequestError):
+            TaskService.get_paginated_tasks(params=get_params)
+
+    def test_get_cursor_paginated_tasks_invalid_cursor(self) -> None:
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=CursorPaginationParams(size=3, cursor="not-a-cursor")
+        )
+
+        with self.assertRaises(TaskBadRequestError) as context:
+            TaskService.get_cursor_paginated_tasks(params=get_params)
+
+        assert context.exception.code == TaskErrorCode.BAD_REQUEST
+
     def test_update_task(self) -> None:
         created_task = self.create_test_task(
             account_id=self.account.id, title="Original Title", description="Original Description"
@@ -151,6 +355,477 @@ class TestTaskService(BaseTestTask):
 
         assert context.exception.code == TaskErrorCode.NOT_FOUND
 
+    def test_move_task_updates_only_the_moved_task(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=4)
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=CursorPaginationParams(size=10),
+            sort_params=SortParams(sort_by="rank", sort_direction=SortDirection.ASC),
+        )
+
+        moved_task = TaskService.move_task(
+            params=MoveTaskParams(account_id=self.account.id, task_id=tasks[3].id, after_task_id=tasks[0].id)
+        )
+        TaskService.move_task(params=MoveTaskParams(account_id=self.account.id, task_id=tasks[2].id))
+        ordered_tasks = TaskService.get_cursor_paginated_tasks(params=get_params).items
+
+        assert [task.title for task in ordered_tasks] == ["Task 3", "Task 1", "Task 4", "Task 2"]
+        assert moved_task.version == 2
+        assert ordered_tasks[3].rank == tasks[1].rank
+        assert ordered_tasks[3].version == tasks[1].version
+
+    def test_move_task_after_missing_task(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+
+        with self.assertRaises(TaskNotFoundError):
+            TaskService.move_task(
+                params=MoveTaskParams(
+                    account_id=self.account.id, task_id=task.id, after_task_id="507f1f77bcf86cd799439011"
+                )
+            )
+
+    def test_task_tags_keep_tag_counts_in_sync(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+
+        tagged_task = TaskService.add_task_tags(
+            params=AddTaskTagsParams(account_id=self.account.id, task_id=tasks[0].id, tags=["Work", "urgent"])
+        )
+        TaskService.add_task_tags(
+            params=AddTaskTagsParams(account_id=self.account.id, task_id=tasks[0].id, tags=["work"])
+        )
+        TaskService.add_task_tags(
+            params=AddTaskTagsParams(account_id=self.account.id, task_id=tasks[1].id, tags=["work"])
+        )
+        untagged_task = TaskService.remove_task_tag(
+            params=RemoveTaskTagParams(account_id=self.account.id, task_id=tasks[0].id, tag="urgent")
+        )
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=tasks[1].id))
+
+        assert tagged_task.tags == ["work", "urgent"]
+        assert untagged_task.tags == ["work"]
+        assert TaskService.get_task_tag_counts(params=GetTaskTagCountsParams(account_id=self.account.id)) == [
+            TaskTagCount(tag="work", count=1)
+        ]
+
+    def test_add_task_tags_rejects_too_many_tags(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        TaskService.add_task_tags(
+            params=AddTaskTagsParams(account_id=self.account.id, task_id=task.id, tags=[f"tag{i}" for i in range(20)])
+        )
+
+        with self.assertRaises(TaskBadRequestError):
+            TaskService.add_task_tags(
+                params=AddTaskTagsParams(account_id=self.account.id, task_id=task.id, tags=["one-more"])
+            )
+
+    def test_get_paginated_tasks_filtered_by_tags(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskService.add_task_tags(
+            params=AddTaskTagsParams(account_id=self.account.id, task_id=tasks[0].id, tags=["home", "errand"])
+        )
+        TaskService.add_task_tags(
+            params=AddTaskTagsParams(account_id=self.account.id, task_id=tasks[1].id, tags=["home"])
+        )
+
+        def get_titles(tags_match: TaskTagsMatch) -> list:
+            result = TaskService.get_paginated_tasks(
+                params=GetPaginatedTasksParams(
+                    account_id=self.account.id,
+                    pagination_params=PaginationParams(page=1, size=10, offset=0),
+                    filter_params=TaskFilterParams(tags=["home", "errand"], tags_match=tags_match),
+                )
+            )
+            return [task.title for task in result.items]
+
+        assert get_titles(TaskTagsMatch.ANY) == ["Task 2", "Task 1"]
+        assert get_titles(TaskTagsMatch.ALL) == ["Task 1"]
+
+    def test_task_comments_keep_comment_count_in_sync(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+
+        comments = [
+            TaskService.create_task_comment(
+                params=CreateTaskCommentParams(account_id=self.account.id, task_id=task.id, content=f"Comment {i}")
+            )
+            for i in range(3)
+        ]
+        TaskService.delete_task_comment(
+            params=DeleteTaskCommentParams(account_id=self.account.id, task_id=task.id, comment_id=comments[1].id)
+        )
+        updated_task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id))
+
+        assert updated_task.comment_count == 2
+        assert updated_task.version == task.version + 4
+
+        with self.assertRaises(TaskCommentNotFoundError):
+            TaskService.delete_task_comment(
+                params=DeleteTaskCommentParams(account_id=self.account.id, task_id=task.id, comment_id=comments[1].id)
+            )
+
+    def test_get_task_comments_pages_oldest_first(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        for i in range(5):
+            TaskService.create_task_comment(
+                params=CreateTaskCommentParams(account_id=self.account.id, task_id=task.id, content=f"Comment {i}")
+            )
+        TaskService.create_task_comment(
+            params=CreateTaskCommentParams(
+                account_id=self.account.id,
+                task_id=self.create_test_task(account_id=self.account.id).id,
+                content="Other",
+            )
+        )
+
+        contents = []
+        cursor = None
+        while True:
+            page = TaskService.get_task_comments(
+                params=GetTaskCommentsParams(
+                    account_id=self.account.id,
+                    task_id=task.id,
+                    pagination_params=CursorPaginationParams(size=2, cursor=cursor),
+                )
+            )
+            contents.extend(comment.content for comment in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert contents == [f"Comment {i}" for i in range(5)]
+
+    def test_update_task_comment(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        comment = TaskService.create_task_comment(
+            params=CreateTaskCommentParams(account_id=self.account.id, task_id=task.id, content="Draft")
+        )
+
+        updated_comment = TaskService.update_task_comment(
+            params=UpdateTaskCommentParams(
+                account_id=self.account.id, task_id=task.id, comment_id=comment.id, content="Final"
+            )
+        )
+
+        assert updated_comment.id == comment.id
+        assert updated_comment.content == "Final"
+        assert updated_comment.created_at == comment.created_at
+
+    def test_task_comments_of_deleted_task_cannot_be_changed(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        comment = TaskService.create_task_comment(
+            params=CreateTaskCommentParams(account_id=self.account.id, task_id=task.id, content="Draft")
+        )
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=task.id))
+
+        with self.assertRaises(TaskNotFoundError):
+            TaskService.update_task_comment(
+                params=UpdateTaskCommentParams(
+                    account_id=self.account.id, task_id=task.id, comment_id=comment.id, content="Final"
+                )
+            )
+        with self.assertRaises(TaskNotFoundError):
+            TaskService.delete_task_comment(
+                params=DeleteTaskCommentParams(account_id=self.account.id, task_id=task.id, comment_id=comment.id)
+            )
+
+    def test_create_task_comment_on_missing_task(self) -> None:
+        with self.assertRaises(TaskNotFoundError):
+            TaskService.create_task_comment(
+                params=CreateTaskCommentParams(
+                    account_id=self.account.id, task_id="507f1f77bcf86cd799439011", content="Orphan"
+                )
+            )
+
+    def test_batch_write_tasks(self) -> None:
+        existing_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        operations = [
+            TaskBatchOperation(op=TaskBatchOperationType.CREATE, title="Batch Task", description="Batch Description"),
+            TaskBatchOperation(
+                op=TaskBatchOperationType.UPDATE,
+                task_id=existing_tasks[0].id,
+                title="Updated Title",
+                description="Updated Description",
+            ),
+            TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id=existing_tasks[1].id),
+            TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id="507f1f77bcf86cd799439011"),
+            TaskBatchOperation(op=TaskBatchOperationType.CREATE, title="Missing Description"),
+        ]
+
+        result = TaskService.batch_write_tasks(
+            params=BatchWriteTasksParams(account_id=self.account.id, operations=operations)
+        )
+
+        assert result.success_count == 3
+        assert result.error_count == 2
+        assert [item.success for item in result.results] == [True, True, True, False, False]
+        assert result.results[3].error.code == TaskErrorCode.NOT_FOUND
+        assert result.results[4].error.code == TaskErrorCode.BAD_REQUEST
+
+        created_task = TaskService.get_task(
+            params=GetTaskParams(account_id=self.account.id, task_id=result.results[0].task_id)
+        )
+        assert created_task.title == "Batch Task"
+        updated_task = TaskService.get_task(
+            params=GetTaskParams(account_id=self.account.id, task_id=existing_tasks[0].id)
+        )
+        assert updated_task.title == "Updated Title"
+        with self.assertRaises(TaskNotFoundError):
+            TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=existing_tasks[1].id))
+
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        list_result = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+        )
+        assert list_result.total_count == 2
+
+    def test_batch_write_tasks_rejects_duplicate_task_ids(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        operations = [
+            TaskBatchOperation(op=TaskBatchOperationType.UPDATE, task_id=task.id, title="First", description="First"),
+            TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id=task.id),
+        ]
+
+        result = TaskService.batch_write_tasks(
+            params=BatchWriteTasksParams(account_id=self.account.id, operations=operations)
+        )
+
+        assert [item.success for item in result.results] == [True, False]
+        assert TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id)).title == "First"
+
+    def test_batch_write_tasks_rejects_non_string_fields(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        operations = [
+            TaskBatchOperation(
+                op=TaskBatchOperationType.CREATE, task_id=["unhashable"], title="Title", description="Body"
+            ),
+            TaskBatchOperation(op=TaskBatchOperationType.UPDATE, task_id=task.id, title=123, description="Body"),
+            TaskBatchOperation(op=TaskBatchOperationType.CREATE, title="Title", description={"text": "Body"}),
+        ]
+
+        result = TaskService.batch_write_tasks(
+            params=BatchWriteTasksParams(account_id=self.account.id, operations=operations)
+        )
+
+        assert result.success_count == 0
+        assert [item.error.code for item in result.results] == [TaskErrorCode.BAD_REQUEST] * 3
+        assert (
+            TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id)).title == task.title
+        )
+
+    def test_batch_write_tasks_reports_tasks_deleted_concurrently(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        get_existing_task_tags = TaskWriter._get_existing_task_tags
+
+        def delete_tasks_after_existence_check(*, params: BatchWriteTasksParams) -> Any:
+            existing_task_tags = get_existing_task_tags(params=params)
+            for task in tasks[:2]:
+                TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=task.id))
+            return existing_task_tags
+
+        operations = [
+            TaskBatchOperation(op=TaskBatchOperationType.UPDATE, task_id=tasks[0].id, title="Late", description="Late"),
+            TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id=tasks[1].id),
+            TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id=tasks[2].id),
+        ]
+        with patch.object(TaskWriter, "_get_existing_task_tags", side_effect=delete_tasks_after_existence_check):
+            result = TaskService.batch_write_tasks(
+                params=BatchWriteTasksParams(account_id=self.account.id, operations=operations)
+            )
+
+        assert [item.success for item in result.results] == [False, False, True]
+        assert result.results[0].error.code == TaskErrorCode.NOT_FOUND
+        assert result.results[1].error.code == TaskErrorCode.NOT_FOUND
+        count_bson = TaskCountRepository.collection().find_one({"account_id": self.account.id})
+        assert count_bson["active_task_count"] == 0
+
+    def test_import_tasks_reports_progress_per_chunk(self) -> None:
+        lines = [f'{{"title": "Task {i}", "description": "Description {i}"}}\n' for i in range(5)]
+        lines.insert(2, "not json\n")
+        import_params = ImportTasksParams(
+            account_id=self.account.id, chunk_size=2, import_format=TaskImportFormat.NDJSON, lines=iter(lines)
+        )
+
+        progress = list(TaskService.import_tasks(params=import_params))
+
+        assert [item.chunk for item in progress] == [1, 2, 3]
+        assert progress[-1].imported_count == 5
+        assert progress[-1].error_count == 1
+        assert progress[1].errors[0].line_number == 3
+
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        list_result = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+        )
+        assert list_result.total_count == 5
+
+    def test_import_tasks_from_csv(self) -> None:
+        lines = ["title,description\n", "CSV Task,CSV Description\n", ",Missing Title\n"]
+        import_params = ImportTasksParams(
+            account_id=self.account.id, chunk_size=100, import_format=TaskImportFormat.CSV, lines=iter(lines)
+        )
+
+        progress = list(TaskService.import_tasks(params=import_params))
+
+        assert len(progress) == 1
+        assert progress[0].imported_count == 1
+        assert progress[0].errors[0].message == "Title is required"
+
+    def test_search_tasks_ranks_and_pages_by_text_score(self) -> None:
+        self.create_test_task(account_id=self.account.id, title="Quarterly report", description="Draft the report")
+        self.create_test_task(account_id=self.account.id, title="Groceries", description="Milk and a report card")
+        self.create_test_task(account_id=self.account.id, title="Groceries", description="Milk and eggs")
+
+        first_page = TaskService.search_tasks(
+            params=SearchTasksParams(
+                account_id=self.account.id, pagination_params=CursorPaginationParams(size=1), query="report"
+            )
+        )
+        second_page = TaskService.search_tasks(
+            params=SearchTasksParams(
+                account_id=self.account.id,
+                pagination_params=CursorPaginationParams(size=1, cursor=first_page.next_cursor),
+                query="report",
+            )
+        )
+
+        assert first_page.items[0].task.title == "Quarterly report"
+        assert first_page.items[0].snippets[0].field == "title"
+        assert first_page.items[0].snippets[0].highlights == [[10, 16]]
+        assert second_page.items[0].task.title == "Groceries"
+        assert second_page.items[0].score < first_page.items[0].score
+        assert second_page.next_cursor is None
+
+    def test_autocomplete_tasks_matches_word_prefixes(self) -> None:
+        resume_task = self.create_test_task(account_id=self.account.id, title="Update my Résumé")
+        self.create_test_task(account_id=self.account.id, title="Resupply the office")
+        self.create_test_task(account_id=self.account.id, title="Weekly sync")
+
+        single_word_result = TaskService.autocomplete_tasks(
+            params=AutocompleteTasksParams(account_id=self.account.id, query="RES", size=10)
+        )
+        multi_word_result = TaskService.autocomplete_tasks(
+            params=AutocompleteTasksParams(account_id=self.account.id, query="up resu", size=10)
+        )
+
+        assert {item.title for item in single_word_result.items} == {"Update my Résumé", "Resupply the office"}
+        assert [item.id for item in multi_word_result.items] == [resume_task.id]
+
+    def test_autocomplete_tasks_follows_title_updates(self) -> None:
+        task = self.create_test_task(account_id=self.account.id, title="Original title")
+        TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id, task_id=task.id, title="Renamed", description=task.description
+            )
+        )
+
+        original_result = TaskService.autocomplete_tasks(
+            params=AutocompleteTasksParams(account_id=self.account.id, query="orig", size=10)
+        )
+        renamed_result = TaskService.autocomplete_tasks(
+            params=AutocompleteTasksParams(account_id=self.account.id, query="ren", size=10)
+        )
+
+        assert original_result.items == []
+        assert [item.id for item in renamed_result.items] == [task.id]
+
+    def test_get_task_changes_returns_writes_since_token(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+
+        initial_sync = TaskService.get_task_changes(params=GetTaskChangesParams(account_id=self.account.id, size=2))
+        remaining_sync = TaskService.get_task_changes(
+            params=GetTaskChangesParams(account_id=self.account.id, size=2, since=initial_sync.next_token)
+        )
+
+        assert initial_sync.has_more
+        assert [change.id for change in initial_sync.changes] == [tasks[0].id, tasks[1].id]
+        assert not remaining_sync.has_more
+        assert [change.id for change in remaining_sync.changes] == [tasks[2].id]
+
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=tasks[0].id))
+        TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id, task_id=tasks[1].id, title="Updated Title", description="Updated"
+            )
+        )
+        delta_sync = TaskService.get_task_changes(
+            params=GetTaskChangesParams(account_id=self.account.id, size=10, since=remaining_sync.next_token)
+        )
+
+        assert [(change.id, change.deleted) for change in delta_sync.changes] == [
+            (tasks[0].id, True),
+            (tasks[1].id, False),
+        ]
+        assert delta_sync.changes[0].task is None
+        assert delta_sync.changes[1].task.title == "Updated Title"
+
+        empty_sync = TaskService.get_task_changes(
+            params=GetTaskChangesParams(account_id=self.account.id, size=10, since=delta_sync.next_token)
+        )
+        assert empty_sync.changes == []
+        assert empty_sync.next_token == delta_sync.next_token
+
+    def test_backfill_ranks_bumps_version_and_updated_at(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        get_params = GetTaskParams(account_id=self.account.id, task_id=task.id)
+        unranked_task_bson = TaskRepository.collection().find_one_and_update(
+            {"_id": ObjectId(task.id)}, {"$unset": {"rank": ""}}
+        )
+        unranked_task = TaskService.get_task(params=get_params)
+
+        updated_count = TaskService.backfill_ranks(batch_size=10)
+        backfilled_task = TaskService.get_task(params=get_params)
+        backfilled_task_bson = TaskRepository.collection().find_one({"_id": ObjectId(task.id)})
+
+        assert unranked_task.rank is None
+        assert updated_count == 1
+        assert backfilled_task.rank is not None
+        assert backfilled_task.version == unranked_task.version + 1
+        assert backfilled_task_bson["updated_at"] > unranked_task_bson["updated_at"]
+
+    def test_get_task_changes_invalid_token(self) -> None:
+        with self.assertRaises(TaskBadRequestError):
+            TaskService.get_task_changes(
+                params=GetTaskChangesParams(account_id=self.account.id, size=10, since="not-a-token")
+            )
+
+    def test_stream_task_changes_receives_writes(self) -> None:
+        if not ApplicationRepositoryClient.get_client().admin.command("hello").get("setName"):
+            self.skipTest("Change streams need MongoDB running as a replica set")
+
+        events = TaskService.stream_task_changes(
+            params=StreamTaskChangesParams(
+                account_id=self.account.id, heartbeat_seconds=1, max_connections=1, queue_size=10
+            )
+        )
+        # Waiting for one heartbeat gives the watcher thread time to open the change stream
+        while next(events) is not None:
+            pass
+
+        task = self.create_test_task(account_id=self.account.id)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=task.id))
+
+        received_events = []
+        while len(received_events) < 2:
+            event = next(events)
+            if event is not None:
+                received_events.append(event)
+        events.close()
+
+        assert [(event.type, event.task_id) for event in received_events] == [
+            (TaskChangeEventType.CREATED, task.id),
+            (TaskChangeEventType.DELETED, task.id),
+        ]
+
+    def test_stream_task_changes_rejects_standalone_servers(self) -> None:
+        if ApplicationRepositoryClient.get_client().admin.command("hello").get("setName"):
+            self.skipTest("Only a standalone MongoDB server lacks change streams")
+
+        with self.assertRaises(TaskEventsUnsupportedError):
+            TaskService.stream_task_changes(
+                params=StreamTaskChangesParams(
+                    account_id=self.account.id, heartbeat_seconds=1, max_connections=1, queue_size=10
+                )
+            )
+
     def test_task_isolation_between_accounts(self) -> None:
         other_account = self.create_test_account(username="otheruser@example.com")
 